@@ -0,0 +1,137 @@
+# asset_variants.py
+# Búsqueda de imágenes sin tocar el disco en cada pantalla.
+# Antes cada find_by_stem() hacía exists() por extensión, luego glob(), y si
+# la versión en inglés ('...us') no existía, otro glob con el nombre español.
+# Aquí cada carpeta se lista UNA vez (índice nombre -> archivo) y al arrancar
+# se arma la tabla (clave, idioma) -> archivo para todas las imágenes de
+# config.TRADUCCIONES. Las pantallas sólo consultan diccionarios.
+#
+#   python asset_variants.py     -> informe de variantes que faltan en disco
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Optional
+import config
+
+EXTS = (".png", ".jpg", ".jpeg")   # mismo orden de preferencia que find_by_stem
+BASE_LANG = "es"
+
+# carpeta -> {stem: {ext: Path}}. Nombres en os.path.normcase: en Windows el
+# glob/exists de antes no distinguía mayúsculas y el índice tampoco debe.
+_index: dict[Path, dict[str, dict[str, Path]]] = {}
+# carpeta -> subcarpetas (mismo listado)
+_subdirs: dict[Path, list[Path]] = {}
+# (carpeta, stem) -> Path | None   (búsqueda literal, como find_by_stem)
+_found: dict[tuple[Path, str], Optional[Path]] = {}
+# (carpeta, clave, idioma) -> Path | None   (imágenes traducidas)
+_variants: dict[tuple[Path, str, str], Optional[Path]] = {}
+
+
+def _folder_index(folder: Path) -> dict[str, dict[str, Path]]:
+    idx = _index.get(folder)
+    if idx is None:
+        idx, subs = {}, []
+        try:
+            with os.scandir(folder) as it:
+                for e in it:
+                    if e.is_dir():
+                        subs.append(folder / e.name)
+                        continue
+                    name = os.path.normcase(e.name)
+                    for ext in EXTS:
+                        if name.endswith(ext) and e.is_file():
+                            idx.setdefault(name[:-len(ext)], {})[ext] = folder / e.name
+                            break
+        except OSError:
+            pass
+        _index[folder] = idx
+        _subdirs[folder] = sorted(subs)
+    return idx
+
+
+def subfolders(folder: Path) -> list[Path]:
+    folder = Path(folder)
+    _folder_index(folder)
+    return _subdirs[folder]
+
+
+def find(folder: Path, stem: str) -> Optional[Path]:
+    """Igual que find_by_stem (nombre exacto; si no, el más corto que empiece
+    por `stem`), pero contra el índice de la carpeta."""
+    folder = Path(folder)
+    key = (folder, stem)
+    if key in _found:
+        return _found[key]
+    idx = _folder_index(folder)
+    norm = os.path.normcase(stem)
+    p = None
+    exact = idx.get(norm)
+    if exact:
+        p = next(exact[ext] for ext in EXTS if ext in exact)
+    else:
+        cands = [path for s, by_ext in idx.items() if s.startswith(norm) for path in by_ext.values()]
+        if cands:
+            p = min(cands, key=lambda c: (len(c.name), c.name))
+    _found[key] = p
+    return p
+
+
+def image_keys() -> list[str]:
+    """Claves de TRADUCCIONES que son imágenes (las de texto empiezan por 'txt_')."""
+    return [k for k in config.TRADUCCIONES[BASE_LANG] if not k.startswith("txt_")]
+
+
+def _variant_stem(key: str, lang: str) -> str:
+    tabla = config.TRADUCCIONES.get(lang, {})
+    if key in tabla:
+        return tabla[key]
+    # Clave dinámica (p. ej. f"elige_dificultad_nivel{n}"): misma regla que obtener_nombre
+    return key + "us" if lang == "us" and not key.endswith("us") else key
+
+
+def localized(folder: Path, key: str, lang: Optional[str] = None) -> Optional[Path]:
+    """Archivo de `key` en `lang` (idioma actual por defecto); si esa variante
+    no existe, el de la versión base y por último el stem tal cual."""
+    folder = Path(folder)
+    lang = lang or config.IDIOMA_ACTUAL
+    k = (folder, key, lang)
+    if k in _variants:
+        return _variants[k]
+    p = find(folder, _variant_stem(key, lang))
+    if p is None:
+        p = find(folder, _variant_stem(key, BASE_LANG)) or find(folder, key)
+    _variants[k] = p
+    return p
+
+
+def build(assets_dir: Path) -> None:
+    """Resuelve al arrancar todas las imágenes traducibles en todos los idiomas."""
+    for lang in config.TRADUCCIONES:
+        for key in image_keys():
+            localized(assets_dir, key, lang)
+
+
+def report(assets_dir: Path) -> list[str]:
+    """Una línea por variante que no está en disco (y qué se usa en su lugar)."""
+    assets_dir = Path(assets_dir)
+    build(assets_dir)
+    out: list[str] = []
+    for key in image_keys():
+        for lang in config.TRADUCCIONES:
+            want = _variant_stem(key, lang)
+            got = localized(assets_dir, key, lang)
+            if find(assets_dir, want) is not None:
+                continue
+            if got is None:
+                out.append(f"[{lang}] {key}: no existe '{want}' ni versión base")
+            else:
+                out.append(f"[{lang}] {key}: falta '{want}', se usa {got.name}")
+    return out
+
+
+if __name__ == "__main__":
+    assets = Path(__file__).resolve().parent / "assets"
+    lines = report(assets)
+    for line in lines:
+        print(line)
+    print(f"{len(image_keys())} imágenes x {len(config.TRADUCCIONES)} idiomas, {len(lines)} variantes faltantes")
@@ -0,0 +1,128 @@
+# audio_latency.py
+# Mide cuánto tarda un clic en sonar con cada perfil de audio.
+#
+#   python audio_latency.py                      -> perfil de settings.json, pulsa teclas (ESC sale)
+#   python audio_latency.py --profile balanced   -> otro perfil
+#   python audio_latency.py --auto 40            -> 40 pulsaciones sintéticas, sin teclado
+#
+# Por cada pulsación se marcan tres tiempos:
+#   tecla    -> cuando el bucle (a 60 FPS, como el juego) recibe el KEYDOWN;
+#               con --auto, el instante real en que se envía (incluye la espera del frame)
+#   disparo  -> cuando play_sfx() entrega el SFX al mixer
+#   callback -> el primer callback del mixer que lo mezcla. pygame no expone el
+#               callback, así que junto al clic se lanza una sonda de pocas
+#               muestras: el canal queda libre justo en el callback que la consume.
+# Latencia = tecla->callback + un buffer (lo que tarda en salir lo ya mezclado).
+# La latencia propia del driver/dispositivo no es visible desde aquí.
+from __future__ import annotations
+import argparse
+import random
+import statistics
+import threading
+import time
+from pathlib import Path
+
+import pygame
+
+import audio_shared
+from audio_shared import AUDIO_PROFILES, apply_audio_profile, audio_buffer_ms, play_sfx, preload_sfx
+
+ASSETS = Path(__file__).resolve().parent / "assets"
+PROBE_FRAMES = 16
+
+
+def _probe_sound() -> pygame.mixer.Sound:
+    freq, size, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=bytes(PROBE_FRAMES * channels * (abs(size) // 8)))
+
+
+def _wait_callback(ch: pygame.mixer.Channel, timeout: float = 0.5) -> float:
+    t_end = time.perf_counter() + timeout
+    while ch.get_busy() and time.perf_counter() < t_end:
+        pass
+    return time.perf_counter()
+
+
+def callback_period(probe: pygame.mixer.Sound, n: int = 30) -> float:
+    """ms entre callbacks del mixer (sondas encadenadas)."""
+    stamps = []
+    for _ in range(n):
+        ch = probe.play()
+        if ch is None:
+            break
+        stamps.append(_wait_callback(ch))
+    gaps = [(b - a) * 1000 for a, b in zip(stamps, stamps[1:])]
+    return statistics.median(gaps) if gaps else 0.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Latencia tecla -> sonido")
+    ap.add_argument("--profile", choices=sorted(AUDIO_PROFILES))
+    ap.add_argument("--auto", type=int, default=0, help="pulsaciones sintéticas")
+    args = ap.parse_args()
+
+    name = apply_audio_profile(ASSETS, args.profile)
+    pygame.init()
+    screen = pygame.display.set_mode((480, 200))
+    pygame.display.set_caption(f"Latencia de audio – {name}")
+    font = pygame.font.Font(None, 26)
+    clock = pygame.time.Clock()
+    preload_sfx(ASSETS).join()
+    probe = _probe_sound()
+
+    period = callback_period(probe)
+    print(f"Perfil {name}: buffer {audio_buffer_ms():.1f} ms, callback cada {period:.1f} ms (medido)")
+
+    rows: list[tuple[float, float, float]] = []
+    pending_key: list[float] = []
+
+    def _auto_keys():
+        # Las "teclas" llegan en un momento cualquiera del frame, como las reales
+        for _ in range(args.auto):
+            time.sleep(random.uniform(0.08, 0.2))
+            pending_key.append(time.perf_counter())
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+    if args.auto:
+        threading.Thread(target=_auto_keys, daemon=True).start()
+    running = True
+    while running:
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT or (e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE):
+                running = False
+            elif e.type == pygame.KEYDOWN:
+                t_key = pending_key.pop(0) if pending_key else time.perf_counter()
+                play_sfx("select", ASSETS)
+                t_fire = time.perf_counter()
+                ch = probe.play()
+                if ch is not None:
+                    t_cb = _wait_callback(ch)
+                    rows.append(((t_fire - t_key) * 1000, (t_cb - t_key) * 1000, audio_buffer_ms()))
+        if args.auto and len(rows) >= args.auto:
+            running = False
+
+        screen.fill((20, 24, 28))
+        lines = [f"Perfil: {name}  (buffer {audio_buffer_ms():.1f} ms)",
+                 "Pulsa cualquier tecla; ESC para salir"]
+        if rows:
+            fire, cb, buf = rows[-1]
+            lines.append(f"último: disparo {fire:.1f} ms, mixer {cb:.1f} ms, total ~{cb + buf:.1f} ms")
+        for i, line in enumerate(lines):
+            screen.blit(font.render(line, True, (230, 230, 230)), (16, 20 + i * 30))
+        pygame.display.flip()
+        clock.tick(60)
+
+    if rows:
+        fire = [r[0] for r in rows]
+        total = [r[1] + r[2] for r in rows]
+        print(f"{len(rows)} pulsaciones | tecla->disparo media {statistics.fmean(fire):.1f} ms "
+              f"(máx {max(fire):.1f}) | tecla->sonido media {statistics.fmean(total):.1f} ms, "
+              f"p95 {sorted(total)[int(len(total) * 0.95) - 1]:.1f}, máx {max(total):.1f}")
+        st = audio_shared.voice_stats().get("ui", {})
+        if st.get("descartes"):
+            print(f"⚠️ {st['descartes']} clics descartados por falta de voces")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
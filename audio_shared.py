@@ -1,94 +1,156 @@
 from __future__ import annotations
-import pygame, os
+import pygame, os, threading
 from pathlib import Path
+from music_engine import MusicEngine
+from voice_manager import VoiceManager
+from settings import get_settings
+
+AUDIO_EXTS = (".ogg", ".wav", ".mp3")
+
+# ---------- índice de audio (un solo listado de msuiquita) ----------
+# nombre en minúsculas (sin extensión) -> {extensión: ruta}
+_audio_index: dict[str, dict[str, Path]] = {}
+_audio_index_dir: Path | None = None
+
+def _index_audio(assets_dir: Path) -> dict[str, dict[str, Path]]:
+    global _audio_index, _audio_index_dir
+    audio_dir = assets_dir / "msuiquita"
+    if _audio_index_dir != audio_dir:
+        index: dict[str, dict[str, Path]] = {}
+        if audio_dir.exists():
+            for p in sorted(audio_dir.iterdir()):
+                ext = p.suffix.lower()
+                if ext in AUDIO_EXTS:
+                    index.setdefault(p.stem.lower(), {}).setdefault(ext, p)
+        _audio_index, _audio_index_dir = index, audio_dir
+    return _audio_index
 
 # ---------- util rutas ----------
 def _find_audio(assets_dir: Path, stems: list[str]) -> Path | None:
-    audio_dir = assets_dir / "msuiquita"
-    if not audio_dir.exists():
-        return None
+    index = _index_audio(assets_dir)
     for stem in stems:
-        for ext in (".ogg", ".wav", ".mp3"):
+        stem = stem.lower()
+        for ext in AUDIO_EXTS:
             # match exact y con sufijos
-            for p in list(audio_dir.glob(f"{stem}{ext}")) + list(audio_dir.glob(f"{stem}*{ext}")):
-                return p
+            exact = index.get(stem, {}).get(ext)
+            if exact is not None:
+                return exact
+            for name, by_ext in index.items():
+                if name.startswith(stem) and ext in by_ext:
+                    return by_ext[ext]
     return None
 
-# ---------- persistencia volumen maestro (0..1) ----------
-def _vol_path(assets_dir: Path) -> Path:
-    # ya usabas esto desde opciones.py
-    return assets_dir.parent / "volume.txt"
+# ---------- volumen maestro (0..1), desde settings.json ----------
+_volume_bound = False
+
+def _prefs(assets_dir: Path):
+    """Servicio de ajustes; la primera vez engancha el volumen al mixer."""
+    global _volume_bound
+    prefs = get_settings(assets_dir)
+    if not _volume_bound:
+        _volume_bound = True
+        prefs.subscribe("volume", lambda v: _apply_master_volume(assets_dir, v))
+    return prefs
 
 def load_master_volume(assets_dir: Path) -> float:
-    try:
-        p = _vol_path(assets_dir)
-        if p.exists():
-            v = float(p.read_text(encoding="utf-8").strip())
-            return max(0.0, min(1.0, v))
-    except Exception:
-        pass
-    return 0.7
+    return _prefs(assets_dir).get("volume", 0.7)
 
 def save_master_volume(assets_dir: Path, v: float) -> None:
-    try:
-        _vol_path(assets_dir).write_text(str(max(0.0, min(1.0, float(v)))), encoding="utf-8")
-    except Exception:
-        pass
+    """Cambia el volumen maestro. Sólo un cambio real llega al mixer; el disco
+    se escribe después, una vez, cuando el valor deja de moverse."""
+    _prefs(assets_dir).set("volume", v)
+
+def _apply_master_volume(assets_dir: Path, v: float) -> None:
+    set_music_volume_now(assets_dir, v)
+    set_sfx_volume_now(assets_dir, v)
 
 # ---------- mixer ----------
+# Canales: [música][ui][juego][ambiente] reservados + FREE_CHANNELS libres
+# para cualquier Sound.play() suelto.
+FREE_CHANNELS = 4
+_voices = VoiceManager({
+    "ui":      (4, 1.0),
+    "game":    (12, 1.0),
+    "ambient": (4, 1.0),
+})
+
+# ---------- perfiles de audio ----------
+# buffer = muestras por callback del mixer: 256 a 44.1 kHz son ~5.8 ms entre
+# que se dispara un SFX y que el mixer lo mezcla; 2048 son ~46 ms pero menos
+# despertares de CPU. Se eligen en settings.json ("audio_profile").
+AUDIO_PROFILES = {
+    "low_latency":  {"frequency": 44100, "size": -16, "channels": 2, "buffer": 256},
+    "balanced":     {"frequency": 44100, "size": -16, "channels": 2, "buffer": 512},
+    "power_saving": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 2048},
+}
+DEFAULT_AUDIO_PROFILE = "low_latency"
+_audio_profile = DEFAULT_AUDIO_PROFILE
+
+def apply_audio_profile(assets_dir: Path, name: str | None = None) -> str:
+    """Fija el perfil del mixer. Llamar ANTES de pygame.init(): si el mixer ya
+    arrancó (y aún no hay sonidos cargados) se reinicia con el perfil."""
+    global _audio_profile
+    if name is None:
+        name = get_settings(assets_dir).get("audio_profile", DEFAULT_AUDIO_PROFILE)
+    if name not in AUDIO_PROFILES:
+        print(f"ADVERTENCIA: perfil de audio '{name}' desconocido, usando {DEFAULT_AUDIO_PROFILE}")
+        name = DEFAULT_AUDIO_PROFILE
+    _audio_profile = name
+    pygame.mixer.pre_init(**AUDIO_PROFILES[name])
+    if pygame.mixer.get_init() and not _voices.bound and not _sfx_cache:
+        pygame.mixer.quit()
+        pygame.mixer.init()
+    return name
+
+def audio_buffer_ms() -> float:
+    """Duración de un buffer del mixer con el perfil activo."""
+    p = AUDIO_PROFILES[_audio_profile]
+    return 1000.0 * p["buffer"] / p["frequency"]
+
 def _ensure_mixer():
     if not pygame.mixer.get_init():
-        pygame.mixer.pre_init(44100, -16, 2, 256)
+        pygame.mixer.pre_init(**AUDIO_PROFILES[_audio_profile])
         pygame.mixer.init()
-        pygame.mixer.set_num_channels(24)
+    if not _voices.bound:
+        reserved = _music.channel_count + _voices.channel_count
+        pygame.mixer.set_num_channels(reserved + FREE_CHANNELS)
+        pygame.mixer.set_reserved(reserved)
+        _voices.first_channel = _music.channel_count
+        _voices.bind()
 
-# ---------- Música de menú ----------
-_menu_loaded_src: str | None = None
-_menu_music_path: Path | None = None # Cache para el path de la música de menú
+# ---------- Música (menú / nivel / suspenso) ----------
+# Las tres pistas viven pre-decodificadas en canales propios del MusicEngine;
+# cambiar de una a otra es un crossfade, sin load() ni hueco. El menú se
+# pausa al salir y al volver sigue donde iba.
+_music = MusicEngine()
+_music.add_track("menu", ["musica inicio", "musica_menu", "menu_music", "bg_menu", "fondo_menu", "musica_inicio"],
+                 resume=True)
+_music.add_track("level", ["frantic_gameplay_v001", "frantic", "level_music"])
+_music.add_track("suspense", ["a2", "suspense", "timer_low"])
 
-def start_menu_music(assets_dir: Path) -> None:
-    """Inicia música de menú en loop respetando volumen maestro."""
-    global _menu_loaded_src, _menu_music_path
+def preload_music(assets_dir: Path) -> None:
+    """Arranca el motor de música: decodifica las pistas en segundo plano."""
     try:
         _ensure_mixer()
-        vol = load_master_volume(assets_dir)
-        pygame.mixer.music.set_volume(vol)
-
-        # Carga el path de la música de menú si aún no se ha cargado
-        if _menu_music_path is None:
-            cand = _find_audio(assets_dir, [
-                "musica inicio", # <--- ¡AÑADIDO!
-                "musica_menu", "menu_music", "bg_menu", "fondo_menu", "musica_inicio"
-            ])
-            if cand is None:
-                print(f"ADVERTENCIA: No se encontró el archivo de música de menú (ej. 'musica inicio.mp3') en {assets_dir / 'msuiquita'}")
-                return
-            _menu_music_path = cand
-        
-        # === CAMBIO: Lógica de reproducción forzada ===
-        # Si la música cargada no es la de menú, cárgala y reprodúcela
-        if _menu_loaded_src != str(_menu_music_path):
-            pygame.mixer.music.load(str(_menu_music_path))
-            _menu_loaded_src = str(_menu_music_path)
-            pygame.mixer.music.play(-1, fade_ms=300) # Forzar reproducción
-        
-        # Si es la música correcta pero no está sonando, reprodúcela
-        elif not pygame.mixer.music.get_busy():
-            pygame.mixer.music.play(-1, fade_ms=300)
-
-        # Limpia los 'trackers' de música de nivel
-        global _level_music_loaded_src, _suspense_music_loaded_src
-        _level_music_loaded_src = None
-        _suspense_music_loaded_src = None
-    except Exception:
-        pass
+        _music.start(assets_dir, _find_audio, first_channel=0)
+        _music.set_volume(load_master_volume(assets_dir))
+    except Exception as e:
+        print(f"Error al iniciar el motor de música: {e}")
+
+def _play_music(assets_dir: Path, name: str, fade_ms: int, restart: bool = False) -> None:
+    try:
+        preload_music(assets_dir)   # no-op si ya está en marcha
+        _music.play(name, fade_ms=fade_ms, restart=restart)
+    except Exception as e:
+        print(f"Error al iniciar música '{name}': {e}")
+
+def start_menu_music(assets_dir: Path) -> None:
+    """Música de menú en loop; si ya sonó antes, continúa donde iba."""
+    _play_music(assets_dir, "menu", fade_ms=300)
 
 
 def ensure_menu_music_running(assets_dir: Path) -> None:
     """Asegura que la música de menú esté sonando (llamado al volver de un nivel)."""
-    # === CAMBIO: Esta función ahora llama a start_menu_music ===
-    # start_menu_music es lo suficientemente inteligente como para saber si debe
-    # forzar la carga (si viene de un nivel) o simplemente reanudar.
     start_menu_music(assets_dir)
 
 def set_music_volume_now(assets_dir: Path, v: float) -> None:
@@ -97,94 +159,46 @@ def set_music_volume_now(assets_dir: Path, v: float) -> None:
         _ensure_mixer()
         v = max(0.0, min(1.0, float(v)))
         pygame.mixer.music.set_volume(v)
+        _music.set_volume(v)
     except Exception:
         pass
 
 # ================================================================
-# === FUNCIONES DE MÚSICA PARA NIVELES (SIN CAMBIOS) ===
+# === FUNCIONES DE MÚSICA PARA NIVELES ===
 # (Buscando 'frantic_gameplay_v001' y 'a2')
 # ================================================================
 
-_level_music_loaded_src: str | None = None
-_suspense_music_loaded_src: str | None = None
-
 def start_level_music(assets_dir: Path) -> None:
-    """Carga y reproduce la música de gameplay 'frantic'."""
-    try:
-        _ensure_mixer()
-        vol = load_master_volume(assets_dir)
-        pygame.mixer.music.set_volume(vol)
-        
-        global _level_music_loaded_src
-        # Busca 'frantic_gameplay_v001.ogg' o similares
-        cand = _find_audio(assets_dir, ["frantic_gameplay_v001", "frantic", "level_music"])
-        if cand is None:
-            print(f"ADVERTENCIA: No se encontró 'frantic_gameplay_v001.ogg' en {assets_dir / 'msuiquita'}")
-            return
-        
-        # Solo carga si es una canción diferente a la actual
-        global _menu_loaded_src
-        if _level_music_loaded_src != str(cand):
-            pygame.mixer.music.load(str(cand))
-            _level_music_loaded_src = str(cand)
-            _menu_loaded_src = str(cand) # Marcar como cargada
-        
-        # Resetea la música de suspenso
-        global _suspense_music_loaded_src
-        _suspense_music_loaded_src = None 
-        
-        pygame.mixer.music.play(-1, fade_ms=500)
-    except Exception as e:
-        print(f"Error al iniciar música de nivel: {e}")
+    """Crossfade a la música de gameplay 'frantic' (desde el inicio)."""
+    _play_music(assets_dir, "level", fade_ms=500, restart=True)
 
 def start_suspense_music(assets_dir: Path) -> None:
-    """Carga y reproduce la música de suspenso 'a2'."""
-    try:
-        _ensure_mixer()
-        vol = load_master_volume(assets_dir)
-        pygame.mixer.music.set_volume(vol)
-        
-        global _suspense_music_loaded_src
-        # Busca 'a2.mp3' o similares
-        cand = _find_audio(assets_dir, ["a2", "suspense", "timer_low"])
-        if cand is None:
-            print(f"ADVERTENCIA: No se encontró 'a2.mp3' en {assets_dir / 'msuiquita'}")
-            return
-        
-        # Solo carga si es una canción diferente
-        global _menu_loaded_src
-        if _suspense_music_loaded_src != str(cand):
-            pygame.mixer.music.load(str(cand))
-            _suspense_music_loaded_src = str(cand)
-            _menu_loaded_src = str(cand) # Marcar como cargada
-        
-        # Resetea la música de nivel
-        global _level_music_loaded_src
-        _level_music_loaded_src = None 
-
-        pygame.mixer.music.play(-1, fade_ms=500)
-    except Exception as e:
-        print(f"Error al iniciar música de suspenso: {e}")
+    """Crossfade a la música de suspenso 'a2' (desde el inicio)."""
+    _play_music(assets_dir, "suspense", fade_ms=500, restart=True)
 
-def stop_level_music() -> None:
-    """Detiene la música del nivel (usado al salir al menú)."""
+def stop_music(fade_ms: int = 500) -> None:
+    """Baja toda la música (la del menú queda en pausa, no se pierde la posición)."""
     try:
-        if pygame.mixer.get_init():
-            # Mantenemos el fadeout, la nueva lógica de start_menu_music lo anulará
-            pygame.mixer.music.fadeout(500)
-        global _level_music_loaded_src, _suspense_music_loaded_src
-        _level_music_loaded_src = None
-        _suspense_music_loaded_src = None
+        _music.stop(fade_ms)
     except Exception:
         pass
 
+def stop_level_music() -> None:
+    """Detiene la música del nivel (usado al salir al menú)."""
+    stop_music(500)
+
 # ================================================================
 # === FIN DE LAS FUNCIONES AÑADIDAS ===
 # ================================================================
 
 
 # ---------- Banco SFX ----------
+# Todos los SFX se decodifican una vez (preload_sfx, en un hilo al arrancar);
+# después play_sfx es sólo una búsqueda en el dict.
 _sfx_cache: dict[str, pygame.mixer.Sound] = {}
+_sfx_by_path: dict[Path, pygame.mixer.Sound] = {}   # varias claves, un solo decode
+_sfx_missing: set[str] = set()          # claves sin archivo (avisadas una vez)
+_sfx_lock = threading.Lock()
 _sfx_volume: float = -1.0  # -1.0 significa que debe leerse desde load_master_volume
 
 # keys → posibles nombres de archivo
@@ -193,6 +207,20 @@ _SFX_STEMS = {
     "select": ["musica_botoncitos", "click", "boton", "btn_select", "select"],
     "easy":   ["modo_facil", "btn_facil", "facil"],
     "hard":   ["modo_dificil", "btn_dificil", "dificil"],
+    # SFX de los niveles
+    "sfx_click":     ["sfx_click", "musica_botoncitos", "click", "boton"],
+    "sfx_pause":     ["sfx_pause", "pausa", "pause"],
+    "sfx_pick_seed": ["sfx_pick_seed", "pick_seed", "recoger", "semilla"],
+    "sfx_plant":     ["sfx_plant", "plantar", "plant"],
+    "sfx_grow":      ["sfx_grow", "crecer", "grow"],
+}
+
+# key → (categoría, prioridad). Lo no listado va a "game" con prioridad 1.
+_SFX_VOICE = {
+    "back": ("ui", 2), "select": ("ui", 2), "easy": ("ui", 2), "hard": ("ui", 2),
+    "sfx_click": ("ui", 2), "sfx_pause": ("ui", 3),
+    "sfx_pick_seed": ("game", 2), "sfx_plant": ("game", 2),
+    "sfx_grow": ("game", 1),
 }
 
 def _get_sfx_volume(assets_dir: Path) -> float:
@@ -204,20 +232,44 @@ def _get_sfx_volume(assets_dir: Path) -> float:
     return _sfx_volume
 
 def _load_sfx_key(key: str, assets_dir: Path) -> pygame.mixer.Sound | None:
-    if key in _sfx_cache:
-        return _sfx_cache[key]
-    stems = _SFX_STEMS.get(key, [])
-    p = _find_audio(assets_dir, stems)
-    if p is None:
-        return None
-    try:
-        _ensure_mixer()
-        snd = pygame.mixer.Sound(str(p))
-        snd.set_volume(_get_sfx_volume(assets_dir))
-        _sfx_cache[key] = snd
+    snd = _sfx_cache.get(key)
+    if snd is not None or key in _sfx_missing:
         return snd
+    with _sfx_lock:   # el hilo de precarga puede estar con esta misma clave
+        if key in _sfx_cache or key in _sfx_missing:
+            return _sfx_cache.get(key)
+        p = _find_audio(assets_dir, _SFX_STEMS.get(key, [key]))
+        if p is None:
+            _sfx_missing.add(key)
+            print(f"ADVERTENCIA: SFX '{key}' sin archivo en {assets_dir / 'msuiquita'}")
+            return None
+        try:
+            snd = _sfx_by_path.get(p)
+            if snd is None:
+                _ensure_mixer()
+                snd = pygame.mixer.Sound(str(p))
+                snd.set_volume(_get_sfx_volume(assets_dir))
+                _sfx_by_path[p] = snd
+            _sfx_cache[key] = snd
+            return snd
+        except Exception as e:
+            _sfx_missing.add(key)
+            print(f"ADVERTENCIA: No se pudo cargar el SFX '{key}' ({p.name}): {e}")
+            return None
+
+def preload_sfx(assets_dir: Path) -> threading.Thread | None:
+    """Indexa msuiquita y decodifica todos los SFX en segundo plano."""
+    try:
+        _ensure_mixer()   # el mixer se inicia en el hilo principal
     except Exception:
         return None
+    _index_audio(assets_dir)
+    def _work():
+        for key in _SFX_STEMS:
+            _load_sfx_key(key, assets_dir)
+    th = threading.Thread(target=_work, name="sfx-preload", daemon=True)
+    th.start()
+    return th
 
 def set_sfx_volume_now(assets_dir: Path, v: float) -> None:
     """Ajusta el volumen de todos los SFX cacheados y sincroniza con maestro."""
@@ -225,23 +277,41 @@ def set_sfx_volume_now(assets_dir: Path, v: float) -> None:
         global _sfx_volume
         _sfx_volume = max(0.0, min(1.0, float(v)))
         # aplica a los ya cargados
-        for snd in _sfx_cache.values():
+        for snd in list(_sfx_cache.values()):
             try: snd.set_volume(_sfx_volume)
             except Exception: pass
     except Exception:
         pass
 
-def play_sfx(key: str, assets_dir: Path) -> None:
-    """Reproduce un SFX mapeado ('back'|'select'|'easy'|'hard')."""
+def play_sfx(key: str, assets_dir: Path, volume: float | None = None,
+             category: str | None = None, priority: int | None = None) -> None:
+    """Reproduce un SFX del banco ('back'|'select'|'easy'|'hard'|'sfx_*').
+    `volume` (0..1) escala este disparo sin tocar el volumen del banco.
+    Suena en el grupo de canales de su categoría (_SFX_VOICE); si está lleno
+    se reemplaza la voz más vieja de igual o menor prioridad."""
     try:
         snd = _load_sfx_key(key, assets_dir)
         if snd:
-            snd.set_volume(_get_sfx_volume(assets_dir))  # Asegura el volumen actual
-            snd.play()
+            _ensure_mixer()
+            cat, prio = _SFX_VOICE.get(key, ("game", 1))
+            _voices.play(snd, category or cat, prio if priority is None else priority,
+                         1.0 if volume is None else max(0.0, min(1.0, float(volume))))
     except Exception:
         pass
 
+def set_category_volume(category: str, v: float) -> None:
+    """Volumen de una categoría de SFX ('ui'|'game'|'ambient')."""
+    try:
+        _ensure_mixer()
+        _voices.set_category_volume(category, v)
+    except Exception:
+        pass
+
+def voice_stats() -> dict[str, dict[str, float]]:
+    """Voces en uso, robos por segundo y descartes por categoría."""
+    return _voices.stats() if _voices.bound else {}
+
 # Compat con tu código existente
 def play_click(assets_dir: Path) -> None:
     """Alias legacy: usar el SFX 'select'."""
-    play_sfx("select", assets_dir)
\ No newline at end of file
+    play_sfx("select", assets_dir)
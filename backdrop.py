@@ -0,0 +1,143 @@
+# backdrop.py
+# Fondo con scroll infinito compartido por todos los menús.
+# Cada menú cargaba y escalaba su propia copia de Background_f y repetía el
+# mismo scroll (dos blits por frame) con su propio scroll_x, así que al pasar
+# del menú principal a "Jugar" el fondo saltaba a 0. Aquí hay UNA copia
+# escalada y UNA fase para todo el juego: el fondo sigue donde iba.
+#
+# Modos de dibujo:
+#   completo -> el fondo entero en cada frame (dos blits recortados).
+#   tiras    -> la pantalla conserva el frame anterior: se restauran sólo los
+#               rects que la UI tapó (cover()), se desplaza la pantalla en su
+#               sitio (Surface.scroll) y se pinta la franja nueva de STEP px.
+#               Sólo para pantallas que reportan lo que dibujan encima.
+#
+#   python backdrop.py      -> costo por frame de cada modo
+from __future__ import annotations
+import time
+from pathlib import Path
+from typing import Optional
+import pygame
+import asset_variants
+import display
+from quality import governor
+
+STEP = 2               # px por frame (lo que usaban todos los menús)
+STEMS = ("Background_f", "Background_fondo", "fondo", "bg_inicio")
+STALE_AFTER = 0.5      # s sin dibujar = otra pantalla usó la ventana: repintar completo
+
+
+class Backdrop:
+    """Fondo de los menús.
+
+    - load(assets_dir, size, image=None): la copia escalada (se crea una sola
+      vez; `image` = el fondo ya cargado, si se tiene).
+    - draw(screen, strips=False): dibuja y avanza la fase. Devuelve los rects
+      de pantalla que cambiaron (para display.update si se quiere).
+    - cover(rect): en modo tiras, rect que la UI pintó sobre el fondo.
+    """
+
+    def __init__(self):
+        self.surface: Optional[pygame.Surface] = None
+        self.size: Optional[tuple[int, int]] = None     # pantalla para la que se escaló
+        self.phase = 0.0                 # px desplazados, en [0, ancho)
+        self._target: Optional[pygame.Surface] = None   # pantalla con el fondo vigente (tiras)
+        self._covered: list[pygame.Rect] = []
+        self._painted_phase = -1
+        self._last_draw = 0.0
+
+    def load(self, assets_dir: Path, size: tuple[int, int],
+             image: Optional[pygame.Surface] = None) -> pygame.Surface:
+        if self.surface is not None and self.size == tuple(size):
+            return self.surface
+        if image is None:
+            path = next((p for p in (asset_variants.find(assets_dir, s) for s in STEMS) if p), None)
+            if path is None:
+                raise FileNotFoundError("Fondo 'Background_f*' no encontrado.")
+            image = pygame.image.load(str(path))
+        # Sin deformar (el arte es 3:2): cubre la pantalla y sólo se recorta en
+        # alto, para que la tira siga uniéndose al hacer scroll
+        self.surface = display.cover(image.convert(), size, keep_width=True)
+        self.size = tuple(size)
+        self.phase %= self.surface.get_width()
+        self.invalidate()
+        return self.surface
+
+    def invalidate(self) -> None:
+        """La pantalla ya no tiene el fondo del último frame."""
+        self._target = None
+        self._covered.clear()
+
+    def cover(self, rect: pygame.Rect) -> None:
+        if self._target is not None:
+            self._covered.append(pygame.Rect(rect))
+
+    def _paint(self, screen: pygame.Surface, x: int, area: Optional[pygame.Rect] = None) -> None:
+        """Fondo con desplazamiento x, sólo dentro de `area` (toda la pantalla si None)."""
+        bw = self.surface.get_width()
+        clip = screen.get_clip()
+        if area is not None:
+            screen.set_clip(area.clip(clip))
+        screen.blit(self.surface, (-x, 0))
+        screen.blit(self.surface, (bw - x, 0))
+        screen.set_clip(clip)
+
+    def draw(self, screen: pygame.Surface, strips: bool = False) -> list[pygame.Rect]:
+        bw = self.surface.get_width()
+        full = screen.get_rect()
+        now = time.perf_counter()
+        stale = now - self._last_draw > STALE_AFTER
+        self._last_draw = now
+        old_x = int(self.phase)
+        if governor.scroll:
+            self.phase = (self.phase + STEP) % bw
+        x = int(self.phase)
+
+        if not strips or stale or self._target is not screen or self._painted_phase != old_x:
+            self._paint(screen, x)
+            self._target = screen if strips else None
+            self._covered.clear()
+            self._painted_phase = x
+            return [full]
+
+        # Tiras: borrar la UI del frame anterior con el fondo de ese frame...
+        dirty = []
+        for r in self._covered:
+            self._paint(screen, old_x, r)
+            dirty.append(r)
+        self._covered.clear()
+        # ...desplazar en el sitio y pintar sólo la franja que entra
+        dx = (x - old_x) % bw
+        if dx:
+            screen.scroll(-dx, 0)
+            self._paint(screen, x, pygame.Rect(full.width - dx, 0, dx, full.height))
+            dirty = [full]
+        self._painted_phase = x
+        return dirty
+
+
+# Uno para todos los menús: misma copia escalada, misma fase
+backdrop = Backdrop()
+
+
+def _measure(frames: int = 600) -> None:
+    assets = Path(__file__).resolve().parent / "assets"
+    pygame.init()
+    screen = display.open_window(assets)
+    backdrop.load(assets, screen.get_size())
+    ui = [pygame.Rect(400, 80 + i * 150, 560, 120) for i in range(4)]
+    for strips in (False, True):
+        backdrop.invalidate()
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            backdrop.draw(screen, strips=strips)
+            for r in ui:
+                screen.fill((30, 120, 60), r)
+                backdrop.cover(r)
+        ms = (time.perf_counter() - t0) * 1000 / frames
+        print(f"{'tiras' if strips else 'completo':8s} {ms:.3f} ms/frame (4 botones de 560x120 encima)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    _measure()
@@ -0,0 +1,184 @@
+# collision.py
+# Mapa de colisión de un nivel (bancas, edificios, postes, el bote...).
+# Antes el jugador sólo se limitaba al rect de la pantalla y caminaba encima
+# de todo. Los obstáculos (rects de sacar_coordenadas, la máscara que dibuje
+# el artista o la silueta de un sprite) se hornean UNA vez al cargar en un
+# pygame.mask.Mask del tamaño de la pantalla; por frame, mover al jugador son
+# un par de Mask.overlap() en C, sin importar cuántos obstáculos haya.
+#
+#   python collision.py    -> costo por frame: lista de rects vs máscara
+from __future__ import annotations
+import re
+import pygame
+from typing import Iterable
+
+# Los pies del jugador: la parte del sprite que choca (fracciones del sprite)
+FEET_W = 0.5
+FEET_H = 0.12
+
+
+def feet_size(sprite_rect: pygame.Rect) -> tuple[int, int]:
+    """Tamaño fijo de los pies para un sprite (se calcula una vez: los cuadros varían de ancho)."""
+    return max(2, int(sprite_rect.width * FEET_W)), max(2, int(sprite_rect.height * FEET_H))
+
+
+class CollisionMap:
+    """Zonas bloqueadas horneadas en un Mask de `size`.
+
+    - add_rect / add_image / add_footprint: al cargar el nivel.
+    - blocked(rect): ¿el rect toca algo bloqueado?
+    - move(feet, dx, dy): cuánto se pueden mover los pies; ejes por separado
+      (x y luego y) para deslizarse por las paredes en diagonal.
+    - free_offset(feet): desplazamiento al lugar libre más cercano (spawn).
+    - runs(): la máscara como rects, para guardarla horneada (geometria.py).
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        self.size = (int(size[0]), int(size[1]))
+        self.mask = pygame.mask.Mask(self.size)
+        # Masks llenos por tamaño: la "sonda" de cada consulta
+        self._probes: dict[tuple[int, int], pygame.mask.Mask] = {}
+
+    # ---------- horneado ----------
+    def add_rect(self, rect) -> None:
+        r = pygame.Rect(rect).clip(self.mask.get_rect())
+        if r.w and r.h:
+            self.mask.draw(pygame.mask.Mask(r.size, fill=True), r.topleft)
+
+    def add_rects(self, rects: Iterable) -> None:
+        for r in rects:
+            self.add_rect(r)
+
+    def add_image(self, surf: pygame.Surface) -> None:
+        """Máscara del artista (PNG con transparencia): lo opaco bloquea. Se escala a la pantalla."""
+        if surf.get_size() != self.size:
+            surf = pygame.transform.scale(surf, self.size)
+        self.mask.draw(pygame.mask.from_surface(surf), (0, 0))
+
+    def add_footprint(self, image: pygame.Surface, rect: pygame.Rect, alto: float = 0.3) -> None:
+        """Sólo la base opaca de un prop: se choca con el pie del bote, no con su dibujo."""
+        m = pygame.mask.from_surface(image)
+        b = image.get_bounding_rect()
+        corte = b.bottom - max(1, int(b.height * alto))
+        if corte > 0:
+            m.erase(pygame.mask.Mask((m.get_size()[0], corte), fill=True), (0, 0))
+        self.mask.draw(m, rect.topleft)
+
+    def runs(self) -> list[pygame.Rect]:
+        """La máscara como rects: tramos de cada fila, unidos hacia abajo mientras
+        se repitan. add_rects(runs()) reproduce la máscara exacta."""
+        w, h = self.size
+        # Un byte por pixel (canal R): 0 libre, 255 bloqueado
+        data = pygame.image.tobytes(self.mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0)), "RGB")[::3]
+        abiertos: dict[tuple[int, int], pygame.Rect] = {}
+        out: list[pygame.Rect] = []
+        for y in range(h):
+            fila = {m.span() for m in re.finditer(rb"[^\x00]+", data[y * w:(y + 1) * w])}
+            for tramo in list(abiertos):
+                if tramo not in fila:
+                    out.append(abiertos.pop(tramo))
+            for x0, x1 in fila:
+                r = abiertos.get((x0, x1))
+                if r is None:
+                    abiertos[(x0, x1)] = pygame.Rect(x0, y, x1 - x0, 1)
+                else:
+                    r.h += 1
+        out += abiertos.values()
+        out.sort(key=lambda r: (r.y, r.x))
+        return out
+
+    # ---------- consultas ----------
+    def _probe(self, w: int, h: int) -> pygame.mask.Mask:
+        m = self._probes.get((w, h))
+        if m is None:
+            m = self._probes[(w, h)] = pygame.mask.Mask((w, h), fill=True)
+        return m
+
+    def blocked(self, rect: pygame.Rect) -> bool:
+        return self.mask.overlap(self._probe(rect.w, rect.h), rect.topleft) is not None
+
+    def _sweep(self, feet: pygame.Rect, sx: int, sy: int, n: int) -> int:
+        """Pasos libres (0..n) en la dirección (sx, sy). Se prueba el rect barrido
+        completo, así un paso grande (dt alto) no atraviesa obstáculos delgados."""
+        if n <= 0 or not self.blocked(feet.union(feet.move(sx * n, sy * n))):
+            return n
+        # Barrido bloqueado: búsqueda binaria del último paso libre
+        lo, hi = 0, n
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self.blocked(feet.union(feet.move(sx * mid, sy * mid))):
+                hi = mid
+            else:
+                lo = mid
+        return lo
+
+    def move(self, feet: pygame.Rect, dx: int, dy: int) -> tuple[int, int]:
+        """Movimiento permitido (mx, my) para los pies `feet` que quieren moverse (dx, dy)."""
+        if self.blocked(feet):
+            # Ya encimados (spawn o clamp a la pantalla): libres hasta salir
+            return dx, dy
+        sx = (dx > 0) - (dx < 0)
+        mx = sx * self._sweep(feet, sx, 0, abs(dx))
+        sy = (dy > 0) - (dy < 0)
+        my = sy * self._sweep(feet.move(mx, 0), 0, sy, abs(dy))
+        return mx, my
+
+    def free_offset(self, feet: pygame.Rect, step: int = 8, max_dist: int = 480) -> tuple[int, int]:
+        """Desplazamiento al hueco libre más cercano (anillos de `step` px); (0, 0) si ya está libre."""
+        if not self.blocked(feet):
+            return 0, 0
+        for d in range(step, max_dist + 1, step):
+            ring = [(ox, oy) for ox in range(-d, d + 1, step) for oy in range(-d, d + 1, step)
+                    if max(abs(ox), abs(oy)) == d]
+            ring.sort(key=lambda o: (o[0] * o[0] + o[1] * o[1], o[1], o[0]))
+            for ox, oy in ring:
+                if not self.blocked(feet.move(ox, oy)):
+                    return ox, oy
+        return 0, 0
+
+
+def _measure(frames: int = 2000) -> None:
+    """Jugador caminando en una plaza con pilares y N obstáculos alrededor:
+    resolver contra cada rect vs. la máscara horneada."""
+    import random
+    import time
+    W, H = 1280, 720
+    plaza = pygame.Rect(340, 210, 600, 300)
+    pilares = [pygame.Rect(plaza.x + 60 + 120 * i, plaza.y + 60 + 90 * j, 24, 24) for i in range(5) for j in range(3)]
+    print(f"{'obstáculos':>10} | {'rects ms/frame':>14} | {'máscara ms/frame':>16} | {'hornear ms':>10}")
+    for n in (10, 100, 1000, 10000):
+        rng = random.Random(1)
+        rects = list(pilares)
+        while len(rects) < n + len(pilares):
+            r = pygame.Rect(rng.randrange(W), rng.randrange(H), rng.randint(8, 60), rng.randint(8, 40))
+            if not r.colliderect(plaza):
+                rects.append(r)
+        t0 = time.perf_counter()
+        cmap = CollisionMap((W, H))
+        cmap.add_rects(rects)
+        bake = (time.perf_counter() - t0) * 1000
+        # Caminata: cambia de dirección cada 30 frames (hasta 6 px por eje, ~360 px/s)
+        moves = []
+        while len(moves) < frames:
+            moves += [(rng.randint(-6, 6), rng.randint(-6, 6))] * 30
+
+        def by_rects(feet: pygame.Rect, dx: int, dy: int) -> tuple[int, int]:
+            # La alternativa sin hornear: probar cada rect, eje por eje
+            mx = dx if feet.move(dx, 0).collidelist(rects) == -1 else 0
+            my = dy if feet.move(mx, dy).collidelist(rects) == -1 else 0
+            return mx, my
+
+        ms = {}
+        for name, fn in (("rects", by_rects), ("mask", cmap.move)):
+            feet = pygame.Rect(plaza.x + 10, plaza.y + 10, 32, 12)
+            t0 = time.perf_counter()
+            for dx, dy in moves[:frames]:
+                mx, my = fn(feet, dx, dy)
+                feet.move_ip(mx, my)
+                feet.clamp_ip(plaza)
+            ms[name] = (time.perf_counter() - t0) * 1000 / frames
+        print(f"{n:10d} | {ms['rects']:14.4f} | {ms['mask']:16.4f} | {bake:10.1f}")
+
+
+if __name__ == "__main__":
+    _measure()
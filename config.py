@@ -1,5 +1,6 @@
 # config.py
 # Este archivo controla el idioma de todo el juego
+import sys
 import pygame
 from pathlib import Path
 
@@ -77,6 +78,13 @@ TRADUCCIONES = {
         "txt_plaza_hud_title": "Nivel 3 – La Plaza",
         "txt_dificil_tiempo": "(Difícil, con tiempo)",
         "txt_facil_tiempo": "(Fácil, con tiempo)",
+        "txt_infinito": "(Infinito)",
+        "txt_activas": "Activas:",
+        "txt_oleada": "Oleada",
+        "txt_en_vista": "en vista",
+        "txt_calidad": "calidad",
+        "txt_voces": "voces",
+        "txt_robos_s": "robos/s",
         
         # Textos específicos del Tutorial
         "txt_tutorial_msg1": "¡Basura recogida! Llévala al bote.",
@@ -161,6 +169,13 @@ TRADUCCIONES = {
         "txt_plaza_hud_title": "Level 3 – The Plaza",
         "txt_dificil_tiempo": "(Hard, timed)",
         "txt_facil_tiempo": "(Easy, timed)",
+        "txt_infinito": "(Endless)",
+        "txt_activas": "Active:",
+        "txt_oleada": "Wave",
+        "txt_en_vista": "in view",
+        "txt_calidad": "quality",
+        "txt_voces": "voices",
+        "txt_robos_s": "steals/s",
         
         # Textos específicos del Tutorial
         "txt_tutorial_msg1": "Trash collected! Take it to the bin.",
@@ -178,6 +193,25 @@ TRADUCCIONES = {
     }
 }
 
+# ---------- Tabla compilada ----------
+# cambiar_idioma() aplana TRADUCCIONES[idioma] en un solo dict con cadenas
+# internadas; obtener_nombre() es una búsqueda y nada más. Las claves
+# dinámicas (nombres de archivo con sufijo 'us') se resuelven una vez y se
+# guardan en la misma tabla.
+_TABLA: dict[str, str] = {}
+
+# Cachés derivados del idioma (textos ya renderizados, imágenes traducidas...).
+# cambiar_idioma() es el único punto que los invalida.
+_CACHES_IDIOMA: list = []
+
+def registrar_cache_idioma(limpiar):
+    """`limpiar()` se llamará cada vez que cambie el idioma."""
+    _CACHES_IDIOMA.append(limpiar)
+
+def _compilar(idioma):
+    global _TABLA
+    _TABLA = {sys.intern(k): sys.intern(v) for k, v in TRADUCCIONES[idioma].items()}
+
 def cambiar_idioma(nuevo_idioma):
     """Cambia el idioma global ('es' o 'us')."""
     global IDIOMA_ACTUAL
@@ -185,29 +219,32 @@ def cambiar_idioma(nuevo_idioma):
     if nuevo_idioma == "en":
         nuevo_idioma = "us"
         
-    if nuevo_idioma in TRADUCCIONES:
-        IDIOMA_ACTUAL = nuevo_idioma
-    else:
+    if nuevo_idioma not in TRADUCCIONES:
         print(f"[CONFIG] Intento de cambiar a idioma desconocido: {nuevo_idioma}")
+        return
+    if nuevo_idioma == IDIOMA_ACTUAL and _TABLA:
+        return
+    IDIOMA_ACTUAL = nuevo_idioma
+    _compilar(nuevo_idioma)
+    for limpiar in _CACHES_IDIOMA:
+        limpiar()
 
 def obtener_nombre(clave):
     """
     Devuelve el valor traducido desde config.py.
     """
-    idioma = IDIOMA_ACTUAL
-    
-    # 1. Intentar obtener el texto del diccionario usando el idioma actual
-    diccionario_idioma = TRADUCCIONES.get(idioma, TRADUCCIONES["es"])
-    valor = diccionario_idioma.get(clave)
-    
-    # 2. Si encontramos el valor, lo devolvemos
+    valor = _TABLA.get(clave)
     if valor is not None:
         return valor
-        
-    # 3. Si no existe la clave en el diccionario (quizás es un nombre de archivo dinámico)
-    # y estamos en 'us', agregamos el sufijo.
-    if idioma == "us" and not clave.endswith("us"):
-        return clave + "us"
-    
-    # 4. Fallback: devolvemos la clave original
-    return clave
\ No newline at end of file
+
+    # Si no existe la clave en el diccionario (quizás es un nombre de archivo
+    # dinámico) y estamos en 'us', agregamos el sufijo. Fallback: la clave.
+    if IDIOMA_ACTUAL == "us" and not clave.endswith("us"):
+        valor = sys.intern(clave + "us")
+    else:
+        valor = clave
+    _TABLA[clave] = valor
+    return valor
+
+
+_compilar(IDIOMA_ACTUAL)
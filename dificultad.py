@@ -5,27 +5,15 @@ from typing import Optional
 import importlib, importlib.util, re
 from audio_shared import play_sfx 
 import config # IMPORTAR CONFIG
+import asset_variants
+from quality import governor
+from idle import menu_idle
+from backdrop import backdrop
 
 # ===== Helpers (MODIFICADO: Usa config.obtener_nombre) =====
 def find_by_stem(assets_dir: Path, stem: str) -> Optional[Path]:
-    real_name = config.obtener_nombre(stem)
-    exts = (".png", ".jpg", ".jpeg")
-    
-    for ext in exts:
-        p = assets_dir / f"{real_name}{ext}"
-        if p.exists():
-            return p
-            
-    cands: list[Path] = []
-    for ext in exts:
-        cands += list(assets_dir.glob(f"{real_name}*{ext}"))
-        
-    # Fallback al stem original
-    if not cands and real_name != stem:
-        for ext in exts:
-            cands += list(assets_dir.glob(f"{stem}*{ext}"))
-            
-    return min(cands, key=lambda p: len(p.name)) if cands else None
+    # Traducida si existe; si no, la original (tabla armada al arrancar)
+    return asset_variants.localized(assets_dir, stem)
 
 def load_image(assets_dir: Path, stems: list[str]) -> pygame.Surface | None:
     for stem in stems:
@@ -128,16 +116,11 @@ def _resolve_personaje_folder(label: str) -> Optional[str]:
 
 # ===== Pantalla Dificultad (MODIFICADO: Usa config.obtener_nombre en assets y texto) =====
 def run(screen: pygame.Surface, assets_dir: Path, nivel: int = 1, *args, **kwargs):
-    """Devuelve {'dificultad': 'facil'|'dificil', 'personaje': <label original>, 'personaje_folder': <carpeta>} o None si Back."""
+    """Devuelve {'dificultad': 'facil'|'dificil'|'infinito', 'personaje': <label original>, 'personaje_folder': <carpeta>} o None si Back."""
     clock = pygame.time.Clock()
     W, H = screen.get_size()
 
-    background = load_image(assets_dir, ["Background_f", "Background_fondo", "fondo"])
-    if not background:
-        raise FileNotFoundError("Fondo no encontrado (Background_f*).")
-    background = pygame.transform.smoothscale(background, (W, H))
-    bw = background.get_width()
-    scroll_x = 0; SCROLL_SPEED = 2
+    backdrop.load(assets_dir, (W, H))
 
     # ===================================================================
     # === Cargar el TÍTULO específico del nivel ===
@@ -222,14 +205,14 @@ def run(screen: pygame.Surface, assets_dir: Path, nivel: int = 1, *args, **kwarg
     back_rect = back_img.get_rect(); back_rect.bottomleft = (10, H - 12)
 
     while True:
-        mouse = pygame.mouse.get_pos(); click = False
-        for e in pygame.event.get():
+        mouse = pygame.mouse.get_pos(); click = False; infinito = False
+        for e in menu_idle.events():
             if e.type == pygame.QUIT: return None
             if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1: click = True
+            # Tecla I en el nivel 1: modo infinito (stress) del parque
+            if e.type == pygame.KEYDOWN and e.key == pygame.K_i and nivel == 1: infinito = True
 
-        scroll_x -= SCROLL_SPEED
-        if scroll_x <= -bw: scroll_x = 0
-        screen.blit(background, (scroll_x, 0)); screen.blit(background, (scroll_x+bw, 0))
+        backdrop.draw(screen)
         screen.blit(title_img, title_rect)
 
         def draw_pair(base, hover, rect):
@@ -245,6 +228,14 @@ def run(screen: pygame.Surface, assets_dir: Path, nivel: int = 1, *args, **kwarg
         else:
             screen.blit(back_img, back_rect); current_back_rect = back_rect
 
+        if infinito:
+            play_sfx("hard", assets_dir)
+            nombre = _abrir_seleccion_personaje(screen, assets_dir)
+            if nombre is None:
+                return None
+            carpeta = _resolve_personaje_folder(nombre) or "PERSONAJE H"
+            return {"dificultad": "infinito", "personaje": nombre, "personaje_folder": carpeta}
+
         if click:
             if rN.collidepoint(mouse):
                 play_sfx("easy", assets_dir)
@@ -279,4 +270,5 @@ def run(screen: pygame.Surface, assets_dir: Path, nivel: int = 1, *args, **kwarg
                 return None
 
         pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+        menu_idle.tick(clock)
+        governor.frame(menu_idle.work_ms)
\ No newline at end of file
@@ -0,0 +1,137 @@
+# display.py
+# Ventana del juego con resolución lógica fija.
+# Antes main.py abría la ventana del tamaño en píxeles de Background_f
+# (1536x1024), así que todo el trabajo por frame dependía del arte y no de la
+# pantalla. Ahora el juego siempre dibuja a una resolución lógica (preset) y,
+# con pygame.SCALED, SDL la escala a la ventana/monitor real en la GPU.
+# Las pantallas siguen usando screen.get_size() como siempre: el costo por
+# frame queda acotado por el preset, no por el kiosco ni por el arte.
+#
+# Ajustes (settings.json): "display_preset", "fullscreen", "scale_mode".
+#   scale_mode: "smooth" -> SCALED con filtro lineal
+#               "pixel"  -> SCALED con vecino más cercano (escalado entero en ventana)
+#               "off"    -> ventana del tamaño lógico, sin escalar
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Optional
+import pygame
+from settings import get_settings
+
+# Resoluciones lógicas. El arte de los niveles está dibujado a 1366x768 y
+# cada pantalla lo escala a este tamaño al cargar, así que el preset es
+# también el "tier" de los assets en memoria.
+PRESETS: dict[str, tuple[int, int]] = {
+    "720p":  (1280, 720),
+    "768p":  (1366, 768),
+    "900p":  (1600, 900),
+    "1080p": (1920, 1080),
+}
+DEFAULT_PRESET = "768p"
+SCALE_MODES = ("smooth", "pixel", "off")
+CAPTION = "Guardianes del Planeta"
+
+_screen: Optional[pygame.Surface] = None
+_preset = DEFAULT_PRESET
+_fullscreen = False
+_scale_mode = "smooth"
+_assets: Optional[Path] = None
+
+
+def _flags() -> int:
+    flags = 0
+    if _scale_mode != "off":
+        flags |= pygame.SCALED
+    if _fullscreen:
+        flags |= pygame.FULLSCREEN
+    return flags
+
+
+def open_window(assets_dir: Path, preset: Optional[str] = None,
+                fullscreen: Optional[bool] = None) -> pygame.Surface:
+    """Abre (o reabre) la ventana con el preset guardado o el indicado."""
+    global _screen, _preset, _fullscreen, _scale_mode, _assets
+    _assets = assets_dir
+    prefs = get_settings(assets_dir)
+    _preset = preset or prefs.get("display_preset", DEFAULT_PRESET)
+    if _preset not in PRESETS:
+        print(f"⚠️ Preset de pantalla desconocido '{_preset}', uso {DEFAULT_PRESET}")
+        _preset = DEFAULT_PRESET
+    _fullscreen = bool(prefs.get("fullscreen", False) if fullscreen is None else fullscreen)
+    _scale_mode = prefs.get("scale_mode", "smooth")
+    if _scale_mode not in SCALE_MODES:
+        _scale_mode = "smooth"
+
+    # La calidad del escalado de SDL se fija antes de crear el renderer
+    os.environ["SDL_RENDER_SCALE_QUALITY"] = "0" if _scale_mode == "pixel" else "1"
+    size = PRESETS[_preset]
+    try:
+        _screen = pygame.display.set_mode(size, _flags())
+    except pygame.error as e:
+        # Algunos drivers no soportan SCALED: ventana normal al tamaño lógico
+        print(f"⚠️ Sin escalado por hardware ({e}); ventana {size[0]}x{size[1]}")
+        _scale_mode = "off"
+        _screen = pygame.display.set_mode(size, _flags())
+    pygame.display.set_caption(CAPTION)
+    return _screen
+
+
+def toggle_fullscreen() -> pygame.Surface:
+    """F11: pantalla completa <-> ventana. La superficie lógica no cambia."""
+    global _fullscreen, _screen, _scale_mode
+    _fullscreen = not _fullscreen
+    toggled = False
+    if _scale_mode != "off":
+        try:
+            toggled = bool(pygame.display.toggle_fullscreen())
+        except pygame.error:
+            pass
+    if toggled:
+        _screen = pygame.display.get_surface()
+    else:
+        try:
+            _screen = pygame.display.set_mode(PRESETS[_preset], _flags())
+        except pygame.error as e:
+            # El driver no puede con ese modo: se queda como estaba y, si el
+            # renderer ya se perdió, sin SCALED (el respaldo de open_window)
+            print(f"⚠️ No se pudo cambiar a {'pantalla completa' if _fullscreen else 'ventana'} ({e})")
+            _fullscreen = not _fullscreen
+            try:
+                _screen = pygame.display.set_mode(PRESETS[_preset], _flags())
+            except pygame.error:
+                _scale_mode = "off"
+                _screen = pygame.display.set_mode(PRESETS[_preset], _flags())
+    if _assets is not None:
+        get_settings(_assets).set("fullscreen", _fullscreen)
+    return _screen
+
+
+def logical_size() -> tuple[int, int]:
+    return PRESETS[_preset]
+
+
+# --- Arte a pantalla completa ---
+# El fondo de los menús y las pantallas finales son 3:2 (1536x1024) y los
+# presets 16:9: estirarlos a la pantalla lógica los aplastaba (x0.889 a lo
+# ancho, x0.75 a lo alto en 768p). Se escalan con una sola proporción hasta
+# cubrir la pantalla y se recorta el centro, como load_bg_fit en los niveles.
+def cover_ratio(src: tuple[int, int], size: tuple[int, int]) -> float:
+    """Escala uniforme con la que `src` cubre `size` entero."""
+    return max(size[0] / src[0], size[1] / src[1])
+
+
+def cover(img: pygame.Surface, size: tuple[int, int], smooth: bool = True,
+          keep_width: bool = False) -> pygame.Surface:
+    """`img` sin deformar, cubriendo `size` y recortada al centro.
+    keep_width=True no recorta a lo ancho (fondos con scroll horizontal: el
+    corte rompería la unión de la tira), así que puede quedar más ancha.
+    No usa convert(): se puede llamar desde un hilo."""
+    iw, ih = img.get_size()
+    ratio = cover_ratio((iw, ih), size)
+    cw = iw if keep_width else min(iw, round(size[0] / ratio))
+    ch = min(ih, round(size[1] / ratio))
+    src = img.subsurface(((iw - cw) // 2, (ih - ch) // 2, cw, ch))
+    out = (max(size[0], round(iw * ratio)) if keep_width else size[0], size[1])
+    if smooth and img.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(src, out)
+    return pygame.transform.scale(src, out)
@@ -0,0 +1,167 @@
+# end_screens.py
+# Pantallas de victoria/derrota listas antes de que hagan falta.
+# Los niveles cargaban win_level*/PANTALLA LOSE justo al ganar o perder:
+# decodificar un JPG/PNG a pantalla completa y escalarlo son decenas de ms,
+# y caían en el frame exacto en que el jugador termina. Aquí cada nivel
+# registra sus pantallas al arrancar; un hilo las decodifica y escala poco
+# después (para no competir con la carga del nivel) y el final sólo recoge
+# la Surface. Si el hilo aún no llegó a esa pantalla, se carga en el momento,
+# como antes.
+#
+#   python end_screens.py    -> tiempo de carga de cada pantalla final
+from __future__ import annotations
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+import pygame
+from display import cover
+
+START_DELAY = 1.5      # s tras arrancar el nivel antes de empezar a decodificar
+
+FIT_STRETCH = "stretch"   # al tamaño de la pantalla tal cual
+FIT_COVER = "cover"       # llena la pantalla sin deformar, recortando el centro (display.cover)
+
+_PENDING, _RUNNING, _DONE = 0, 1, 2
+
+
+def decode_fitted(path: Path, size: tuple[int, int], fit: str = FIT_COVER,
+                  smooth: bool = True) -> pygame.Surface:
+    """Carga y escala una imagen sin convert(): se puede llamar desde un hilo.
+    Por defecto sin deformar: las pantallas finales son 3:2 y la ventana 16:9."""
+    img = pygame.image.load(str(path))
+    if fit == FIT_COVER:
+        return cover(img, size, smooth)
+    if smooth and img.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(img, size)
+    return pygame.transform.scale(img, size)
+
+
+class _Job:
+    __slots__ = ("name", "path", "fit", "smooth", "alpha", "state", "raw", "surf", "done")
+
+    def __init__(self, name: str, path: Optional[Path], fit: str, smooth: bool,
+                 alpha: Optional[bool]):
+        self.name = name
+        self.path = path
+        self.fit = fit
+        self.smooth = smooth
+        self.alpha = alpha if alpha is not None else (path is not None and path.suffix.lower() == ".png")
+        self.state = _PENDING if path is not None else _DONE
+        self.raw: Optional[pygame.Surface] = None    # decodificada y escalada (hilo)
+        self.surf: Optional[pygame.Surface] = None   # convertida (hilo principal)
+        self.done = threading.Event()
+        if path is None:
+            self.done.set()
+
+
+class EndScreens:
+    """Pantallas finales de un nivel.
+
+    - add(nombre, path, fit, smooth, alpha): registrar (path None = no hay
+      imagen; alpha None = convert_alpha() sólo para .png).
+    - start(): lanza el hilo de precarga (tras START_DELAY).
+    - get(nombre): Surface lista para blit, o None si no hay imagen. Si no
+      estaba precargada la carga en ese momento.
+    - stop(): el hilo no empieza pantallas nuevas (al salir del nivel).
+    """
+
+    def __init__(self, size: tuple[int, int], delay: float = START_DELAY):
+        self.size = size
+        self.delay = delay
+        self._jobs: dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, path: Optional[Path], fit: str = FIT_COVER,
+            smooth: bool = True, alpha: Optional[bool] = None) -> None:
+        self._jobs[name] = _Job(name, path, fit, smooth, alpha)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._work, name="end-screens", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _claim(self, job: _Job) -> bool:
+        with self._lock:
+            if job.state != _PENDING:
+                return False
+            job.state = _RUNNING
+            return True
+
+    def _load(self, job: _Job) -> None:
+        try:
+            job.raw = decode_fitted(job.path, self.size, job.fit, job.smooth)
+        except Exception as e:
+            print(f"⚠️ No se pudo cargar la pantalla final '{job.name}' ({job.path.name}): {e}")
+        job.state = _DONE
+        job.done.set()
+
+    def _work(self) -> None:
+        if self._stop.wait(self.delay):
+            return
+        for job in list(self._jobs.values()):
+            if self._stop.is_set():
+                return
+            if self._claim(job):
+                self._load(job)
+
+    def ready(self, name: str) -> bool:
+        job = self._jobs.get(name)
+        return job is not None and job.done.is_set()
+
+    def get(self, name: str) -> Optional[pygame.Surface]:
+        job = self._jobs.get(name)
+        if job is None:
+            return None
+        if job.surf is not None:
+            return job.surf
+        if self._claim(job):
+            # El hilo no llegó (nivel muy corto): carga síncrona como antes
+            t0 = time.perf_counter()
+            self._load(job)
+            print(f"[INFO] Pantalla final '{name}' sin precarga: "
+                  f"{(time.perf_counter() - t0) * 1000:.0f} ms")
+        else:
+            job.done.wait()
+        if job.raw is None:
+            return None
+        # convert() toca el formato de la ventana: sólo en el hilo principal
+        job.surf = job.raw.convert_alpha() if job.alpha else job.raw.convert()
+        job.raw = None
+        return job.surf
+
+
+def _measure() -> None:
+    """Lo que costaba cada pantalla final en el frame de victoria/derrota."""
+    import display
+    import asset_variants
+    assets = Path(__file__).resolve().parent / "assets"
+    pygame.init()
+    screen = display.open_window(assets)
+    size = screen.get_size()
+    lose = assets / "PANTALLA LOSE"
+    paths = [asset_variants.localized(assets, "win_level1"), assets / "win_level3.png",
+             asset_variants.find(assets, "n2_victoria_calle_verde"),
+             asset_variants.find(assets, "lose_level3")]
+    paths += sorted(lose.glob("*.jpg")) if lose.exists() else []
+    for p in paths:
+        if p is None or not p.exists():
+            continue
+        t0 = time.perf_counter()
+        surf = decode_fitted(p, size)
+        t1 = time.perf_counter()
+        surf.convert_alpha() if p.suffix.lower() == ".png" else surf.convert()
+        t2 = time.perf_counter()
+        print(f"{p.name:32s} decodificar+escalar {(t1 - t0) * 1000:6.1f} ms | "
+              f"convert {(t2 - t1) * 1000:5.1f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    _measure()
@@ -0,0 +1,307 @@
+# entity_store.py
+# Almacén "struct of arrays" para objetos simples de los niveles (basuras,
+# semillas, hoyos). En vez de un objeto Python por item, cada campo vive en un
+# arreglo (NumPy si está instalado) y las actualizaciones por frame —timers de
+# crecimiento, pulso del glow, distancia al jugador— se hacen de una sola vez.
+# Sin NumPy funciona igual con listas y bucles normales.
+from __future__ import annotations
+import math
+import pygame
+from typing import Any, Callable, Sequence
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# ---------- Flags de estado ----------
+ALIVE = 1     # la ranura está ocupada
+HIDDEN = 2    # recogido / cargado: no se dibuja ni se ofrece al jugador
+DONE = 4      # terminó (p.ej. hoyo con árbol)
+
+
+def glow_steps(base: pygame.Surface, steps: int, lo: int, hi: int,
+               tint: tuple[int, int, int] = (255, 255, 255)) -> list[pygame.Surface]:
+    """`steps` copias de `base` multiplicadas por un alpha de lo a hi: el pulso
+    de un glow elige una en vez de copiar y mezclar cada frame."""
+    out = []
+    for k in range(steps):
+        g = base.copy()
+        g.fill((*tint, int(lo + (hi - lo) * k / (steps - 1))), special_flags=pygame.BLEND_RGBA_MULT)
+        out.append(g)
+    return out
+
+
+class GlowBank:
+    """Glows compartidos: uno por tamaño (o su lista de glow_steps), los items
+    guardan sólo el índice."""
+
+    def __init__(self, factory: Callable[[int], Any]):
+        self._factory = factory
+        self._surfs: list[Any] = []
+        self._by_size: dict[int, int] = {}
+
+    def index_for(self, size: int) -> int:
+        size = int(size)
+        idx = self._by_size.get(size)
+        if idx is None:
+            idx = self._by_size[size] = len(self._surfs)
+            self._surfs.append(self._factory(size))
+        return idx
+
+    def __getitem__(self, idx: int) -> Any:
+        return self._surfs[idx]
+
+    def __len__(self) -> int:
+        return len(self._surfs)
+
+
+def _alloc(n: int, dtype: str):
+    if np is not None:
+        return np.zeros(n, dtype=dtype)
+    return [0.0 if dtype.startswith("f") else 0] * n
+
+
+class EntityStore:
+    """Campos por item en arreglos paralelos; el índice de ranura es estable.
+
+    - add(center, size, kind=, glow=, phase=) -> índice (reutiliza ranuras libres)
+    - remove(i) / clear()
+    - advance_growth(dt, step_time, max_steps): timers de crecimiento de todos a la vez
+    - pulse_steps(t, steps, idx): nivel de pulso cuantizado para un banco de glows
+    - nearest(pos, radius): el item visible más cercano, o -1
+    """
+
+    FIELDS = (("cx", "f4"), ("cy", "f4"), ("hw", "f4"), ("hh", "f4"),
+              ("kind", "i2"), ("glow", "i2"), ("flags", "u1"),
+              ("timer", "f4"), ("step", "i2"), ("phase", "f4"))
+
+    def __init__(self, capacity: int = 16):
+        self._cap = max(1, int(capacity))
+        for name, dt in self.FIELDS:
+            setattr(self, name, _alloc(self._cap, dt))
+        self._top = 0              # ranuras usadas alguna vez
+        self._free: list[int] = []
+        self._alive = 0
+
+    # ---------- mantenimiento ----------
+    def _grow(self) -> None:
+        new_cap = self._cap * 2
+        for name, dt in self.FIELDS:
+            old = getattr(self, name)
+            arr = _alloc(new_cap, dt)
+            arr[:self._cap] = old
+            setattr(self, name, arr)
+        self._cap = new_cap
+
+    def add(self, center: tuple[float, float], size: tuple[int, int], *,
+            kind: int = 0, glow: int = 0, phase: float = 0.0) -> int:
+        if self._free:
+            i = self._free.pop()
+        else:
+            if self._top >= self._cap:
+                self._grow()
+            i = self._top
+            self._top += 1
+        self.cx[i], self.cy[i] = center
+        self.hw[i], self.hh[i] = size[0] * 0.5, size[1] * 0.5
+        self.kind[i] = kind
+        self.glow[i] = glow
+        self.flags[i] = ALIVE
+        self.timer[i] = 0
+        self.step[i] = 0
+        self.phase[i] = phase
+        self._alive += 1
+        return i
+
+    def remove(self, i: int) -> None:
+        if self.flags[i] & ALIVE:
+            self.flags[i] = 0
+            self._free.append(i)
+            self._alive -= 1
+
+    def clear(self) -> None:
+        # basta con apagar los flags: add() reescribe todos los campos
+        self.flags[:self._top] = [0] * self._top if np is None else 0
+        self._top = 0
+        self._free.clear()
+        self._alive = 0
+
+    def __len__(self) -> int:
+        return self._alive
+
+    # ---------- acceso por item ----------
+    def has(self, i: int, flag: int) -> bool:
+        return bool(self.flags[i] & flag)
+
+    def set_flag(self, i: int, flag: int, on: bool = True) -> None:
+        if on:
+            self.flags[i] |= flag
+        else:
+            self.flags[i] &= ~flag & 0xFF
+
+    def center(self, i: int) -> tuple[int, int]:
+        return int(self.cx[i]), int(self.cy[i])
+
+    def set_center(self, i: int, pos: tuple[float, float]) -> None:
+        self.cx[i], self.cy[i] = pos
+
+    def rect(self, i: int) -> pygame.Rect:
+        hw, hh = float(self.hw[i]), float(self.hh[i])
+        return pygame.Rect(round(self.cx[i] - hw), round(self.cy[i] - hh), round(hw * 2), round(hh * 2))
+
+    def indices(self, flags: int = ALIVE, without: int = 0):
+        """Índices con todos los `flags` y ninguno de `without`."""
+        n = self._top
+        if np is not None:
+            f = self.flags[:n]
+            return np.flatnonzero(((f & flags) == flags) & ((f & without) == 0))
+        return [i for i in range(n) if (self.flags[i] & flags) == flags and not (self.flags[i] & without)]
+
+    # ---------- actualizaciones vectorizadas ----------
+    def advance_growth(self, dt: float, step_time: float, max_steps: int):
+        """Equivale a Hole.update para todos: avanza los timers activos (timer > 0,
+        sin DONE) y devuelve los índices que acaban de llegar a `max_steps`."""
+        n = self._top
+        if np is not None:
+            f = self.flags[:n]
+            timer = self.timer[:n]
+            step = self.step[:n]
+            act = ((f & ALIVE) != 0) & ((f & DONE) == 0) & (timer > 0)
+            timer[act] += dt
+            up = act & (timer >= step_time)
+            timer[up] = 1
+            step[up] += 1
+            fin = up & (step >= max_steps)
+            step[fin] = max_steps
+            f[fin] |= DONE
+            return np.flatnonzero(fin)
+        finished = []
+        for i in range(n):
+            f = self.flags[i]
+            if f & ALIVE and not f & DONE and self.timer[i] > 0:
+                self.timer[i] += dt
+                if self.timer[i] >= step_time:
+                    self.timer[i] = 1
+                    self.step[i] += 1
+                    if self.step[i] >= max_steps:
+                        self.step[i] = max_steps
+                        self.flags[i] = f | DONE
+                        finished.append(i)
+        return finished
+
+    def pulse_steps(self, t: float, steps: int, idx: Sequence[int], speed: float = 1.0) -> list[int]:
+        """Pulso (sin(t*speed + fase) + 1) / 2 cuantizado a 0..steps-1 para `idx`."""
+        last = steps - 1
+        if np is not None:
+            idx = np.asarray(idx, dtype=np.intp)
+            p = (np.sin(t * speed + self.phase[idx]) + 1.0) * (0.5 * last) + 0.5
+            return p.astype(np.intp).tolist()
+        ph = self.phase
+        return [int((math.sin(t * speed + ph[i]) + 1.0) * (0.5 * last) + 0.5) for i in idx]
+
+    def take(self, name: str, idx: Sequence[int]) -> list:
+        """Valores del campo `name` para `idx`, como lista normal."""
+        arr = getattr(self, name)
+        if np is not None:
+            return arr[np.asarray(idx, dtype=np.intp)].tolist()
+        return [arr[i] for i in idx]
+
+    def centers(self, idx: Sequence[int], dx: float = 0.0) -> list[tuple[int, int]]:
+        if np is not None:
+            idx = np.asarray(idx, dtype=np.intp)
+            xs = np.rint(self.cx[idx] + dx).astype(np.intp)
+            ys = np.rint(self.cy[idx]).astype(np.intp)
+            return list(zip(xs.tolist(), ys.tolist()))
+        return [(round(self.cx[i] + dx), round(self.cy[i])) for i in idx]
+
+    def topleft(self, idx: Sequence[int], dx: float = 0.0) -> list[tuple[int, int]]:
+        """Esquinas (x, y) enteras para blit, desplazadas `dx` (cámara)."""
+        if np is not None:
+            idx = np.asarray(idx, dtype=np.intp)
+            xs = np.rint(self.cx[idx] - self.hw[idx] + dx).astype(np.intp)
+            ys = np.rint(self.cy[idx] - self.hh[idx]).astype(np.intp)
+            return list(zip(xs.tolist(), ys.tolist()))
+        return [(round(self.cx[i] - self.hw[i] + dx), round(self.cy[i] - self.hh[i])) for i in idx]
+
+    def nearest(self, pos: tuple[float, float], radius: float, without: int = HIDDEN) -> int:
+        """Índice vivo más cercano (centro a centro) a <= radius, o -1. Empate -> índice menor."""
+        px, py = pos
+        r2 = radius * radius
+        n = self._top
+        if n == 0:
+            return -1
+        if np is not None:
+            f = self.flags[:n]
+            d2 = (self.cx[:n] - px) ** 2 + (self.cy[:n] - py) ** 2
+            d2 = np.where(((f & ALIVE) != 0) & ((f & without) == 0), d2, np.inf)
+            i = int(np.argmin(d2))
+            return i if d2[i] <= r2 else -1
+        best, best_d2 = -1, r2
+        for i in range(n):
+            f = self.flags[i]
+            if f & ALIVE and not f & without:
+                d2 = (self.cx[i] - px) ** 2 + (self.cy[i] - py) ** 2
+                if d2 < best_d2 or (best < 0 and d2 <= best_d2):
+                    best, best_d2 = i, d2
+        return best
+
+
+# ===== Medición (python entity_store.py): objetos vs arreglos =====
+if __name__ == "__main__":
+    import random
+    import time
+
+    class _Obj:
+        def __init__(self, x, y, phase):
+            self.rect = pygame.Rect(0, 0, 44, 44); self.rect.center = (x, y)
+            self.grow_timer = 1; self.grow_step = 1; self.has_tree = False; self.phase = phase
+
+        def update(self, dt):
+            if self.grow_timer > 0 and not self.has_tree:
+                self.grow_timer += dt
+                if self.grow_timer >= 220:
+                    self.grow_timer = 1; self.grow_step += 1
+                    if self.grow_step >= 3:
+                        self.grow_step = 3; self.has_tree = True
+
+    def _frame_objs(objs, t, pos):
+        for o in objs:
+            o.update(16)
+        steps = [int((math.sin(t + o.phase) + 1.0) * 7.5 + 0.5) for o in objs]
+        best, bd = None, 80 * 80
+        for o in objs:
+            cx, cy = o.rect.center
+            d = (cx - pos[0]) ** 2 + (cy - pos[1]) ** 2
+            if d < bd:
+                best, bd = o, d
+        return steps, best
+
+    def _frame_store(st, idx, t, pos):
+        st.advance_growth(16, 220, 3)
+        steps = st.pulse_steps(t, 16, idx)
+        return steps, st.nearest(pos, 80)
+
+    print(f"NumPy: {'sí' if HAVE_NUMPY else 'no (listas)'}")
+    print(f"{'items':>8} | {'objetos ms/frame':>16} | {'store ms/frame':>14} | {'x':>6}")
+    for n in (10, 100, 1000, 10000, 100000):
+        rng = random.Random(1)
+        data = [(rng.uniform(0, 3840), rng.uniform(300, 700), rng.uniform(0, math.tau)) for _ in range(n)]
+        objs = [_Obj(x, y, ph) for x, y, ph in data]
+        st = EntityStore(n)
+        for x, y, ph in data:
+            i = st.add((x, y), (44, 44), phase=ph)
+            st.timer[i] = 1; st.step[i] = 1
+        idx = st.indices()
+        frames = max(3, 200000 // n)
+        t0 = time.perf_counter()
+        for k in range(frames):
+            _frame_objs(objs, k * 0.016, (1920, 500))
+        to = (time.perf_counter() - t0) / frames * 1000
+        t0 = time.perf_counter()
+        for k in range(frames):
+            _frame_store(st, idx, k * 0.016, (1920, 500))
+        ts = (time.perf_counter() - t0) / frames * 1000
+        print(f"{n:8d} | {to:16.3f} | {ts:14.3f} | {to / ts:6.1f}")
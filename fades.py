@@ -0,0 +1,112 @@
+# fades.py
+# Mensajes, etiquetas e iconos que se desvanecen, renderizados una sola vez.
+# Antes cada frame de un fade copiaba el mensaje y su sombra por separado
+# (governor.faded -> copy() + set_alpha) y las etiquetas "Recoger (E)" /
+# "en la mano" se armaban con Surface + draw.rect + blit en cada frame.
+# Aquí el mensaje se compone UNA vez con su sombra en una sola Surface y el
+# fade sólo cambia el alpha de esa Surface justo antes del blit, sin copias.
+# Mensajes y etiquetas iguales comparten el render entre frames y niveles
+# (caché por fuente, como text_cache); cambiar_idioma() lo vacía.
+#
+# La Surface de un FadeSprite es suya: el alpha se fija en cada blit(), así
+# que compartirla es seguro siempre que se dibuje con blit().
+from __future__ import annotations
+import math
+import weakref
+from typing import Optional
+import pygame
+import config
+from quality import governor
+
+MAX_PER_FONT = 128   # renders distintos por fuente antes de vaciar
+
+
+class FadeSprite:
+    """Surface ya compuesta + alpha por frame.
+
+    - blit(dest, value, **anchor): dibuja con alpha `value` (0..1). El anclaje
+      (center=, midtop=...) es el del contenido, sin contar la sombra.
+      Devuelve ese Rect. Sin fades (quality) se dibuja opaco.
+    - rect(**anchor): dónde quedaría el contenido.
+    """
+
+    __slots__ = ("surf", "size", "_alpha", "__weakref__")
+
+    def __init__(self, surf: pygame.Surface, size: Optional[tuple[int, int]] = None):
+        self.surf = surf
+        self.size = size or surf.get_size()
+        self._alpha = -1
+
+    def rect(self, **anchor) -> pygame.Rect:
+        r = pygame.Rect((0, 0), self.size)
+        for k, v in anchor.items():
+            setattr(r, k, v)
+        return r
+
+    def blit(self, dest: pygame.Surface, value: float = 1.0, **anchor) -> pygame.Rect:
+        a = max(0, min(255, int(255 * value))) if governor.fades else 255
+        if a != self._alpha:
+            self.surf.set_alpha(a)
+            self._alpha = a
+        r = self.rect(**anchor)
+        dest.blit(self.surf, r.topleft)
+        return r
+
+
+def pulse(t: float, speed: float, lo: float = 0.0, hi: float = 1.0) -> float:
+    """Oscilación senoidal entre lo y hi (reloj de animación de quality)."""
+    return lo + (hi - lo) * (0.5 + 0.5 * math.sin(governor.anim_time(t) * speed))
+
+
+# Por fuente y con referencia débil: al salir del nivel sus fuentes se liberan
+_cache: "weakref.WeakKeyDictionary[pygame.font.Font, dict]" = weakref.WeakKeyDictionary()
+
+
+def _cached(font: pygame.font.Font, key: tuple, build) -> FadeSprite:
+    por_fuente = _cache.get(font)
+    if por_fuente is None:
+        por_fuente = _cache[font] = {}
+    fx = por_fuente.get(key)
+    if fx is None:
+        if len(por_fuente) >= MAX_PER_FONT:
+            por_fuente.clear()
+        fx = por_fuente[key] = build()
+    return fx
+
+
+def message(font: pygame.font.Font, texto: str, color=(255, 255, 255),
+            shadow=(0, 0, 0), offset: int = 4) -> FadeSprite:
+    """Texto con sombra desplazada `offset` px, en una sola Surface."""
+    def build() -> FadeSprite:
+        fg = font.render(texto, True, color)
+        sh = font.render(texto, True, shadow)
+        s = pygame.Surface((fg.get_width() + offset, fg.get_height() + offset), pygame.SRCALPHA)
+        s.blit(sh, (offset, offset))
+        s.blit(fg, (0, 0))
+        return FadeSprite(s, fg.get_size())
+    return _cached(font, ("msg", texto, tuple(color), tuple(shadow), offset), build)
+
+
+def label(font: pygame.font.Font, texto: str, color=(255, 255, 255),
+          bg=(0, 0, 0, 160), pad: tuple[int, int] = (10, 6), radius: int = 6) -> FadeSprite:
+    """Texto sobre un rectángulo redondeado semitransparente."""
+    def build() -> FadeSprite:
+        txt = font.render(texto, True, color)
+        s = pygame.Surface((txt.get_width() + pad[0], txt.get_height() + pad[1]), pygame.SRCALPHA)
+        pygame.draw.rect(s, bg, s.get_rect(), border_radius=radius)
+        s.blit(txt, txt.get_rect(center=s.get_rect().center))
+        return FadeSprite(s)
+    return _cached(font, ("label", texto, tuple(color), tuple(bg), tuple(pad), radius), build)
+
+
+def tr_label(font: pygame.font.Font, clave: str, color=(255, 255, 255),
+             bg=(0, 0, 0, 160), pad: tuple[int, int] = (10, 6), radius: int = 6) -> FadeSprite:
+    """label() de un texto traducido (clave de config.TRADUCCIONES)."""
+    return label(font, config.obtener_nombre(clave), color, bg, pad, radius)
+
+
+def limpiar() -> None:
+    _cache.clear()
+
+
+config.registrar_cache_idioma(limpiar)
@@ -0,0 +1,94 @@
+# geometria.py
+# Geometría de cada escena (parque, calle, plaza) guardada por el editor de
+# sacar_coordenadas.py en assets/geometria/<escena>.json.
+# Antes el editor imprimía pygame.Rect para pegarlos en el nivel y cada
+# partida recalculaba lo derivado (zonas escaladas, máscara de colisión,
+# celdas del índice). Ahora el editor guarda lo que dibujó a REF y, para cada
+# preset de display.PRESETS, lo ya horneado:
+#
+#   zonas / spawn / bote / obstaculos   ya escalados al preset (px)
+#   colision   la máscara de colisión como rects (CollisionMap.runs());
+#              dibujarlos es < 1 ms, decodificar una máscara PNG ~17 ms
+#   celdas     celdas del SpatialGrid de cada zona y el tamaño de celda usado
+#
+# Los parches del fondo reparado NO se hornean: la plaza reparada mide
+# 747x420 y cargarla + escalarla (~7 ms a 768p) sale más barato que
+# decodificar un atlas de recortes ya al tamaño del preset (~8 ms); los
+# recortes en sí son subsurfaces, sin copia.
+#
+# para(assets_dir, escena, size) devuelve la sección del preset lista para
+# usar; None si no hay archivo o no se horneó ese tamaño (el nivel calcula
+# todo como antes a partir de levels/definiciones.py).
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Any, Optional
+import pygame
+
+REF = (1280, 720)      # resolución del editor (la de sacar_coordenadas.py)
+CARPETA = "geometria"
+VERSION = 1
+
+
+def escalar(rect, size: tuple[int, int], ref: tuple[int, int] = REF) -> pygame.Rect:
+    """Rect medido a `ref` llevado a `size`."""
+    x, y, w, h = rect
+    sx, sy = size[0] / ref[0], size[1] / ref[1]
+    return pygame.Rect(round(x * sx), round(y * sy), round(w * sx), round(h * sy))
+
+
+def escalar_punto(p, size: tuple[int, int], ref: tuple[int, int] = REF) -> tuple[int, int]:
+    return round(p[0] * size[0] / ref[0]), round(p[1] * size[1] / ref[1])
+
+
+def clave(size: tuple[int, int]) -> str:
+    return f"{size[0]}x{size[1]}"
+
+
+def ruta(assets_dir: Path, escena: str) -> Path:
+    return assets_dir / CARPETA / f"{escena}.json"
+
+
+def guardar(assets_dir: Path, escena: str, datos: dict) -> Path:
+    """Escribe el JSON compacto (sin espacios)."""
+    p = ruta(assets_dir, escena)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(json.dumps(dict(datos, escena=escena, version=VERSION), separators=(",", ":")), encoding="utf-8")
+    return p
+
+
+def cargar(assets_dir: Path, escena: str) -> Optional[dict]:
+    p = ruta(assets_dir, escena)
+    if not p.exists():
+        return None
+    try:
+        datos = json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Geometría '{escena}' ilegible ({p.name}): {e}")
+        return None
+    if datos.get("version") != VERSION:
+        print(f"⚠️ Geometría '{escena}' de otra versión; vuelve a guardarla con sacar_coordenadas.py")
+        return None
+    return datos
+
+
+def para(assets_dir: Path, escena: Optional[str], size: tuple[int, int]) -> Optional[dict[str, Any]]:
+    """Geometría horneada de `escena` para `size`, como objetos de pygame:
+    zonas {nombre: Rect}, spawn [Rect], bote (x, y) | None, obstaculos [Rect],
+    colision [Rect], celdas {"celda": int, "zonas": {nombre: celdas}} | None."""
+    if not escena:
+        return None
+    datos = cargar(assets_dir, escena)
+    sec = (datos or {}).get("horneado", {}).get(clave(size))
+    if sec is None:
+        if datos is not None:
+            print(f"⚠️ Geometría '{escena}' sin hornear para {clave(size)}; se calcula al vuelo")
+        return None
+    return {
+        "zonas": {k: pygame.Rect(r) for k, r in sec.get("zonas", {}).items()},
+        "spawn": [pygame.Rect(r) for r in sec.get("spawn", [])],
+        "bote": tuple(sec["bote"]) if sec.get("bote") else None,
+        "obstaculos": [pygame.Rect(r) for r in sec.get("obstaculos", [])],
+        "colision": [pygame.Rect(r) for r in sec.get("colision", [])],
+        "celdas": sec.get("celdas"),
+    }
@@ -0,0 +1,120 @@
+# idle.py
+# Ritmo de los menús cuando nadie está tocando nada.
+# Los menús redibujaban toda la pantalla a 60 FPS para siempre: en un kiosco
+# sin nadie enfrente eso es un núcleo ocupado todo el día. Tras IDLE_AFTER
+# segundos sin entrada, el bucle duerme en pygame.event.wait() (despierta en
+# cuanto llega un evento) y redibuja a IDLE_FPS; el scroll avanza por frame,
+# así que también se vuelve lento. La primera entrada devuelve los 60 FPS.
+#
+#   python idle.py              -> mide CPU de un menú con y sin la política
+#   python idle.py --seconds 30 --idle-after 2
+from __future__ import annotations
+import time
+import pygame
+
+ACTIVE_FPS = 60
+IDLE_FPS = 8
+IDLE_AFTER = 15.0      # s sin entrada antes de bajar el ritmo
+AWAY_GAP = 0.5         # s entre ticks = otra pantalla (un nivel) tuvo el control
+
+_INPUT_EVENTS = {
+    getattr(pygame, name) for name in (
+        "KEYDOWN", "KEYUP", "TEXTINPUT", "MOUSEMOTION", "MOUSEBUTTONDOWN", "MOUSEBUTTONUP",
+        "MOUSEWHEEL", "FINGERDOWN", "FINGERUP", "FINGERMOTION", "JOYBUTTONDOWN",
+        "JOYHATMOTION", "WINDOWFOCUSGAINED", "WINDOWEXPOSED", "WINDOWRESTORED",
+        "VIDEOEXPOSE", "QUIT",
+    ) if hasattr(pygame, name)
+}
+
+
+class IdlePolicy:
+    """Frame pacing de los menús.
+
+    - events(): pygame.event.get() que además marca actividad.
+    - tick(clock): en vez de clock.tick(60). Devuelve ms de animación: los
+      reales si hay actividad, los de un frame a 60 FPS si está inactivo
+      (las animaciones por dt también van lentas).
+    - work_ms: trabajo del último frame, sin esperas (para quality.governor).
+    """
+
+    def __init__(self, idle_after: float = IDLE_AFTER):
+        self.idle_after = idle_after
+        self.enabled = True
+        self._last_input = time.perf_counter()
+        self._frame_end = self._last_input
+        self.work_ms = 0.0
+        self.idle = False
+
+    def poke(self) -> None:
+        self._last_input = time.perf_counter()
+        self.idle = False
+
+    def events(self) -> list[pygame.event.Event]:
+        evs = pygame.event.get()
+        if any(e.type in _INPUT_EVENTS for e in evs):
+            self.poke()
+        return evs
+
+    def tick(self, clock: pygame.time.Clock) -> int:
+        now = time.perf_counter()
+        self.work_ms = (now - self._frame_end) * 1000.0
+        if now - self._frame_end > AWAY_GAP:
+            self.poke()                     # volvemos de un nivel/pantalla: ritmo completo
+        self.idle = self.enabled and now - self._last_input >= self.idle_after
+        if self.idle:
+            ev = pygame.event.wait(1000 // IDLE_FPS)
+            if ev.type != pygame.NOEVENT:
+                pygame.event.post(ev)       # que lo procese el bucle del menú
+                if ev.type in _INPUT_EVENTS:
+                    self.poke()
+            clock.tick()                    # la espera no cuenta como frame lento
+            ms = 1000 // ACTIVE_FPS
+        else:
+            ms = clock.tick(ACTIVE_FPS)
+        self._frame_end = time.perf_counter()
+        return ms
+
+
+# Una para todos los menús: pasar de una pantalla a otra ya es actividad
+menu_idle = IdlePolicy()
+
+
+def _measure(seconds: float, idle_after: float) -> None:
+    """CPU del proceso mientras corre la pantalla de instrucciones sin tocarla."""
+    import threading
+    from pathlib import Path
+    import display
+    import instrucciones
+    from idle import menu_idle     # la de los menús (ejecutado como script esto es __main__)
+    assets = Path(__file__).resolve().parent / "assets"
+
+    pygame.init()
+    screen = display.open_window(assets)
+
+    def run_once(enabled: bool) -> float:
+        menu_idle.enabled = enabled
+        menu_idle.idle_after = idle_after
+        menu_idle.poke()
+        # ESC al final de la ventana de medición (un hilo, como un jugador que vuelve)
+        timer = threading.Timer(seconds, lambda: pygame.event.post(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode="\x1b", scancode=41)))
+        timer.start()
+        c0, w0 = time.process_time(), time.perf_counter()
+        instrucciones.run(screen, assets)
+        return 100.0 * (time.process_time() - c0) / (time.perf_counter() - w0)
+
+    full = run_once(False)
+    throttled = run_once(True)
+    idle_share = max(0.0, seconds - idle_after) / seconds
+    print(f"CPU sin política: {full:.1f} % | con política: {throttled:.1f} % "
+          f"({idle_share:.0%} del tiempo inactivo, {IDLE_FPS} FPS en reposo)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="CPU de los menús con y sin ritmo de reposo")
+    ap.add_argument("--seconds", type=float, default=20.0)
+    ap.add_argument("--idle-after", type=float, default=2.0)
+    args = ap.parse_args()
+    _measure(args.seconds, args.idle_after)
@@ -1,20 +1,14 @@
 # instrucciones.py
 import pygame, math
 from pathlib import Path
+import asset_variants
+from quality import governor
+from idle import menu_idle
+from backdrop import backdrop
 from audio_shared import play_sfx  # <<< usamos el banco de SFX compartido
 
 def find_by_stem(assets_dir: Path, stem: str) -> Path | None:
-    exts = (".png", ".jpg", ".jpeg")
-    for ext in exts:
-        p = assets_dir / f"{stem}{ext}"
-        if p.exists():
-            return p
-    cands = []
-    for ext in exts:
-        cands += list(assets_dir.glob(f"{stem}*{ext}"))
-    if not cands:
-        return None
-    return sorted(cands, key=lambda p: len(p.name))[0]
+    return asset_variants.find(assets_dir, stem)
 
 def load_image(assets_dir: Path, stems: list[str]) -> pygame.Surface | None:
     for stem in stems:
@@ -33,12 +27,7 @@ def run(screen: pygame.Surface, assets_dir: Path) -> None:
     W, H = screen.get_size()
     clock = pygame.time.Clock()
 
-    bg_img = load_image(assets_dir, ["Background_f"])
-    if not bg_img:
-        raise FileNotFoundError("No encontré fondo para instrucciones")
-    background = bg_img.convert()
-    bg_w, _ = background.get_size()
-    scroll_x = 0; SCROLL_SPEED = 2
+    backdrop.load(assets_dir, (W, H))
 
     instr_img = load_image(assets_dir, ["instrucciones", "panel_instrucciones"])
     if not instr_img:
@@ -64,7 +53,7 @@ def run(screen: pygame.Surface, assets_dir: Path) -> None:
         mouse_pos = pygame.mouse.get_pos()
         clicked = False
 
-        for event in pygame.event.get():
+        for event in menu_idle.events():
             if event.type == pygame.QUIT:
                 return
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -73,10 +62,7 @@ def run(screen: pygame.Surface, assets_dir: Path) -> None:
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 clicked = True
 
-        scroll_x -= SCROLL_SPEED
-        if scroll_x <= -bg_w: scroll_x = 0
-        screen.blit(background, (scroll_x, 0))
-        screen.blit(background, (scroll_x + bg_w, 0))
+        backdrop.draw(screen)
 
         screen.blit(instr_img, instr_rect)
 
@@ -91,4 +77,5 @@ def run(screen: pygame.Surface, assets_dir: Path) -> None:
                 screen.blit(back_img, back_rect)
 
         pygame.display.flip()
-        clock.tick(60)
+        menu_idle.tick(clock)
+        governor.frame(menu_idle.work_ms)
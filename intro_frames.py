@@ -0,0 +1,240 @@
+# intro_frames.py
+# Almacén de frames pre-decodificados del intro.
+# Un paso opcional (python intro_frames.py) decodifica intro.mp4 una vez, ya
+# al tamaño exacto de la ventana, y lo guarda en cache/ como frames RGB
+# (crudos, zlib o LZ4) con un índice al final. Al reproducir, el archivo se
+# abre con mmap: un frame crudo se blitea directo desde el mapa, sin ffmpeg.
+#
+#   python intro_frames.py                 -> pre-render (zlib) para la ventana del juego
+#   python intro_frames.py --codec raw     -> sin compresión (más rápido, mucho más grande)
+#   python intro_frames.py --bench         -> compara con el camino MoviePy
+from __future__ import annotations
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+try:
+    import lz4.frame as _lz4
+except ImportError:
+    _lz4 = None
+
+from intro_player import CACHE_DIR, file_digest, fit_intro
+
+# Cabecera: magic, versión, ancho, alto, (reservado), fps, nº frames, códec, offset del índice
+_HEADER = struct.Struct("<4sHHHHdIBQ")
+_ENTRY = struct.Struct("<QI")          # offset, longitud por frame
+MAGIC = b"IFRM"
+VERSION = 1
+CODECS = {"raw": 0, "zlib": 1, "lz4": 2}
+_CODEC_NAMES = {v: k for k, v in CODECS.items()}
+
+
+def store_path(video_path: Path, screen_size: tuple[int, int], digest: Optional[str] = None) -> Path:
+    """Un almacén por (contenido del video, tamaño de ventana)."""
+    digest = digest or file_digest(video_path)
+    return CACHE_DIR / f"intro_frames_{digest}_{screen_size[0]}x{screen_size[1]}.bin"
+
+
+def write_store(dest: Path, frames: Iterable, size: tuple[int, int], fps: float,
+                codec: str = "zlib", level: int = 1) -> int:
+    """Escribe `frames` (RGB h*w*3) en `dest`. Devuelve el número de frames."""
+    if codec == "lz4" and _lz4 is None:
+        print("[INFO] lz4 no está instalado; usando zlib.")
+        codec = "zlib"
+    code = CODECS[codec]
+    w, h = size
+    expected = w * h * 3
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+    index: list[tuple[int, int]] = []
+    with open(part, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        for frame in frames:
+            data = memoryview(frame).cast("B")
+            if len(data) != expected:
+                raise ValueError(f"frame de {len(data)} bytes, se esperaban {expected}")
+            if code == 1:
+                data = zlib.compress(data, level)
+            elif code == 2:
+                data = _lz4.compress(data)
+            index.append((f.tell(), len(data)))
+            f.write(data)
+        index_at = f.tell()
+        for entry in index:
+            f.write(_ENTRY.pack(*entry))
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, w, h, 0, float(fps), len(index), code, index_at))
+    os.replace(part, dest)
+    return len(index)
+
+
+class FrameStore:
+    """Almacén abierto con mmap. Iterable: da cada frame como bytes-like RGB.
+    Con códec raw los frames son memoryviews del mapa (sin copia)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._f = open(self.path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, w, h, _, fps, count, code, index_at = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path.name} no es un almacén de frames válido")
+        if code == 2 and _lz4 is None:
+            self.close()
+            raise ValueError("el almacén usa lz4 y lz4 no está instalado")
+        self.size = (w, h)
+        self.fps = fps
+        self.codec = _CODEC_NAMES[code]
+        self._code = code
+        self._view = memoryview(self._mm)
+        self._index = [_ENTRY.unpack_from(self._mm, index_at + i * _ENTRY.size) for i in range(count)]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def frame(self, i: int):
+        off, n = self._index[i]
+        data = self._view[off:off + n]
+        if self._code == 1:
+            return zlib.decompress(data)
+        if self._code == 2:
+            return _lz4.decompress(data)
+        return data
+
+    def __iter__(self) -> Iterator:
+        for i in range(len(self._index)):
+            yield self.frame(i)
+
+    def close(self) -> None:
+        view = getattr(self, "_view", None)
+        self._view = None
+        try:
+            if view is not None:
+                view.release()
+            self._mm.close()
+        except BufferError:
+            pass   # alguien aún tiene un frame crudo; el mapa se libera con el GC
+        self._f.close()
+
+
+def open_store(video_path: Path, screen_size: tuple[int, int], digest: Optional[str] = None) -> Optional[FrameStore]:
+    """El almacén pre-renderizado para esta ventana, o None si no hay (o está dañado)."""
+    p = store_path(video_path, screen_size, digest)
+    if not p.exists():
+        return None
+    try:
+        return FrameStore(p)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"⚠️ Almacén de frames ignorado ({p.name}): {e}")
+        return None
+
+
+def _open_clip(video_path: Path, screen_size: tuple[int, int]):
+    try:
+        from moviepy import VideoFileClip
+    except ImportError:
+        from moviepy.editor import VideoFileClip
+    probe = VideoFileClip(str(video_path), audio=False)
+    vw, vh = probe.size
+    probe.close()
+    w, h = fit_intro((vw, vh), screen_size)
+    return VideoFileClip(str(video_path), target_resolution=(h, w), audio=False)
+
+
+def prerender(video_path: Path, screen_size: tuple[int, int], codec: str = "zlib") -> Path:
+    clip = _open_clip(video_path, screen_size)
+    try:
+        dest = store_path(video_path, screen_size)
+        n = write_store(dest, clip.iter_frames(fps=clip.fps, dtype="uint8"), tuple(clip.size), clip.fps, codec)
+    finally:
+        clip.close()
+    # Otras versiones del intro para esta misma ventana ya no sirven
+    for old in dest.parent.glob(f"intro_frames_*_{screen_size[0]}x{screen_size[1]}.bin"):
+        if old != dest:
+            old.unlink(missing_ok=True)
+    print(f"[OK] {n} frames ({codec}) -> {dest} ({dest.stat().st_size / 1e6:.1f} MB)")
+    return dest
+
+
+# ===== Pre-render / benchmark =====
+if __name__ == "__main__":
+    import argparse
+    import statistics
+    import time
+    import pygame
+
+    assets = Path(__file__).resolve().parent / "assets"
+    ap = argparse.ArgumentParser(description="Pre-render del intro a cache/")
+    ap.add_argument("--codec", choices=sorted(CODECS), default="zlib")
+    ap.add_argument("--screen", help="tamaño lógico AxB (por defecto, el preset de settings.json)")
+    ap.add_argument("--video", default=str(assets / "intro.mp4"))
+    ap.add_argument("--bench", action="store_true", help="comparar MoviePy vs almacén (raw/zlib/lz4)")
+    args = ap.parse_args()
+
+    video = Path(args.video)
+    if args.screen:
+        sw, sh = (int(v) for v in args.screen.lower().split("x"))
+    else:
+        import display
+        from settings import get_settings
+        preset = get_settings(assets).get("display_preset", display.DEFAULT_PRESET)
+        sw, sh = display.PRESETS.get(preset, display.PRESETS[display.DEFAULT_PRESET])
+
+    if not args.bench:
+        prerender(video, (sw, sh), args.codec)
+        raise SystemExit(0)
+
+    def measure(name: str, open_frames):
+        """Tiempo hasta el primer frame + intervalos entre frames (sin límite de fps).
+        Cada frame se copia a una Surface como hace IntroPlayer."""
+        t0 = time.perf_counter()
+        frames, closer = open_frames()
+        first = None
+        gaps = []
+        last = None
+        for fr in frames:
+            target.blit(pygame.image.frombuffer(fr, target.get_size(), "RGB"), (0, 0))
+            now = time.perf_counter()
+            if first is None:
+                first = (now - t0) * 1000
+            else:
+                gaps.append((now - last) * 1000)
+            last = now
+        fr = None
+        closer()
+        mean = statistics.fmean(gaps) if gaps else 0.0
+        jit = statistics.pstdev(gaps) if gaps else 0.0
+        print(f"  {name:<10} primer frame {first:8.1f} ms | frame {mean:6.2f} ms "
+              f"(σ {jit:5.2f}, máx {max(gaps, default=0):6.2f}) | {len(gaps) + 1} frames")
+
+    print(f"Intro {video.name}, ventana {sw}x{sh}")
+
+    def _moviepy():
+        clip = _open_clip(video, (sw, sh))
+        return clip.iter_frames(fps=clip.fps, dtype="uint8"), clip.close
+
+    clip = _open_clip(video, (sw, sh))
+    frames = [f.copy() for f in clip.iter_frames(fps=clip.fps, dtype="uint8")]
+    size, fps = tuple(clip.size), clip.fps
+    clip.close()
+    target = pygame.Surface(size)
+    measure("moviepy", _moviepy)
+    for codec in ("raw", "zlib", "lz4"):
+        if codec == "lz4" and _lz4 is None:
+            print("  lz4        (no instalado)")
+            continue
+        tmp = CACHE_DIR / f"bench_{codec}.bin"
+        t = time.perf_counter()
+        write_store(tmp, frames, size, fps, codec)
+        wt = time.perf_counter() - t
+
+        def _store(p=tmp):
+            st = FrameStore(p)
+            return st, st.close
+        measure(codec, _store)
+        print(f"  {'':<10} escrito en {wt:.2f} s, {tmp.stat().st_size / 1e6:.1f} MB")
+        tmp.unlink()
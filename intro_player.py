@@ -0,0 +1,272 @@
+# intro_player.py
+# Reproductor del video de introducción.
+# Un hilo decodifica los frames y los copia a un ring buffer de Surfaces ya
+# creadas (sin make_surface ni swapaxes por frame). El hilo principal sólo
+# presenta: el reloj es el del audio (mixer.music.get_pos) y, si va atrasado,
+# salta frames en vez de acumular retraso.
+# El audio del intro se extrae una sola vez a cache/ (WAV, por hash del video).
+from __future__ import annotations
+import hashlib
+import os
+import threading
+import time
+import pygame
+from pathlib import Path
+from typing import Iterable, Optional
+
+RING_SIZE = 8   # frames decodificados por adelantado
+CACHE_DIR = Path(__file__).resolve().parent / "cache"
+SCREEN_FILL = 0.85   # el intro ocupa el 85% de la ventana
+
+
+def fit_intro(video_size: tuple[int, int], screen_size: tuple[int, int]) -> tuple[int, int]:
+    """Tamaño del intro en pantalla: cabe en la ventana sin deformarse."""
+    vw, vh = video_size
+    sw, sh = screen_size
+    scale = min(sw / vw, sh / vh) * SCREEN_FILL
+    return int(vw * scale), int(vh * scale)
+
+
+# ---------- Audio del intro en caché ----------
+def file_digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def intro_audio_cache_path(video_path: Path, digest: Optional[str] = None) -> Path:
+    """Ruta del WAV cacheado para este intro.mp4 (cambia si cambia el video)."""
+    return CACHE_DIR / f"intro_audio_{digest or file_digest(video_path)}.wav"
+
+
+def extract_intro_audio(video_path: Path, dest: Path) -> bool:
+    """Extrae la pista de audio a `dest` (PCM, sin recodificar a MP3).
+    Escribe a un .part y lo renombra, así nunca queda un WAV a medias."""
+    try:
+        from moviepy import AudioFileClip
+    except ImportError:
+        from moviepy.editor import AudioFileClip
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part.wav")
+    try:
+        audio = AudioFileClip(str(video_path))
+    except Exception as e:   # el video no trae audio
+        print(f"[INFO] Intro sin audio utilizable: {e}")
+        return False
+    try:
+        audio.write_audiofile(str(part), fps=44100, codec="pcm_s16le", logger=None)
+    finally:
+        audio.close()
+    os.replace(part, dest)
+    # Los WAV de versiones anteriores del intro ya no sirven
+    for old in dest.parent.glob("intro_audio_*.wav"):
+        if old != dest:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return True
+
+
+def start_audio_extraction(video_path: Path, dest: Path) -> threading.Thread:
+    """Primer arranque: extrae en segundo plano mientras el video empieza sin sonido."""
+    def _work():
+        try:
+            if extract_intro_audio(video_path, dest):
+                print(f"[INFO] Audio del intro guardado en {dest}")
+        except Exception as e:
+            print(f"⚠️ No se pudo extraer el audio del intro: {e}")
+    th = threading.Thread(target=_work, name="intro-audio", daemon=True)
+    th.start()
+    return th
+
+
+class _FrameRing:
+    """Cola acotada sobre RING_SIZE Surfaces fijas. El worker escribe en la
+    ranura `head`, el hilo principal lee la `tail`; nunca la misma ranura."""
+
+    def __init__(self, size: tuple[int, int], slots: int = RING_SIZE):
+        self.size = size
+        self.surfs = [pygame.Surface(size) for _ in range(slots)]
+        self.frame_no = [0] * slots
+        self.ready_at = [0.0] * slots
+        self.head = 0          # total escritos
+        self.tail = 0          # total liberados
+        self.done = False      # el worker terminó (fin del video o error)
+        self.stop = False      # el hilo principal ya no quiere más frames
+        self._cv = threading.Condition()
+
+    def put(self, frame_no: int, pixels) -> bool:
+        """Copia un frame RGB (h, w, 3) contiguo a la siguiente ranura. False si hay que parar."""
+        n = len(self.surfs)
+        with self._cv:
+            while self.head - self.tail >= n and not self.stop:
+                self._cv.wait()
+            if self.stop:
+                return False
+            slot = self.head % n
+        # frombuffer no copia ni transpone: la Surface apunta a los bytes del frame
+        src = pygame.image.frombuffer(pixels, self.size, "RGB")
+        self.surfs[slot].blit(src, (0, 0))
+        self.frame_no[slot] = frame_no
+        self.ready_at[slot] = time.perf_counter()
+        with self._cv:
+            self.head += 1
+            self._cv.notify_all()
+        return True
+
+    def available(self) -> int:
+        return self.head - self.tail
+
+    def peek(self, k: int = 0) -> tuple[int, pygame.Surface, float]:
+        slot = (self.tail + k) % len(self.surfs)
+        return self.frame_no[slot], self.surfs[slot], self.ready_at[slot]
+
+    def release(self) -> None:
+        with self._cv:
+            self.tail += 1
+            self._cv.notify_all()
+
+    def finish(self) -> None:
+        with self._cv:
+            self.done = True
+            self._cv.notify_all()
+
+    def cancel(self) -> None:
+        with self._cv:
+            self.stop = True
+            self._cv.notify_all()
+
+
+class IntroPlayer:
+    """Reproduce `frames` (arrays/bytes RGB de `size`) a `fps`, centrado en `pos`.
+
+    run() devuelve "fin", "saltado" o "salir" (QUIT). Al terminar `stats`
+    tiene los contadores de decodificación, retraso y frames saltados.
+    """
+
+    def __init__(self, screen: pygame.Surface, frames: Iterable, fps: float,
+                 size: tuple[int, int], pos: tuple[int, int], *, use_audio_clock: bool = True):
+        self.screen = screen
+        self.frames = frames
+        self.fps = float(fps) if fps else 30.0
+        self.size = (int(size[0]), int(size[1]))
+        self.pos = pos
+        self.use_audio_clock = use_audio_clock
+        self.ring = _FrameRing(self.size)
+        self.stats = {"presentados": 0, "saltados": 0,
+                      "decode_ms_avg": 0.0, "decode_ms_max": 0.0,
+                      "retraso_ms_avg": 0.0, "retraso_ms_max": 0.0,
+                      "primer_frame_ms": 0.0}
+        self._decode_total = 0.0
+        self._decoded = 0
+        self.error: Optional[BaseException] = None
+
+    # ---------- worker ----------
+    def _decode(self) -> None:
+        ring = self.ring
+        try:
+            it = iter(self.frames)
+            n = 0
+            while True:
+                t0 = time.perf_counter()
+                try:
+                    pixels = next(it)
+                except StopIteration:
+                    break
+                # sólo decodificación; la espera por ring lleno no cuenta
+                dt = (time.perf_counter() - t0) * 1000.0
+                if not ring.put(n, pixels):
+                    break
+                self._decode_total += dt
+                self._decoded += 1
+                if dt > self.stats["decode_ms_max"]:
+                    self.stats["decode_ms_max"] = dt
+                n += 1
+        except Exception as e:   # se informa al terminar; el intro se corta sin colgar el juego
+            self.error = e
+        finally:
+            ring.finish()
+
+    # ---------- reloj ----------
+    def _clock(self, t_start: float) -> float:
+        """Segundos de reproducción: el audio manda si está sonando."""
+        if self.use_audio_clock:
+            try:
+                ms = pygame.mixer.music.get_pos()
+            except pygame.error:
+                ms = -1
+            if ms >= 0 and pygame.mixer.music.get_busy():
+                return ms / 1000.0
+        return time.perf_counter() - t_start
+
+    def run(self) -> str:
+        ring = self.ring
+        worker = threading.Thread(target=self._decode, name="intro-decoder", daemon=True)
+        t_open = time.perf_counter()
+        worker.start()
+        result = "fin"
+        t_start: Optional[float] = None
+        lat_total = 0.0
+
+        try:
+            while result == "fin":
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        result = "salir"
+                    elif event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) and result == "fin":
+                        result = "saltado"   # saltar intro
+                if result != "fin":
+                    break
+
+                if ring.available() == 0:
+                    if ring.done:
+                        break
+                    time.sleep(0.002)
+                    continue
+
+                if t_start is None:
+                    # el reloj arranca con el primer frame listo
+                    t_start = time.perf_counter()
+                    self.stats["primer_frame_ms"] = (t_start - t_open) * 1000.0
+
+                now = self._clock(t_start)
+                target = int(now * self.fps)
+                # Atrasados: descartar mientras ya haya uno más nuevo decodificado
+                while ring.available() > 1 and ring.peek(0)[0] < target:
+                    ring.release()
+                    self.stats["saltados"] += 1
+
+                frame_no, surf, _ = ring.peek(0)
+                due = frame_no / self.fps
+                if due > now:
+                    time.sleep(min(due - now, 0.01))
+                    continue
+
+                self.screen.fill((0, 0, 0))
+                self.screen.blit(surf, self.pos)
+                pygame.display.flip()
+                ring.release()
+
+                late = max(0.0, (self._clock(t_start) - due) * 1000.0)
+                lat_total += late
+                self.stats["presentados"] += 1
+                if late > self.stats["retraso_ms_max"]:
+                    self.stats["retraso_ms_max"] = late
+            return result
+        finally:
+            ring.cancel()
+            worker.join(timeout=1.0)
+            if self._decoded:
+                self.stats["decode_ms_avg"] = self._decode_total / self._decoded
+            if self.stats["presentados"]:
+                self.stats["retraso_ms_avg"] = lat_total / self.stats["presentados"]
+            s = self.stats
+            print(f"[INFO] Intro ({result}): {s['presentados']} frames, {s['saltados']} saltados, "
+                  f"primer frame {s['primer_frame_ms']:.0f} ms, "
+                  f"decode {s['decode_ms_avg']:.1f}/{s['decode_ms_max']:.1f} ms, "
+                  f"retraso {s['retraso_ms_avg']:.1f}/{s['retraso_ms_max']:.1f} ms (media/máx)")
+            if self.error is not None:
+                print(f"⚠️ [ERROR] Decodificando intro: {self.error}")
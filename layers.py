@@ -0,0 +1,148 @@
+# layers.py
+# Capas de dibujo de los niveles y un grupo que las dibuja en un solo blits().
+# Cada nivel dibujaba sus entidades a mano: un screen.blit() por basura,
+# semilla, hoyo, glow, jugador y objeto cargado, en un orden repartido por el
+# bucle (la basura cargada incluso se dibujaba dos veces). Aquí las entidades
+# viven en un LayeredBatch con su capa explícita; draw() arma la lista
+# (imagen, rect) en orden de capa y la entrega a Surface.blits() de una vez.
+# Las capas estáticas (el bote, los hoyos) guardan su lista armada hasta que
+# se agrega/quita algo o se llama touch().
+#
+#   python layers.py          -> costo por frame: blit a mano vs grupos
+#   python layers.py --sprites 400 --px 2   (sólo el costo de Python por blit)
+from __future__ import annotations
+import time
+from typing import Iterable, Optional
+import pygame
+
+# Orden de dibujo (de abajo hacia arriba)
+GLOW = 0       # halos: debajo de todo, como sombra luminosa
+PROPS = 1      # escenario fijo: bote, hoyos
+ITEMS = 2      # basura, semillas, plantas, herramientas
+PLAYER = 3
+CARRIED = 4    # lo que el jugador lleva en la mano
+UI = 5         # indicadores en el mundo (flechas)
+
+
+class Prop(pygame.sprite.Sprite):
+    """Sprite mínimo: imagen + rect (+ visible)."""
+
+    visible = True
+
+    def __init__(self, image: pygame.Surface, rect: Optional[pygame.Rect] = None, **anchor):
+        super().__init__()
+        self.image = image
+        self.rect = pygame.Rect(rect) if rect is not None else image.get_rect(**anchor)
+
+
+class LayeredBatch(pygame.sprite.LayeredUpdates):
+    """LayeredUpdates que dibuja con un solo Surface.blits().
+
+    - static: capas cuya lista (imagen, rect) se arma una vez. Si un sprite
+      de esas capas cambia de imagen, se reasigna el rect o cambia `visible`,
+      avisar con touch(capa).
+    - Los sprites con visible falso no se dibujan.
+    - draw() no devuelve rects sucios (los niveles redibujan todo el frame).
+    """
+
+    def __init__(self, *sprites, static: Iterable[int] = (), **kwargs):
+        self._static = frozenset(static)
+        self._batches: dict[int, list] = {}
+        super().__init__(*sprites, **kwargs)
+
+    def touch(self, layer: Optional[int] = None) -> None:
+        if layer is None:
+            self._batches.clear()
+        else:
+            self._batches.pop(layer, None)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.touch(self._spritelayers[sprite])
+
+    def remove_internal(self, sprite):
+        self._batches.pop(self._spritelayers.get(sprite), None)
+        super().remove_internal(sprite)
+
+    def change_layer(self, sprite, new_layer):
+        self._batches.pop(self._spritelayers.get(sprite), None)
+        super().change_layer(sprite, new_layer)
+        self.touch(new_layer)
+
+    def draw(self, surface: pygame.Surface, bgsurf=None, special_flags: int = 0) -> list:
+        seq = []
+        layer_of = self._spritelayers
+        done = None
+        for spr in self._spritelist:          # ya ordenada por capa
+            layer = layer_of[spr]
+            if layer in self._static:
+                if layer != done:
+                    batch = self._batches.get(layer)
+                    if batch is None:
+                        batch = self._batches[layer] = [
+                            (s.image, s.rect) for s in self.get_sprites_from_layer(layer)
+                            if getattr(s, "visible", True)]
+                    seq += batch
+                    done = layer
+            elif getattr(spr, "visible", True):
+                seq.append((spr.image, spr.rect))
+        if special_flags:
+            surface.blits([(img, r, None, special_flags) for img, r in seq], doreturn=False)
+        else:
+            surface.blits(seq, doreturn=False)
+        return []
+
+
+def _measure(n: int, frames: int, px: int) -> None:
+    """Blits a mano (como estaban los niveles) vs LayeredUpdates vs LayeredBatch.
+
+    Con sprites diminutos (--px 2) queda sólo el costo de Python por blit."""
+    import random
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    rng = random.Random(7)
+    imgs = []
+    for size in (px, px + px // 4, px + px // 2):
+        s = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(s, (90, 160, 90, 255), s.get_rect(), border_radius=6)
+        imgs.append(s.convert_alpha())
+
+    def sprites() -> list[tuple[Prop, int]]:
+        out = []
+        for i in range(n):
+            layer = (PROPS, GLOW, ITEMS)[i % 3]
+            out.append((Prop(imgs[i % 3], center=(rng.randrange(1280), rng.randrange(720))), layer))
+        return out
+
+    spr = sprites()
+    plain = [s for s, _ in spr]
+    stock = pygame.sprite.LayeredUpdates()
+    batch = LayeredBatch(static=(PROPS,))
+    for s, layer in spr:
+        stock.add(s, layer=layer)
+        batch.add(s, layer=layer)
+
+    def manual():
+        for s in plain:
+            screen.blit(s.image, s.rect)
+
+    for name, fn in (("blit a mano", manual),
+                     ("LayeredUpdates", lambda: stock.draw(screen)),
+                     ("LayeredBatch", lambda: batch.draw(screen))):
+        fn()
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            fn()
+        us = (time.perf_counter() - t0) * 1e6 / frames
+        print(f"{name:15s} {us:8.1f} µs/frame ({us / n:.2f} µs por sprite, {n} sprites de ~{px} px)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Costo de dibujar sprites por capas")
+    ap.add_argument("--sprites", type=int, default=60)
+    ap.add_argument("--frames", type=int, default=2000)
+    ap.add_argument("--px", type=int, default=44, help="lado de los sprites")
+    args = ap.parse_args()
+    _measure(args.sprites, args.frames, args.px)
@@ -0,0 +1,462 @@
+# levels/comun.py
+# Piezas que comparten todos los niveles: audio, carga de imágenes y del
+# personaje, el jugador, el HUD (paneles de tiempo/contador) y el menú de pausa.
+# Cada módulo de nivel traía su propia copia de todo esto con diferencias
+# mínimas; aquí hay una sola y las mecánicas (recolectar, plantar, reparar)
+# la importan. Lo que cambia entre niveles va en levels/definiciones.py.
+from __future__ import annotations
+import math
+import re
+from pathlib import Path
+from typing import Optional, Sequence
+import pygame
+import asset_variants
+import geometria
+from collision import CollisionMap, feet_size
+from text_cache import render_text
+
+# === Importar funciones de música (si existen) ===
+try:
+    from audio_shared import start_level_music, start_suspense_music, stop_level_music, play_sfx
+except ImportError:
+    print("WARN: No se pudo importar audio_shared. La música no funcionará.")
+    def start_level_music(assets_dir: Path): pass
+    def start_suspense_music(assets_dir: Path): pass
+    def stop_level_music(): pass
+    def play_sfx(*args, **kwargs): pass
+
+
+# ====== SFX click (VOLÚMEN AJUSTABLE) ======
+CLICK_VOL = 0.25
+
+def play_click(assets_dir: Path):
+    play_sfx("select", assets_dir, volume=CLICK_VOL)
+
+
+def volver_a_play(screen: pygame.Surface, assets_dir: Path) -> None:
+    """Regresa a la selección de nivel (play.py), como al terminar cada nivel."""
+    try:
+        import play
+        play.run(screen, assets_dir)
+    except ImportError:
+        pass
+
+
+# ---------- Helpers ----------
+def find_by_stem(folder: Path, stem: str, *, deep: bool = False) -> Optional[Path]:
+    """asset_variants.find(); con deep=True busca también en las subcarpetas de primer nivel."""
+    p = asset_variants.find(folder, stem)
+    if p is None and deep:
+        for sub in asset_variants.subfolders(folder):
+            p = asset_variants.find(sub, stem)
+            if p:
+                break
+    return p
+
+def find_first(folder: Path, stems: Sequence[str], *, deep: bool = False) -> Optional[Path]:
+    for stem in stems:
+        p = find_by_stem(folder, stem, deep=deep)
+        if p:
+            return p
+    return None
+
+def find_many_by_prefix(folder: Path, prefix: str) -> list[Path]:
+    exts = (".png", ".jpg", ".jpeg")
+    out: list[Path] = []
+    for ext in exts:
+        out += sorted(folder.glob(f"{prefix}*{ext}"))
+    return out
+
+def load_surface(p: Path) -> pygame.Surface:
+    img = pygame.image.load(str(p))
+    return img.convert_alpha() if p.suffix.lower() == ".png" else img.convert()
+
+def load_image(folder: Path, stems: Sequence[str], *, deep: bool = False) -> Optional[pygame.Surface]:
+    for stem in stems:
+        p = find_by_stem(folder, stem, deep=deep)
+        if p:
+            try:
+                return load_surface(p)
+            except pygame.error as e:
+                print(f"⚠️ No se pudo cargar {p.name}: {e}")
+    return None
+
+def scale_to_width(img: pygame.Surface, new_w: int) -> pygame.Surface:
+    r = new_w / img.get_width() if img.get_width() != 0 else 1.0
+    return pygame.transform.smoothscale(img, (new_w, max(1, int(img.get_height() * r))))
+
+def make_glow(radius: int, color=(255, 255, 120)) -> pygame.Surface:
+    s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    for rr in range(radius, 0, -1):
+        a = max(5, int(180 * (rr / radius) ** 2))
+        pygame.draw.circle(s, (*color, a), (radius, radius), rr)
+    return s
+
+def load_pixel_font(assets_dir: Path, H: int) -> pygame.font.Font:
+    """Fuente pixel-art de los mensajes grandes (Arial si no hay)."""
+    p = find_first(assets_dir, ("pixel", "press_start", "px"))
+    if p:
+        try:
+            return pygame.font.Font(str(p), max(24, int(H * 0.09)))
+        except Exception:
+            pass
+    return pygame.font.SysFont("arial", max(32, int(H * 0.09)), bold=True)
+
+def make_key_icon(assets_dir: Path, font: pygame.font.Font, W: int) -> pygame.Surface:
+    """Icono de la tecla E: imagen 'tecla_e' si existe, si no una E sobre fondo oscuro."""
+    img = load_image(assets_dir, ("tecla_e", "icon_e", "key_e", "teclaE"))
+    if img:
+        size = max(28, int(W * 0.035))
+        return pygame.transform.smoothscale(img, (size, size))
+    letter = font.render("E", True, (255, 255, 255))
+    bg = pygame.Surface((letter.get_width() + 16, letter.get_height() + 12), pygame.SRCALPHA)
+    pygame.draw.rect(bg, (0, 0, 0, 180), bg.get_rect(), border_radius=8)
+    bg.blit(letter, letter.get_rect(center=bg.get_rect().center))
+    return bg
+
+def load_char_frames(assets_dir: Path, target_h: int, *, char_folder: str = "PERSONAJE H") -> dict[str, list[pygame.Surface] | pygame.Surface]:
+    char_dir = assets_dir / char_folder
+    if not char_dir.exists():
+        alt_folder = "PERSONAJE H" if "M" in char_folder else "PERSONAJE M"
+        if (assets_dir / alt_folder).exists():
+            print(f"WARN: Carpeta '{char_folder}' no encontrada. Usando '{alt_folder}'.")
+            char_dir = assets_dir / alt_folder
+        else:
+            raise FileNotFoundError(f"No se encontró la carpeta 'assets/{char_folder}' ni una alternativa.")
+
+    if "M" in char_dir.name.upper():
+        prefix = "womanguardian"
+    else:
+        prefix = "ecoguardian"
+
+    def _load_seq(name: str) -> list[pygame.Surface]:
+        files: list[Path] = []
+        for ext in (".png", ".jpg", ".jpeg"):
+            files += list(char_dir.glob(f"{prefix}_{name}_[0-9]*{ext}"))
+        def _num(p: Path) -> int:
+            m = re.search(r"_(\d+)\.\w+$", p.name)
+            return int(m.group(1)) if m else 0
+        files.sort(key=_num)
+        return [load_surface(p) for p in files]
+
+    def _load_idle(name: str) -> Optional[pygame.Surface]:
+        for ext in (".png", ".jpg", ".jpeg"):
+            p = char_dir / f"{prefix}_{name}{ext}"
+            if p.exists():
+                return load_surface(p)
+        return None
+
+    right = _load_seq("walk_right")
+    left  = _load_seq("walk_left")
+    down  = _load_seq("walk_down")
+    up    = _load_seq("walk_up")
+
+    idle_right = _load_idle("right_idle")
+    idle_left  = _load_idle("left_idle")
+    idle_down  = _load_idle("down_idle")
+    idle_up    = _load_idle("up_idle")
+
+    if right and not left: left = [pygame.transform.flip(f, True, False) for f in right]
+    if left and not right: right = [pygame.transform.flip(f, True, False) for f in left]
+    if not down: down = right[:1] if right else []
+    if not up:   up   = right[:1] if right else []
+
+    if idle_right is None and right: idle_right = right[0]
+    if idle_left  is None and idle_right is not None: idle_left = pygame.transform.flip(idle_right, True, False)
+    if idle_down  is None and down:  idle_down = down[0]
+    if idle_up    is None and up:    idle_up   = up[0]
+
+    def _scale(f: pygame.Surface) -> pygame.Surface:
+        if f.get_height() == 0: return pygame.Surface((int(target_h * 0.7), target_h), pygame.SRCALPHA)
+        h = target_h
+        w = int(f.get_width() * (h / f.get_height()))
+        return pygame.transform.smoothscale(f, (w, h))
+
+    def _normalize(seq: list[pygame.Surface]) -> list[pygame.Surface]:
+        if not seq: return seq
+        max_w = max(f.get_width() for f in seq)
+        H = seq[0].get_height()
+        out = []
+        for f in seq:
+            canvas = pygame.Surface((max_w, H), pygame.SRCALPHA)
+            canvas.blit(f, f.get_rect(midbottom=(max_w // 2, H)))
+            out.append(canvas)
+        return out
+
+    def _normalize_single(s: Optional[pygame.Surface]) -> pygame.Surface:
+        if s is None:
+            return pygame.Surface((int(target_h * 0.7), target_h), pygame.SRCALPHA)
+        S = _scale(s)
+        canvas = pygame.Surface(S.get_size(), pygame.SRCALPHA)
+        canvas.blit(S, S.get_rect(midbottom=(canvas.get_width() // 2, canvas.get_height())))
+        return canvas
+
+    right = _normalize([_scale(f) for f in right])
+    left  = _normalize([_scale(f) for f in left])
+    down  = _normalize([_scale(f) for f in down])
+    up    = _normalize([_scale(f) for f in up])
+
+    return {
+        "right": right, "left": left, "down": down, "up": up,
+        "idle_right": _normalize_single(idle_right), "idle_left": _normalize_single(idle_left),
+        "idle_down": _normalize_single(idle_down), "idle_up": _normalize_single(idle_up),
+    }
+
+
+# ---------- Geometría y colisión ----------
+def load_geometry(assets_dir: Path, size: tuple[int, int], nivel: dict) -> Optional[dict]:
+    """Geometría horneada de la escena del nivel (geometria.para); None -> calcular desde `nivel`."""
+    return geometria.para(assets_dir, nivel.get("geometria"), size)
+
+
+def obstacle_rects(size: tuple[int, int], nivel: dict, geo: Optional[dict] = None) -> list[pygame.Rect]:
+    """Obstáculos del nivel en px de `size`: los horneados o nivel["obstaculos"] escalados."""
+    if geo is not None:
+        return list(geo["obstaculos"])
+    return [geometria.escalar(r, size) for r in nivel.get("obstaculos", ())]
+
+
+def build_collision(assets_dir: Path, size: tuple[int, int], nivel: dict,
+                    geo: Optional[dict] = None) -> Optional[CollisionMap]:
+    """Mapa de colisión del nivel. Con geometría horneada sólo se dibujan sus rects
+    (ya incluyen la máscara del artista y el bote). Si no: la máscara del artista
+    (nivel["colision"], PNG con transparencia) más obstacle_rects(). None si no hay nada."""
+    cmap = CollisionMap(size)
+    if geo is not None:
+        cmap.add_rects(geo["colision"])
+        return cmap if geo["colision"] else None
+    rects = obstacle_rects(size, nivel)
+    stem = nivel.get("colision")
+    p = find_by_stem(assets_dir, stem) if stem else None
+    if not rects and p is None:
+        return None
+    if p is not None:
+        try:
+            cmap.add_image(pygame.image.load(str(p)).convert_alpha())
+        except pygame.error as e:
+            print(f"⚠️ No se pudo cargar la máscara de colisión {p.name}: {e}")
+    cmap.add_rects(rects)
+    return cmap
+
+
+# ---------- Entidades ----------
+class Player(pygame.sprite.Sprite):
+    """Jugador de todos los niveles.
+
+    - invertido: las teclas mueven al lado contrario (nivel 3 difícil).
+    - colision: mapa del nivel (build_collision); choca con los pies, no con todo el sprite.
+    - carrying_image: lo que lleva en la mano; place_carried() lo coloca.
+    """
+    def __init__(self, frames: dict[str, list[pygame.Surface] | pygame.Surface], pos, bounds: pygame.Rect,
+                 speed: float = 320, anim_fps: float = 8.0, invertido: bool = False,
+                 colision: Optional[CollisionMap] = None):
+        super().__init__()
+        self.frames = frames
+        self.dir = "down"
+        self.frame_idx = 0
+        self.anim_timer = 0.0
+        self.anim_dt = 1.0 / max(1.0, anim_fps)
+        idle = self.frames.get("idle_down")
+        start_img = idle if isinstance(idle, pygame.Surface) else (self.frames["down"][0] if self.frames.get("down") else pygame.Surface((40, 60), pygame.SRCALPHA))
+        self.image = start_img
+        self.rect = self.image.get_rect(center=pos)
+        self.speed = speed
+        self.bounds = bounds
+        self.invertido = invertido
+        self.colision = colision
+        self.pies = feet_size(self.rect)
+        self.carrying_image: Optional[pygame.Surface] = None
+        self.place(pos)
+
+    def feet(self) -> pygame.Rect:
+        r = pygame.Rect((0, 0), self.pies)
+        r.midbottom = self.rect.midbottom
+        return r
+
+    def place(self, pos):
+        """Centra al jugador en `pos`; si cae sobre un obstáculo, lo mueve al hueco más cercano."""
+        self.rect.center = pos
+        if self.colision is not None:
+            self.rect.move_ip(self.colision.free_offset(self.feet()))
+
+    def handle_input(self, dt: float):
+        k = pygame.key.get_pressed()
+        dx = (k[pygame.K_d] or k[pygame.K_RIGHT]) - (k[pygame.K_a] or k[pygame.K_LEFT])
+        dy = (k[pygame.K_s] or k[pygame.K_DOWN])  - (k[pygame.K_w] or k[pygame.K_UP])
+        if self.invertido:
+            dx, dy = -dx, -dy
+
+        if dx or dy:
+            l = math.hypot(dx, dy)
+            dx, dy = dx / l, dy / l
+
+            # Los sprites "left"/"right" están nombrados al revés de hacia dónde miran
+            if abs(dx) >= abs(dy):
+                self.dir = "left" if dx > 0 else "right"
+            else:
+                self.dir = "down" if dy > 0 else "up"
+
+            mx, my = int(dx * self.speed * dt), int(dy * self.speed * dt)
+            if self.colision is not None:
+                mx, my = self.colision.move(self.feet(), mx, my)
+            self.rect.move_ip(mx, my)
+            self.rect.clamp_ip(self.bounds)
+
+            seq: list[pygame.Surface] = self.frames.get(self.dir, [])
+            self.anim_timer += dt
+            if self.anim_timer >= self.anim_dt:
+                self.anim_timer -= self.anim_dt
+                if seq:
+                    self.frame_idx = (self.frame_idx + 1) % len(seq)
+            if seq:
+                self.image = seq[self.frame_idx % len(seq)]
+        else:
+            idle_img = self.frames.get(f"idle_{self.dir}")
+            if isinstance(idle_img, pygame.Surface):
+                self.image = idle_img
+            else:
+                seq = self.frames.get(self.dir, [])
+                self.image = seq[0] if seq else self.image
+            self.frame_idx = 0
+
+        # Mantener los pies en el mismo sitio al cambiar de frame
+        self.rect = self.image.get_rect(midbottom=self.rect.midbottom)
+        self.rect.clamp_ip(self.bounds)
+
+    def _get_carry_anchor(self) -> tuple[int, int]:
+        rect = self.rect
+        cx = rect.centerx
+        cy = rect.centery + int(rect.height * 0.22)
+        if self.dir == "left": cx -= int(rect.width * 0.12); cy += int(rect.height * 0.02)
+        elif self.dir == "right": cx += int(rect.width * 0.12); cy += int(rect.height * 0.02)
+        elif self.dir == "up": cy += int(rect.height * 0.06)
+        else: cy += int(rect.height * 0.04)
+        return cx, cy
+
+    def place_carried(self, sprite: pygame.sprite.Sprite):
+        """Pone `sprite` (capa CARRIED) en la mano con carrying_image, o lo oculta."""
+        sprite.visible = self.carrying_image is not None
+        if sprite.visible:
+            sprite.image = self.carrying_image
+            sprite.rect = self.carrying_image.get_rect(center=self._get_carry_anchor())
+
+
+# ---------- HUD ----------
+TEXTO_TIMER = (20, 15, 10)
+TEXTO_ALERTA = (200, 40, 40)
+
+class Panel:
+    """Panel del HUD (temporizador, contador). La imagen se escala una vez por
+    tamaño; antes cada nivel hacía smoothscale del panel en cada frame."""
+
+    def __init__(self, image: Optional[pygame.Surface]):
+        self.image = image
+        self._scaled: Optional[pygame.Surface] = None
+
+    def draw(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
+        if self.image is None:
+            pygame.draw.rect(screen, (30, 20, 15), rect, border_radius=10)
+            pygame.draw.rect(screen, (210, 180, 140), rect.inflate(-10, -10), border_radius=8)
+            return
+        if self._scaled is None or self._scaled.get_size() != rect.size:
+            self._scaled = pygame.transform.smoothscale(self.image, rect.size)
+        screen.blit(self._scaled, rect.topleft)
+
+
+def draw_shadowed(screen: pygame.Surface, font: pygame.font.Font, text: str, color, center,
+                  shadow=(0, 0, 0), offset: int = 2) -> None:
+    sh = render_text(font, text, shadow)
+    screen.blit(sh, sh.get_rect(center=(center[0] + offset, center[1] + offset)))
+    txt = render_text(font, text, color)
+    screen.blit(txt, txt.get_rect(center=center))
+
+
+def draw_timer(screen: pygame.Surface, font: pygame.font.Font, panel: Panel, rect: pygame.Rect,
+               remaining_ms: int, alerta_ms: Optional[int] = None, shift: float = 0.0) -> None:
+    """Panel del tiempo con m:ss; en rojo desde alerta_ms (None = nunca).
+    shift corre el texto a la izquierda (fracción del ancho del panel)."""
+    secs = max(0, remaining_ms) // 1000
+    color = TEXTO_ALERTA if alerta_ms is not None and remaining_ms <= alerta_ms else TEXTO_TIMER
+    panel.draw(screen, rect)
+    draw_shadowed(screen, font, f"{secs // 60}:{secs % 60:02d}", color,
+                  (rect.centerx - int(rect.w * shift), rect.centery))
+
+
+def timer_rect(W: int, H: int, margin_y: Optional[int] = None) -> pygame.Rect:
+    """Esquina superior derecha, 18 % x 11 % de la pantalla."""
+    margin = int(W * 0.04)
+    w, h = int(W * 0.18), int(H * 0.11)
+    return pygame.Rect(W - margin - w, margin if margin_y is None else margin_y, w, h)
+
+
+def draw_hud_lines(screen: pygame.Surface, font: pygame.font.Font, lines: Sequence[str],
+                   pos: tuple[int, int] = (16, 25), step: int = 26) -> None:
+    for i, line in enumerate(lines):
+        y = pos[1] + i * step
+        screen.blit(render_text(font, line, (15, 15, 15)), (pos[0] + 2, y + 2))
+        screen.blit(render_text(font, line, (255, 255, 255)), (pos[0], y))
+
+
+# ---------- Pausa ----------
+class PauseMenu:
+    """Panel de pausa con Continuar / Reiniciar / Menú.
+
+    - draw(screen, mouse_pos, click): dibuja overlay, panel y hover; devuelve
+      "continuar", "reiniciar", "menu" o None.
+    El overlay, el panel escalado y los recortes de los botones se arman una
+    sola vez (antes: Surface del overlay y smoothscale del panel por frame).
+    Sin imagen del panel se dibujan botones grises con texto.
+    """
+
+    ACCIONES = ("continuar", "reiniciar", "menu")
+    TEXTOS = {"continuar": "Continuar", "reiniciar": "Reiniciar", "menu": "Menú"}
+
+    def __init__(self, assets_dir: Path, size: tuple[int, int], font: pygame.font.Font, overlay_alpha: int = 160):
+        W, H = size
+        self.font = font
+        stems = ("nivelA 2", "panel_pausa", "pausa_panel")
+        img = load_image(assets_dir / "PAUSA", stems) or load_image(assets_dir, stems)
+        self.overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, overlay_alpha))
+
+        pw, ph = int(W * 0.52), int(H * 0.52)
+        self.panel_rect = pygame.Rect(W // 2 - pw // 2, H // 2 - ph // 2, pw, ph)
+        self.panel = pygame.transform.smoothscale(img, (pw, ph)) if img else None
+
+        bw, bh = int(pw * 0.80), int(ph * 0.18)
+        self.buttons: dict[str, pygame.Rect] = {}
+        self.hover: dict[str, Optional[pygame.Surface]] = {}
+        for accion, fy in zip(self.ACCIONES, (0.40, 0.60, 0.80)):
+            r = pygame.Rect(0, 0, bw, bh)
+            r.center = (self.panel_rect.centerx, self.panel_rect.top + int(ph * fy))
+            self.buttons[accion] = r
+            self.hover[accion] = None
+            if self.panel is not None:
+                try:
+                    base = self.panel.subsurface(r.move(-self.panel_rect.x, -self.panel_rect.y))
+                    self.hover[accion] = pygame.transform.smoothscale(base, (int(bw * 1.05), int(bh * 1.05)))
+                except ValueError:
+                    pass
+
+    def draw(self, screen: pygame.Surface, mouse_pos, click: bool, overlay: bool = True) -> Optional[str]:
+        if overlay:
+            screen.blit(self.overlay, (0, 0))
+        if self.panel is not None:
+            screen.blit(self.panel, self.panel_rect)
+        else:
+            pygame.draw.rect(screen, (30, 20, 15), self.panel_rect, border_radius=16)
+            pygame.draw.rect(screen, (210, 180, 140), self.panel_rect.inflate(-10, -10), border_radius=14)
+
+        elegido = None
+        for accion, r in self.buttons.items():
+            hov = r.collidepoint(mouse_pos)
+            img = self.hover[accion]
+            if self.panel is None:
+                pygame.draw.rect(screen, (200, 200, 200) if hov else (150, 150, 150), r, border_radius=8)
+                txt = render_text(self.font, self.TEXTOS[accion], (0, 0, 0))
+                screen.blit(txt, txt.get_rect(center=r.center))
+            elif hov and img:
+                screen.blit(img, img.get_rect(center=r.center))
+            if hov and click and elegido is None:
+                elegido = accion
+        return elegido
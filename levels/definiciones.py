@@ -0,0 +1,128 @@
+# levels/definiciones.py
+# Definición de cada nivel: qué mecánica usa y con qué números.
+# Es lo único que cambiaba entre nivelN_facil y nivelN_dificil (tiempo,
+# cantidades, zonas, velocidad); levels/motor.py la pasa a la mecánica.
+#
+# Claves comunes:
+#   mecanica     módulo de levels/ con run(screen, assets_dir, personaje, dificultad, nivel)
+#   tiempo_ms    tiempo total del nivel
+#   alerta_ms    desde cuándo el temporizador se pone rojo (None = nunca)
+#   velocidad    px/s del jugador;  anim_fps: cuadros de caminata por segundo
+#   hud_titulo / hud_tiempo   claves de config.TRADUCCIONES del HUD
+#   obstaculos   rects (px a 1280x720, como sacar_coordenadas.py) donde no se
+#                puede pisar: bases de bancas, postes, troncos, edificios
+#   colision     stem de una máscara PNG opcional del artista (lo opaco bloquea)
+#   geometria    escena en assets/geometria/ (sacar_coordenadas.py). Si está
+#                horneada para la resolución, sus zonas, áreas de aparición,
+#                bote y obstáculos reemplazan a los de aquí; estos quedan como
+#                valores iniciales del editor y respaldo si falta el archivo
+#
+# El tutorial ("tutorial") recorre las tres escenas: `fases` son sus
+# definiciones (geometría, obstáculos, colisión, zonas) y las posiciones
+# (`inicio` por escena, `basura`, `semilla`, `hoyo`) son fracciones x, y de la
+# pantalla; `zona` es la zona de la plaza a reparar y `aviso_ms` el tiempo de
+# muestra que enseña el panel en el parque y la calle.
+from __future__ import annotations
+import pygame
+
+
+def _zonas_plaza(W: int, H: int) -> dict[str, pygame.Rect]:
+    """Zonas de la plaza del nivel 3 (edificios rotos) para una pantalla W x H."""
+    return {
+        "TL": pygame.Rect(0, 0, W // 4, H // 2 - 50),
+        "TM": pygame.Rect(W // 4, 0, W // 4, H // 2 - 50),
+        "BL": pygame.Rect(0, H // 2 + 20, W // 2, H // 2 - 50),
+        "BR": pygame.Rect(W * 2 // 3 + 80, H // 2 + 10, W // 3 - 80, H // 2 - 50),
+    }
+
+
+# Zonas seguras para hoyos y semillas en la calle del nivel 2 (px)
+_ACERAS_CALLE = ((80, 380, 150, 80), (330, 380, 830, 80), (80, 540, 1000, 140))
+
+# Obstáculos medidos sobre cada fondo a 1280x720 (sólo la base: se choca con los pies)
+_OBSTACULOS_PARQUE = (
+    (0, 0, 1280, 100),                             # calle y seto
+    (335, 140, 110, 50), (908, 140, 110, 48),      # bancas
+    (75, 285, 45, 22), (68, 478, 62, 22),          # postes
+    (492, 645, 45, 55), (787, 645, 45, 55),        # troncos
+)
+_OBSTACULOS_CALLE = (
+    (0, 0, 1280, 200),                             # fachadas
+    (92, 232, 22, 20), (1205, 228, 18, 20),        # árboles de la acera
+    (423, 240, 94, 36), (842, 240, 102, 36),       # bancas de arriba
+    (140, 400, 24, 20), (1062, 400, 24, 20),       # postes
+    (925, 480, 45, 25),                            # árbol del centro
+    (97, 495, 108, 42),                            # banca de abajo
+    (940, 590, 110, 50),                           # bicicleta
+)
+_OBSTACULOS_PLAZA = (
+    (0, 0, 1280, 22),                              # muro
+    (75, 30, 178, 195), (395, 15, 212, 205),       # edificios rotos de arriba
+    (930, 25, 265, 190), (1020, 240, 192, 200),    # casas de la derecha
+    (40, 390, 185, 280), (258, 555, 220, 165),     # casas de abajo
+    (995, 465, 212, 250),                          # edificio roto de abajo
+    (540, 345, 180, 90),                           # fuente
+    (307, 333, 116, 62), (785, 443, 115, 66),      # bancas
+    (885, 190, 20, 20), (237, 485, 18, 18),        # postes
+    (320, 150, 25, 20), (100, 335, 25, 20), (195, 335, 25, 20), (815, 170, 20, 25),
+    (970, 420, 25, 20), (335, 495, 20, 15), (795, 670, 20, 30), (920, 690, 20, 30),   # troncos
+)
+
+_PARQUE = dict(
+    mecanica="recolectar",
+    geometria="parque",
+    hud_titulo="txt_park_hud_title",
+    obstaculos=_OBSTACULOS_PARQUE,
+    colision="colision_parque",
+    victoria="win_level1",                # asset_variants.localized()
+    derrota="lose_level1",                # clave traducida del archivo en PANTALLA LOSE
+)
+
+_CALLE = dict(
+    mecanica="plantar",
+    geometria="calle",
+    hud_titulo="txt_calle_hud_title",
+    zonas_spawn=_ACERAS_CALLE,
+    obstaculos=_OBSTACULOS_CALLE,
+    colision="colision_calle",
+    alerta_ms=30_000,
+)
+
+_PLAZA = dict(
+    mecanica="reparar",
+    geometria="plaza",
+    zonas=_zonas_plaza,
+    obstaculos=_OBSTACULOS_PLAZA,
+    colision="colision_plaza",
+    alerta_ms=30_000,
+    anim_fps=8.0,
+)
+
+NIVELES: dict[str, dict] = {
+    "nivel1_facil": dict(_PARQUE, tiempo_ms=80_000, alerta_ms=None, basuras=6,
+                         zona_basura=(0.18, 0.50, 0.82, 0.86),   # fracciones x0, y0, x1, y1
+                         escala_basura=0.035, interaccion=0.055,  # fracciones del ancho
+                         velocidad=320, anim_fps=8.0, hud_tiempo="txt_facil_tiempo"),
+    "nivel1_dificil": dict(_PARQUE, tiempo_ms=70_000, alerta_ms=30_000, basuras=12,
+                           zona_basura=(0.16, 0.46, 0.84, 0.86),
+                           escala_basura=0.032, interaccion=0.05,
+                           velocidad=340, anim_fps=9.0, hud_tiempo="txt_dificil_tiempo"),
+
+    "nivel2_facil": dict(_CALLE, tiempo_ms=80_000, semillas=5, hoyos=5,
+                         velocidad=320, anim_fps=8.0, hud_tiempo="txt_facil_tiempo",
+                         etiqueta_mano=None),
+    "nivel2_dificil": dict(_CALLE, tiempo_ms=70_000, semillas=8, hoyos=8,
+                           velocidad=340, anim_fps=9.0, hud_tiempo="txt_dificil_tiempo",
+                           etiqueta_mano="txt_semilla_mano"),
+
+    "nivel3_facil": dict(_PLAZA, tiempo_ms=70_000, velocidad=300, margen=20,
+                         herramienta=False, controles_invertidos=False),
+    "nivel3_dificil": dict(_PLAZA, tiempo_ms=50_000, velocidad=340, margen=50,
+                           herramienta=True, controles_invertidos=True),
+
+    "tutorial": dict(mecanica="tutorial", fases=(_PARQUE, _CALLE, _PLAZA),
+                     tiempo_ms=50_000, alerta_ms=10_000, aviso_ms=10_000,
+                     velocidad=320, anim_fps=8.0, interaccion=0.06, escala_basura=0.035,
+                     inicio=((0.50, 0.50), (0.50, 0.50), (0.50, 0.70)),
+                     basura=(0.50, 0.80), semilla=(0.25, 0.83), hoyo=(0.45, 0.58), zona="BR"),
+}
@@ -0,0 +1,24 @@
+# levels/motor.py
+# Motor de niveles: busca la definición del nivel y se la pasa a su mecánica.
+# Los módulos nivelN_* que importa main.py son sólo la entrada: todos llaman
+# a run() con su nombre, así que compilar/cargar un nivel ya no arrastra su
+# propia copia del jugador, el HUD, la pausa y los cargadores.
+#
+#   python -m levels.motor    -> niveles definidos y su mecánica
+from __future__ import annotations
+import importlib
+from pathlib import Path
+import pygame
+from levels.definiciones import NIVELES
+
+
+def run(nombre: str, screen: pygame.Surface, assets_dir: Path, personaje: str, dificultad: str):
+    nivel = NIVELES[nombre]
+    # La mecánica se importa al entrar al nivel: el menú no paga por las tres
+    mecanica = importlib.import_module(f"levels.{nivel['mecanica']}")
+    return mecanica.run(screen, assets_dir, personaje, dificultad, nivel)
+
+
+if __name__ == "__main__":
+    for nombre, nivel in NIVELES.items():
+        print(f"{nombre:16s} {nivel['mecanica']:11s} {nivel['tiempo_ms'] // 1000:3d} s")
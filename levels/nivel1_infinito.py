@@ -0,0 +1,384 @@
+from __future__ import annotations
+import pygame, math, random, sys, time
+from pathlib import Path
+from typing import Optional
+import config
+from text_cache import render_text, tr_text
+from quality import governor
+from spatial_grid import SpatialGrid
+from entity_store import EntityStore, HIDDEN
+
+# === Reutilizamos los helpers comunes y los cargadores del nivel 1 ===
+from levels.comun import (
+    play_click, find_by_stem, load_surface, scale_to_width, make_glow,
+    load_char_frames, Player, CLICK_VOL,
+)
+from levels.recolectar import load_bg_fit, load_trash_images
+
+try:
+    from audio_shared import start_level_music, stop_level_music, play_sfx, voice_stats
+except ImportError:
+    def start_level_music(assets_dir: Path): pass
+    def stop_level_music(): pass
+    def play_sfx(*args, **kwargs): pass
+    def voice_stats(): return {}
+
+# ---------- Parámetros del modo infinito (stress) ----------
+WORLD_SCREENS = 3        # el parque mide 3 pantallas de ancho; la cámara sigue al jugador
+WAVE_INTERVAL = 4.0      # segundos entre oleadas
+WAVE_BASE = 40           # basuras de la primera oleada
+WAVE_GROWTH = 1.5        # cada oleada trae 1.5x la anterior
+MAX_ACTIVE = 5000        # tope de basuras activas a la vez
+GLOW_LO, GLOW_HI = 70, 170   # rango de alpha del pulso del glow
+INDEX_CELL = 128         # px por celda del índice espacial
+SPAWN_TOP, SPAWN_BOTTOM = 0.46, 0.86   # franja del pasto donde caen (fracción de H)
+CHUNK_W = 256            # px de ancho de cada trozo pre-dibujado
+READOUT_EVERY = 0.25     # s entre refrescos de los números del HUD
+DROP_MS = 2.0            # ms por frame para que caiga la oleada (dibujar cada basura en su trozo)
+
+
+def _build_glow_bank(imgs: list[pygame.Surface]) -> list[pygame.Surface]:
+    """Por cada tipo de basura, su glow ya multiplicado por el alpha máximo del pulso."""
+    bank: list[pygame.Surface] = []
+    for img in imgs:
+        g = make_glow(int(max(img.get_width(), img.get_height()) * 0.9))
+        g.fill((255, 255, 255, GLOW_HI), special_flags=pygame.BLEND_RGBA_MULT)
+        bank.append(g.convert_alpha())
+    return bank
+
+
+class TrashChunks:
+    """Basuras quietas pre-dibujadas en trozos de CHUNK_W px del mundo.
+
+    Con miles de basuras, un blit por basura (y otro por su glow de ~2x su
+    tamaño) no cabía en 16.7 ms aunque el gobernador apagara el glow. Como
+    las basuras no se mueven, se dibujan una vez en el trozo que les toca y
+    por frame sólo se pegan los trozos visibles (dos capas: glows y sprites).
+    - add(i): se dibuja en su(s) trozo(s) al aparecer.
+    - remove(i): sólo el área de su glow se borra y se vuelve a dibujar con las
+      basuras vecinas del índice espacial (redibujar el trozo entero ~18 ms).
+    - El glow pulsa por trozo (alpha de la capa) en vez de por basura.
+    """
+
+    def __init__(self, world_w: int, band: pygame.Rect, store: EntityStore, index: SpatialGrid,
+                 imgs: list[pygame.Surface], glows: list[pygame.Surface], margin: int):
+        self.band = band
+        self.store, self.index = store, index
+        self.imgs, self.glows = imgs, glows
+        self.glow_half = [(g.get_width() // 2, g.get_height() // 2) for g in glows]
+        self.margin = margin
+        self.rects = [pygame.Rect(x, band.y, min(CHUNK_W, world_w - x), band.h)
+                      for x in range(0, world_w, CHUNK_W)]
+        self.items = [pygame.Surface(r.size, pygame.SRCALPHA) for r in self.rects]
+        self.glow_layers = [pygame.Surface(r.size, pygame.SRCALPHA) for r in self.rects]
+        self.dirty: list[pygame.Rect] = []
+
+    def _reach(self, rect: pygame.Rect) -> pygame.Rect:
+        """Lo que puede pintar una basura con ese rect (su glow incluido)."""
+        return rect.inflate(self.margin * 2, self.margin * 2)
+
+    def _chunks(self, r: pygame.Rect) -> range:
+        return range(max(0, r.left // CHUNK_W), min(len(self.rects), (r.right - 1) // CHUNK_W + 1))
+
+    def clear(self) -> None:
+        for surf in self.items + self.glow_layers:
+            surf.fill((0, 0, 0, 0))
+        self.dirty.clear()
+
+    def add(self, i: int) -> None:
+        self._stamp(i, self._chunks(self._reach(self.store.rect(i))))
+
+    def remove(self, i: int) -> None:
+        self.dirty.append(self._reach(self.store.rect(i)))
+
+    def _stamp(self, i: int, chunks) -> None:
+        k = int(self.store.kind[i])
+        cx, cy = self.store.center(i)
+        r = self.store.rect(i)
+        for c in chunks:
+            x0, y0 = self.rects[c].topleft
+            self.glow_layers[c].blit(self.glows[k], (cx - self.glow_half[k][0] - x0, cy - self.glow_half[k][1] - y0))
+            self.items[c].blit(self.imgs[k], (r.x - x0, r.y - y0))
+
+    def update(self) -> None:
+        for area in self.dirty:
+            clips = self._chunks(area)
+            for c in clips:
+                clip = area.move(-self.rects[c].x, -self.rects[c].y)
+                for surf in (self.items[c], self.glow_layers[c]):
+                    surf.set_clip(clip)
+                    surf.fill((0, 0, 0, 0))
+            # Las vecinas en orden de inserción, como se hornearon
+            for i in self.index.query_rect(self._reach(area)):
+                self._stamp(i, clips)
+            for c in clips:
+                self.items[c].set_clip(None)
+                self.glow_layers[c].set_clip(None)
+        self.dirty.clear()
+
+    def draw_glows(self, screen: pygame.Surface, view: pygame.Rect, t: float) -> None:
+        ox = -view.x
+        for c in self._chunks(view):
+            layer = self.glow_layers[c]
+            # La capa está horneada a GLOW_HI: su alpha la lleva a GLOW_LO..GLOW_HI
+            pulse = (math.sin(t + c * 1.3) + 1) / 2
+            layer.set_alpha(int(255 * (GLOW_LO + (GLOW_HI - GLOW_LO) * pulse) / GLOW_HI))
+            screen.blit(layer, self.rects[c].move(ox, 0))
+
+    def draw_items(self, screen: pygame.Surface, view: pygame.Rect) -> None:
+        ox = -view.x
+        screen.blits([(self.items[c], self.rects[c].move(ox, 0)) for c in self._chunks(view)], doreturn=False)
+
+
+# ---------- NIVEL 1: PARQUE INFINITO ----------
+def run(screen: pygame.Surface, assets_dir: Path, personaje: str = "EcoGuardian", dificultad: str = "Infinito"):
+    pygame.font.init()
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont("arial", 26, bold=True)
+    small_font = pygame.font.SysFont("arial", 20, bold=True)
+    popup_font = pygame.font.SysFont("arial", 28, bold=True)
+
+    W, H = screen.get_size()
+    WORLD_W = W * WORLD_SCREENS
+    background, bg_rect = load_bg_fit(assets_dir, W, H)
+    background_flip = pygame.transform.flip(background, True, False)
+
+    # Botes: uno por pantalla del parque
+    bin_p = (find_by_stem(assets_dir, "basurero")
+             or find_by_stem(assets_dir, "bote_basura")
+             or find_by_stem(assets_dir, "trash_bin"))
+    if bin_p:
+        bin_img = scale_to_width(load_surface(bin_p), int(W * 0.24))
+    else:
+        bin_img = pygame.Surface((int(W * 0.15), int(W * 0.20)), pygame.SRCALPHA)
+        pygame.draw.rect(bin_img, (90, 90, 90), bin_img.get_rect(), border_radius=12)
+    bin_rects = []
+    for i in range(WORLD_SCREENS):
+        r = bin_img.get_rect()
+        r.bottomright = (i * W + W - int(W * 0.015), H - int(W * 0.03))
+        bin_rects.append(r)
+    BIN_RADIUS = max(36, int(W * 0.05))
+
+    # Tipos de basura (escalados una sola vez) + banco de glows compartido
+    raw_trash = load_trash_images(assets_dir)
+    if not raw_trash:
+        for col in [(160, 160, 160), (70, 160, 70), (60, 130, 200)]:
+            s = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.rect(s, col, (4, 4, 32, 32), border_radius=6)
+            raw_trash.append(s)
+    trash_imgs = [scale_to_width(img, int(W * 0.035)) for img in raw_trash]
+    glow_bank = _build_glow_bank(trash_imgs)
+    glow_margin = max(max(g.get_width(), g.get_height()) // 2 for g in glow_bank)
+
+    frames = load_char_frames(assets_dir, target_h=int(H * 0.14), char_folder=personaje)
+    player = Player(frames, (int(W * 0.16), int(H * 0.75)), pygame.Rect(0, 0, WORLD_W, H), speed=320, anim_fps=8.0)
+
+    PICK_KEYS = (pygame.K_e, pygame.K_RETURN)
+    INTERACT_DIST = int(W * 0.055)
+    # Basuras como índices de un EntityStore (posición y tipo en arreglos);
+    # imagen y glow se comparten por `kind`. El índice espacial guarda esos índices
+    # y los trozos las tienen ya dibujadas.
+    store = EntityStore(1024)
+    trash_index = SpatialGrid(INDEX_CELL)
+    band = pygame.Rect(0, 0, WORLD_W, H).clip(
+        pygame.Rect(0, int(H * SPAWN_TOP) - glow_margin - 1, WORLD_W,
+                    int(H * (SPAWN_BOTTOM - SPAWN_TOP)) + glow_margin * 2 + 2))
+    chunks = TrashChunks(WORLD_W, band, store, trash_index, trash_imgs, glow_bank, glow_margin)
+
+    carrying: Optional[int] = None
+    delivered = 0
+    wave = 0
+    wave_timer = 0.0
+    to_drop = 0          # basuras de la oleada que aún no caen
+    paused = False
+    t = 0.0
+
+    icon_e_letter = popup_font.render("E", True, (255, 255, 255))
+    icon_bg = pygame.Surface((icon_e_letter.get_width() + 18, icon_e_letter.get_height() + 12), pygame.SRCALPHA)
+    pygame.draw.rect(icon_bg, (0, 0, 0, 180), icon_bg.get_rect(), border_radius=8)
+    icon_bg.blit(icon_e_letter, icon_e_letter.get_rect(center=icon_bg.get_rect().center))
+
+    def spawn_wave():
+        nonlocal wave, to_drop
+        wave += 1
+        room = MAX_ACTIVE - len(trash_index) - to_drop
+        to_drop += max(0, min(room, int(WAVE_BASE * (WAVE_GROWTH ** (wave - 1)))))
+
+    def drop_trash():
+        # La oleada cae a lo largo de unos frames: cada basura se dibuja en su
+        # trozo al caer, así una oleada de miles no cuesta un frame de 30 ms
+        nonlocal to_drop
+        until = time.perf_counter() + DROP_MS / 1000.0
+        while to_drop and time.perf_counter() < until:
+            to_drop -= 1
+            kind = random.randrange(len(trash_imgs))
+            img = trash_imgs[kind]
+            x = random.randint(int(W * 0.05), WORLD_W - int(W * 0.05))
+            y = random.randint(int(H * SPAWN_TOP), int(H * SPAWN_BOTTOM))
+            i = store.add((x, y), img.get_size(), kind=kind)
+            trash_index.insert(i, store.rect(i))
+            chunks.add(i)
+
+    def reset_level():
+        nonlocal carrying, delivered, wave, wave_timer, to_drop
+        trash_index.clear()
+        store.clear()
+        chunks.clear()
+        carrying = None
+        delivered = 0
+        wave = 0
+        wave_timer = 0.0
+        to_drop = 0
+        player.rect.center = (int(W * 0.16), int(H * 0.75))
+        spawn_wave()
+
+    start_level_music(assets_dir)
+    reset_level()
+
+    frame_ms = 0.0   # media móvil del trabajo por frame (update + dibujo)
+    # Números del HUD (contadores, ms/frame, voces): cambian cada frame, así que
+    # no pasan por la caché de texto; se renderizan unas veces por segundo
+    readout: list[tuple[pygame.Surface, pygame.Surface]] = []
+    readout_timer = 0.0
+    view = pygame.Rect(0, 0, W, H)
+
+    while True:
+        dt = min(clock.tick(60) / 1000.0, 0.033)
+        work_start = time.perf_counter()
+        t += dt
+        interact = False
+
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                stop_level_music()
+                return None
+            if e.type == pygame.KEYDOWN:
+                if e.key == pygame.K_ESCAPE:
+                    play_click(assets_dir)
+                    stop_level_music()
+                    return None
+                if e.key == pygame.K_SPACE:
+                    paused = not paused
+                    play_click(assets_dir)
+                if e.key == pygame.K_r and paused:
+                    reset_level()
+                    paused = False
+                if e.key in PICK_KEYS and not paused:
+                    interact = True
+
+        if not paused:
+            wave_timer += dt
+            if wave_timer >= WAVE_INTERVAL:
+                wave_timer -= WAVE_INTERVAL
+                spawn_wave()
+            drop_trash()
+
+            player.handle_input(dt)
+            if carrying is not None:
+                store.set_center(carrying, player._get_carry_anchor())
+
+            if interact:
+                if carrying is None:
+                    nearest = trash_index.nearest(player.rect.center, INTERACT_DIST)
+                    if nearest is not None:
+                        trash_index.remove(nearest)
+                        chunks.remove(nearest)
+                        store.set_flag(nearest, HIDDEN)
+                        carrying = nearest
+                        play_sfx("select", assets_dir, volume=CLICK_VOL, category="game")
+                else:
+                    pc = player.rect.center
+                    for br in bin_rects:
+                        if math.hypot(pc[0] - br.centerx, pc[1] - br.centery) <= BIN_RADIUS * 1.2:
+                            store.remove(carrying)
+                            carrying = None
+                            delivered += 1
+                            play_sfx("select", assets_dir, volume=CLICK_VOL, category="game", priority=2)
+                            break
+
+        # Cámara horizontal
+        view.x = max(0, min(WORLD_W - W, player.rect.centerx - W // 2))
+        ox = -view.x
+
+        # DIBUJO: fondo (sólo las pantallas visibles, alternando espejo para ocultar la costura)
+        screen.fill((34, 45, 38))
+        first = view.x // W
+        for i in (first, first + 1):
+            if 0 <= i < WORLD_SCREENS:
+                img = background if i % 2 == 0 else background_flip
+                screen.blit(img, (bg_rect.x + i * W + ox, bg_rect.y))
+
+        for br in bin_rects:
+            if br.colliderect(view):
+                screen.blit(bin_img, br.move(ox, 0))
+
+        # Basuras: sólo los trozos visibles, ya con todas dibujadas (glows y sprites)
+        chunks.update()
+        if governor.glow:
+            chunks.draw_glows(screen, view, governor.anim_time(t))
+        chunks.draw_items(screen, view)
+
+        screen.blit(player.image, player.rect.move(ox, 0))
+        if carrying is not None:
+            screen.blit(trash_imgs[int(store.kind[carrying])], store.rect(carrying).move(ox, 0))
+
+        if carrying is None and not paused:
+            nearest = trash_index.nearest(player.rect.center, INTERACT_DIST)
+            if nearest is not None:
+                nr = store.rect(nearest)
+                ib_rect = icon_bg.get_rect(center=(nr.centerx + ox, nr.top - int(H * 0.03)))
+                screen.blit(icon_bg, ib_rect)
+
+        # HUD: título, contador en vivo y lectura de tiempo por frame
+        hud = [
+            f"{config.obtener_nombre('txt_park_hud_title')} {config.obtener_nombre('txt_infinito')}",
+            config.obtener_nombre('txt_mover_accion_pausa'),
+        ]
+        for i, line in enumerate(hud):
+            screen.blit(render_text(font, line, (15, 15, 15)), (16 + 2, 25 + i * 26 + 2))
+            screen.blit(render_text(font, line, (255, 255, 255)), (16, 25 + i * 26))
+
+        readout_timer -= dt
+        if readout_timer <= 0:
+            readout_timer = READOUT_EVERY
+            lines = [
+                f"{config.obtener_nombre('txt_activas')} {len(store)}   "
+                f"{config.obtener_nombre('txt_entregadas')} {delivered}   "
+                f"{config.obtener_nombre('txt_oleada')} {wave}",
+                f"{frame_ms:5.1f} ms/frame   {clock.get_fps():4.0f} FPS   "
+                f"({len(trash_index.broad_phase(view))} {config.obtener_nombre('txt_en_vista')})   "
+                f"{config.obtener_nombre('txt_calidad')} {governor.tier}",
+            ]
+            vs = voice_stats().get("game")
+            if vs:
+                lines.append(f"SFX {vs['en_uso']}/{vs['canales']} {config.obtener_nombre('txt_voces')}   "
+                             f"{vs['robos_s']:.0f} {config.obtener_nombre('txt_robos_s')}")
+            readout = [(small_font.render(line, True, (15, 15, 15)), small_font.render(line, True, (255, 255, 255)))
+                       for line in lines]
+        for i, (shadow, txt) in enumerate(readout):
+            y = 25 + 2 * 26 + i * 22
+            screen.blit(shadow, (16 + 2, y + 2))
+            screen.blit(txt, (16, y))
+
+        if paused:
+            overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            screen.blit(overlay, (0, 0))
+            txt = tr_text(font, "txt_pausa_menu", (255, 255, 255))
+            screen.blit(txt, txt.get_rect(center=(W // 2, H // 2)))
+
+        pygame.display.flip()
+        work_ms = (time.perf_counter() - work_start) * 1000.0
+        frame_ms = frame_ms * 0.9 + work_ms * 0.1
+        governor.frame(work_ms)
+
+
+# === Ejecutable suelto para pruebas de rendimiento (python -m levels.nivel1_infinito) ===
+if __name__ == "__main__":
+    pygame.init()
+    ASSETS_PATH = Path(__file__).resolve().parent.parent / "assets"
+    SCREEN = pygame.display.set_mode((1280, 720))
+    pygame.display.set_caption("Nivel 1: Parque infinito (stress)")
+    run(SCREEN, ASSETS_PATH, personaje="PERSONAJE H")
+    pygame.quit()
+    sys.exit()
@@ -0,0 +1,503 @@
+# levels/plantar.py
+# Mecánica "plantar y crecer" (nivel 2): semillas sueltas por la calle, el
+# jugador las lleva a los hoyos y cada una crece en árbol en GROW_STEPS pasos.
+# Cantidades, tiempo, velocidad y zonas de aparición vienen de la definición
+# del nivel (levels/definiciones.py).
+from __future__ import annotations
+import math
+import random
+from pathlib import Path
+from typing import Optional, List, Tuple
+import pygame
+import config
+from text_cache import tr_text
+from quality import governor
+from fades import FadeSprite, message, pulse, tr_label
+from end_screens import EndScreens
+from spatial_grid import SpatialGrid
+from poisson_disk import poisson_disk_points
+from entity_store import EntityStore, GlowBank, HIDDEN, DONE, glow_steps
+from scheduler import Scheduler
+import layers
+from levels.comun import (
+    start_level_music, start_suspense_music, stop_level_music, play_sfx, volver_a_play,
+    find_first, load_image, scale_to_width, make_glow, load_pixel_font, make_key_icon,
+    load_char_frames, load_geometry, build_collision, obstacle_rects, Player, Panel, PauseMenu,
+    draw_timer, timer_rect, draw_hud_lines, draw_shadowed,
+)
+
+# === CONSTANTES ===
+ASSET_STEMS = {
+    "fondo":       ["n2_fondo_calle"],
+    "hoyo":        ["n2_hoyo"],
+    "semilla":     ["n2_semilla"],
+    "arbol":       ["n2_arbol"],
+    "victoria":    ["n2_victoria_calle_verde"],
+    "timer_panel": ["temporizador", "timer_panel", "panel_tiempo", "TEMPORAZIDOR"],
+    "semillita_entregada": ["semillita_entregada", "semilla_entregada", "semillita", "n2_semilla"],
+}
+
+GROW_STEPS = 3
+GROW_TIME_PER_STEP = 220
+INDEX_CELL = 96  # px por celda del índice espacial (≈ hoyo + margen de interacción)
+HOLE_SPACING = 72  # distancia mínima entre hoyos (≈ ancho del hoyo)
+SEED_SPACING = 48  # distancia mínima entre semillas
+
+# Semillas y hoyos guardan su estado en un EntityStore (arreglos); el objeto
+# sólo conserva imagen, rect e índice para que el dibujo siga igual.
+# Los glows de hoyo vienen con sus GLOW_STEPS alphas de pulso ya aplicados.
+GLOW_STEPS = 16
+_HOLE_GLOWS = GlowBank(lambda size: glow_steps(make_glow(size), GLOW_STEPS, 100, 200, tint=(255, 255, 120)))
+
+class Seed(pygame.sprite.Sprite):
+    def __init__(self, pos: Tuple[int,int], img: pygame.Surface, store: EntityStore):
+        super().__init__()
+        self.image = img
+        self.rect = img.get_rect(center=pos)
+        self.store = store
+        self.i = store.add(self.rect.center, self.rect.size)
+    @property
+    def taken(self) -> bool: return self.store.has(self.i, HIDDEN)
+    @taken.setter
+    def taken(self, value: bool): self.store.set_flag(self.i, HIDDEN, value)
+    @property
+    def visible(self) -> bool: return not self.taken
+
+class Hole(pygame.sprite.Sprite):
+    """Hoyo (capa PROPS) con su glow (GLOW) y lo que crece en él (ITEMS)."""
+    def __init__(self, pos: Tuple[int,int], img: pygame.Surface, store: EntityStore):
+        super().__init__()
+        self.image = img
+        self.rect = img.get_rect(center=pos)
+        self.store = store
+        self.i = store.add(self.rect.center, self.rect.size,
+                           glow=_HOLE_GLOWS.index_for(int(max(self.rect.width, self.rect.height) * 0.8)))
+        self.glow_sprite = layers.Prop(self.glows[0], center=self.rect.center)
+        self.plant = layers.Prop(img, self.rect)
+        self.plant.visible = False
+        self._stage = -1
+
+    @property
+    def has_tree(self) -> bool: return self.store.has(self.i, DONE)
+    @property
+    def grow_timer(self) -> float: return float(self.store.timer[self.i])
+    @property
+    def grow_step(self) -> int: return int(self.store.step[self.i])
+    @property
+    def glows(self) -> list[pygame.Surface]: return _HOLE_GLOWS[int(self.store.glow[self.i])]
+    @property
+    def visible(self) -> bool: return not self.has_tree
+
+    def start_grow(self): self.store.step[self.i], self.store.timer[self.i] = 1, 1
+    # El crecimiento de todos los hoyos avanza junto en run(): store.advance_growth()
+
+    def add_to(self, world: layers.LayeredBatch):
+        world.add(self.glow_sprite, layer=layers.GLOW)
+        world.add(self, layer=layers.PROPS)
+        world.add(self.plant, layer=layers.ITEMS)
+
+    def kill(self):
+        self.glow_sprite.kill()
+        self.plant.kill()
+        super().kill()
+
+    def sync(self, stages: Tuple[pygame.Surface, ...], glow_k: Optional[int]):
+        """Glow (paso glow_k, None = apagado) y etapa de la planta.
+        stages = (semilla, árbol chico, árbol mediano, árbol) ya escalados."""
+        empty = not self.has_tree and self.grow_timer == 0
+        self.glow_sprite.visible = glow_k is not None and empty
+        if self.glow_sprite.visible:
+            self.glow_sprite.image = self.glows[glow_k]
+        if self.has_tree:
+            stage = 3
+        elif self.grow_timer > 0:
+            stage = min(self.grow_step, 3) - 1
+        else:
+            stage = -1
+        if stage == self._stage:
+            return
+        self._stage = stage
+        self.plant.visible = stage >= 0
+        if stage >= 0:
+            img = stages[stage]
+            cx, cy = self.rect.center
+            tree_midbottom_y = cy + int(self.rect.height * 0.43)
+            self.plant.image = img
+            if stage == 0:
+                self.plant.rect = img.get_rect(center=(cx, tree_midbottom_y - 6))
+            else:
+                self.plant.rect = img.get_rect(midbottom=(cx, tree_midbottom_y))
+
+def make_growth_stages(img_semilla: pygame.Surface, img_arbol: pygame.Surface) -> Tuple[pygame.Surface, ...]:
+    """Etapas para Hole.sync, escaladas una vez (antes: smoothscale por hoyo y por frame)."""
+    aw, ah = img_arbol.get_size()
+    return (img_semilla,
+            pygame.transform.smoothscale(img_arbol, (int(aw * 0.45), int(ah * 0.45))),
+            pygame.transform.smoothscale(img_arbol, (int(aw * 0.8), int(ah * 0.8))),
+            img_arbol)
+
+def non_overlapping_spawn(rects_to_avoid: List[pygame.Rect], areas: List[pygame.Rect], count: int,
+                          min_dist: float = SEED_SPACING) -> List[Tuple[int,int]]:
+    # Poisson-disk: separación mínima garantizada y sin reintentos a ciegas
+    return poisson_disk_points(areas, min_dist, count=count, margin=8,
+                               exclude=[r.inflate(24, 24) for r in rects_to_avoid],
+                               rng=random)
+
+
+def run(screen: pygame.Surface, assets_dir: Path, personaje: str, dificultad: str, nivel: dict):
+
+    # --- 1. Inicialización ---
+    pygame.font.init()
+    clock = pygame.time.Clock()
+    W, H = screen.get_size()
+
+    # Cargar fuentes
+    font = pygame.font.SysFont("arial", 26, bold=True)
+    big_font = pygame.font.SysFont("arial", 54, bold=True)
+    timer_font = pygame.font.SysFont("arial", 42, bold=True)
+    popup_font = pygame.font.SysFont("arial", 28, bold=True)
+    small_font = pygame.font.SysFont("arial", 20, bold=True)
+    num_font_hud = pygame.font.SysFont("arial", max(24, int(H * 0.07)), bold=True)   # contador del HUD
+    pixel_font = load_pixel_font(assets_dir, H)
+
+    # Cargar imágenes
+    try:
+        img_fondo_surf = load_image(assets_dir, ASSET_STEMS["fondo"])
+        if img_fondo_surf is None: raise FileNotFoundError(f"No se encontró fondo: {ASSET_STEMS['fondo']}")
+        img_hoyo_surf = load_image(assets_dir, ASSET_STEMS["hoyo"])
+        if img_hoyo_surf is None: raise FileNotFoundError(f"No se encontró hoyo: {ASSET_STEMS['hoyo']}")
+        img_semilla_surf = load_image(assets_dir, ASSET_STEMS["semilla"])
+        if img_semilla_surf is None: raise FileNotFoundError(f"No se encontró semilla: {ASSET_STEMS['semilla']}")
+        img_arbol_surf = load_image(assets_dir, ASSET_STEMS["arbol"])
+        if img_arbol_surf is None: raise FileNotFoundError(f"No se encontró arbol: {ASSET_STEMS['arbol']}")
+        timer_panel = Panel(load_image(assets_dir, ASSET_STEMS["timer_panel"]))
+
+        # Imagen del contador de semillas
+        img_semilla_contador = load_image(assets_dir, ASSET_STEMS["semillita_entregada"])
+        if img_semilla_contador:
+            img_semilla_contador = scale_to_width(img_semilla_contador, int(W * 0.12))
+
+    except Exception as e:
+        print(f"Error fatal cargando imágenes del Nivel 2: {e}")
+        stop_level_music()
+        return
+
+    img_fondo = pygame.transform.scale(img_fondo_surf, screen.get_size())
+    # La victoria se decodifica en un hilo mientras se juega
+    victoria_path = find_first(assets_dir, ASSET_STEMS["victoria"])
+    if victoria_path is None:
+        print(f"Advertencia: No se encontró victoria: {ASSET_STEMS['victoria']}")
+    end_screens = EndScreens(screen.get_size())
+    end_screens.add("win", victoria_path, smooth=False)
+    img_hoyo = scale_to_width(img_hoyo_surf, 66)
+    img_semilla = scale_to_width(img_semilla_surf, 44)
+    img_arbol = scale_to_width(img_arbol_surf, 180)
+
+    geo = load_geometry(assets_dir, (W, H), nivel)
+    target_h = max(40, int(H * 0.14))
+    frames = load_char_frames(assets_dir, target_h=target_h, char_folder=personaje)
+    spawn_pos = (120, 490)
+    player = Player(frames, spawn_pos, screen.get_rect(), speed=nivel["velocidad"], anim_fps=nivel["anim_fps"],
+                    colision=build_collision(assets_dir, (W, H), nivel, geo))
+
+    # Spawn (estado de hoyos/semillas en arreglos; reset_level sólo los vacía)
+    SEEDS_TO_SPAWN = nivel["semillas"]
+    HOLES_TO_SPAWN = nivel["hoyos"]
+    spawn_areas = geo["spawn"] if geo else [pygame.Rect(r) for r in nivel["zonas_spawn"]]
+    # Nada aparece bajo una banca o la bici: el jugador no podría alcanzarlo
+    obstaculos = obstacle_rects((W, H), nivel, geo)
+    hole_store = EntityStore(HOLES_TO_SPAWN)
+    seed_store = EntityStore(SEEDS_TO_SPAWN)
+    holes: List[Hole] = []
+    seeds: List[Seed] = []
+
+    def _spawn():
+        nonlocal holes, seeds
+        hole_pts = non_overlapping_spawn(obstaculos, spawn_areas, HOLES_TO_SPAWN, HOLE_SPACING)
+        holes = [Hole(p, img_hoyo, hole_store) for p in hole_pts]
+        seed_pts = non_overlapping_spawn(obstaculos + [h.rect for h in holes], spawn_areas, SEEDS_TO_SPAWN)
+        seeds = [Seed(p, img_semilla, seed_store) for p in seed_pts]
+
+    _spawn()
+
+    growth_stages = make_growth_stages(img_semilla, img_arbol)
+
+    # Entidades por capas, dibujadas en un solo blits(): glows, hoyos (fijos
+    # hasta que crece un árbol), semillas y plantas, jugador y semilla en la mano
+    world = layers.LayeredBatch(static=(layers.PROPS,))
+    carried = layers.Prop(img_semilla)
+    carried.visible = False
+    world.add(player, layer=layers.PLAYER)
+    world.add(carried, layer=layers.CARRIED)
+
+    def _populate_world():
+        for h in holes: h.add_to(world)
+        world.add(*seeds, layer=layers.ITEMS)
+
+    _populate_world()
+
+    # Índices espaciales: sólo contienen semillas sin recoger y hoyos libres
+    seed_index = SpatialGrid(INDEX_CELL)
+    hole_index = SpatialGrid(INDEX_CELL)
+
+    def _rebuild_indices():
+        seed_index.clear(); hole_index.clear()
+        for s in seeds: seed_index.insert(s, s.rect)
+        for h in holes: hole_index.insert(h, h.rect)
+
+    _rebuild_indices()
+
+    # Variables Estado
+    carrying_seed = False
+    victory = False
+    total_semillas_plantadas = 0
+    total_hoyos = len(holes)
+    TOTAL_MS = nivel["tiempo_ms"]
+    remaining_ms = TOTAL_MS
+    game_over = False
+    level_done = False   # lo activa el scheduler al terminar la pantalla de victoria/derrota
+    paused = False
+    t = 0.0
+    hud_lines = [
+        f"{config.obtener_nombre(nivel['hud_titulo'])} {config.obtener_nombre(nivel['hud_tiempo'])}",
+        config.obtener_nombre("txt_mover_accion_pausa"),
+    ]
+
+    # Plazos del nivel (fade del mensaje, espera tras ganar/perder) en un solo scheduler
+    sched = Scheduler()
+
+    def _finish_level():
+        nonlocal level_done
+        level_done = True
+
+    start_level_music(assets_dir)
+    suspense_music_started = False
+
+    pause_menu = PauseMenu(assets_dir, (W, H), small_font)
+    icon_fx = FadeSprite(make_key_icon(assets_dir, popup_font, W))
+    # Indicador "Semilla en las manos" (sólo si la definición lo pide)
+    carry_key = nivel.get("etiqueta_mano")
+
+    show_message = ""
+    message_duration = 1.6
+
+    def _clear_message():
+        nonlocal show_message
+        show_message = ""
+    message_fade = sched.tween(message_duration, on_done=_clear_message, start=False)
+
+    def reset_level():
+        nonlocal carrying_seed, victory, level_done
+        nonlocal total_semillas_plantadas, remaining_ms, game_over, paused, suspense_music_started
+
+        player.place(spawn_pos)
+        player.carrying_image = None
+        carrying_seed = False
+        victory = False
+        level_done = False
+        total_semillas_plantadas = 0
+        remaining_ms = TOTAL_MS
+        game_over = False
+        paused = False
+        suspense_music_started = False
+        sched.clear()
+        start_level_music(assets_dir)
+
+        for e in [*holes, *seeds]: e.kill()
+        hole_store.clear(); seed_store.clear()
+        _spawn()
+        _rebuild_indices()
+        _populate_world()
+
+    def _try_interact():
+        nonlocal carrying_seed, total_semillas_plantadas, show_message
+        if victory or game_over: return
+
+        player_center = player.rect.center
+        if not carrying_seed:
+            closest_seed: Optional[Seed] = None
+            min_dist_sq = float('inf')
+            for s in seed_index.query_rect(player.rect):
+                if not s.taken:
+                    dist_sq = (player_center[0] - s.rect.centerx)**2 + (player_center[1] - s.rect.centery)**2
+                    if dist_sq < min_dist_sq:
+                        min_dist_sq = dist_sq; closest_seed = s
+            if closest_seed:
+                closest_seed.taken = True
+                seed_index.remove(closest_seed)
+                carrying_seed = True
+                player.carrying_image = img_semilla
+                play_sfx("sfx_pick_seed", assets_dir)
+                show_message = config.obtener_nombre("txt_semilla_recogida")
+                message_fade.restart()
+            return
+
+        closest_hole: Optional[Hole] = None
+        min_dist_sq = float('inf')
+        for h in hole_index.query_rect(player.rect.inflate(20, 20)):
+            if not h.has_tree and h.grow_timer == 0:
+                dist_sq = (player_center[0] - h.rect.centerx)**2 + (player_center[1] - h.rect.centery)**2
+                if dist_sq < min_dist_sq:
+                    min_dist_sq = dist_sq; closest_hole = h
+        if closest_hole:
+            carrying_seed = False
+            player.carrying_image = None
+            closest_hole.start_grow()
+            hole_index.remove(closest_hole)
+            total_semillas_plantadas += 1
+            play_sfx("sfx_plant", assets_dir)
+            show_message = config.obtener_nombre("txt_arbol_plantado")
+            message_fade.restart()
+
+    # El hilo de las pantallas finales corre sólo mientras se juega: cualquier
+    # salida (fin del nivel, ESC, QUIT, "menu" de la pausa) lo detiene
+    end_screens.start()
+    try:
+        while True:
+            dt_ms = clock.tick(60)
+            governor.frame(clock.get_rawtime())
+            dt_sec = dt_ms / 1000.0
+            t += dt_sec
+
+            mouse_click = False
+            mouse_pos = pygame.mouse.get_pos()
+
+            for ev in pygame.event.get():
+                if ev.type == pygame.QUIT:
+                    stop_level_music()
+                    return None
+
+                if paused:
+                    if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1: mouse_click = True
+                    if ev.type == pygame.KEYDOWN:
+                        if ev.key == pygame.K_SPACE:
+                            paused = False
+                            play_sfx("sfx_click", assets_dir)
+                        if ev.key == pygame.K_ESCAPE:
+                            stop_level_music()
+                            return None
+                elif not game_over and not victory:
+                    if ev.type == pygame.KEYDOWN:
+                        if ev.key == pygame.K_ESCAPE:
+                            stop_level_music()
+                            return None
+                        if ev.key == pygame.K_SPACE:
+                            paused = True
+                            play_sfx("sfx_click", assets_dir)
+                        if ev.key == pygame.K_e or ev.key == pygame.K_RETURN:
+                            _try_interact()
+
+            sched.paused = paused
+            sched.update(dt_sec)
+
+            if not paused and not game_over:
+                if remaining_ms > 0:
+                    remaining_ms = max(0, remaining_ms - dt_ms)
+
+                    if remaining_ms <= 30000 and not suspense_music_started:
+                        start_suspense_music(assets_dir)
+                        suspense_music_started = True
+
+                    if not victory:
+                        player.handle_input(dt_sec)
+                    for _ in hole_store.advance_growth(dt_ms, GROW_TIME_PER_STEP, GROW_STEPS):
+                        play_sfx("sfx_grow", assets_dir)
+                        world.touch(layers.PROPS)   # el hoyo ya no se dibuja: ahora es árbol
+
+                    if total_semillas_plantadas >= total_hoyos and not victory:
+                        victory = True
+                        sched.after(1.8, _finish_level)
+                        play_sfx("sfx_grow", assets_dir)
+
+                elif not victory:
+                    game_over = True
+                    sched.after(1.2, _finish_level)
+
+            if level_done:
+                end_screens.stop()
+                stop_level_music()
+                volver_a_play(screen, assets_dir)
+                return
+
+            if victory:
+                screen.blit(end_screens.get("win") or img_fondo, (0, 0))
+            else:
+                screen.blit(img_fondo, (0,0))
+
+                near_seeds = seed_index.query_rect(player.rect.inflate(18, 18))
+                near_holes = hole_index.query_rect(player.rect.inflate(20, 20)) if carrying_seed else []
+
+                # Entidades: un solo blits() en orden de capa
+                glow_k = None
+                if carrying_seed and governor.glow:
+                    pul = (math.sin(governor.anim_time(t) * 6.0) + 1) * 0.5
+                    glow_k = int(pul * (GLOW_STEPS - 1) + 0.5)
+                for h in holes:
+                    h.sync(growth_stages, glow_k)
+                player.place_carried(carried)
+                world.draw(screen)
+
+                for s in near_seeds:
+                    if not s.taken:
+                        icon_pos = (s.rect.centerx, s.rect.top - int(H * 0.035))
+                        recti = icon_fx.blit(screen, 220 / 255 * pulse(t, 1000 / 180.0, 0.6, 1.0), center=icon_pos)
+                        tr_label(small_font, "txt_recoger_semilla").blit(screen, midtop=(recti.centerx, recti.bottom + 4))
+
+                for h in near_holes:
+                    icon_pos = (h.rect.centerx, h.rect.top - int(H * 0.035))
+                    recti = icon_fx.blit(screen, 220 / 255 * pulse(t, 1000 / 180.0, 0.6, 1.0), center=icon_pos)
+                    tr_label(small_font, "txt_plantar_semilla").blit(screen, midtop=(recti.centerx, recti.bottom + 4))
+
+                if carry_key and carrying_seed:
+                    tr_label(small_font, carry_key, pad=(12, 8)).blit(
+                        screen, 0.55 + 0.45 * pulse(t, 6.0, 0.2, 1.0),
+                        midbottom=(player.rect.centerx, player.rect.top - 6))
+
+                draw_hud_lines(screen, font, hud_lines)
+
+                # === HUD (sólo si no es Game Over) ===
+                if not game_over:
+                    draw_timer(screen, timer_font, timer_panel, timer_rect(W, H), remaining_ms,
+                               nivel["alerta_ms"], shift=0.12)
+
+                    # --- Contador de semillas ---
+                    if img_semilla_contador:
+                        contador_rect = img_semilla_contador.get_rect(topleft=(int(W * 0.015), int(H * 0.10)))
+                        screen.blit(img_semilla_contador, contador_rect)
+                        txt = str(total_semillas_plantadas)
+                        nw, _ = num_font_hud.size(txt)
+                        draw_shadowed(screen, num_font_hud, txt, (255, 255, 255),
+                                      (contador_rect.right - 50 + nw // 2, contador_rect.centery))
+                    else:
+                        txt = f"Plantadas: {total_semillas_plantadas} / {total_hoyos}"
+                        tw, th = font.size(txt)
+                        draw_shadowed(screen, font, txt, (255, 255, 255), (16 + tw // 2, 25 + 2 * 26 + th // 2))
+
+            # === Mensajes temporales (centrados, fuente pixel) ===
+            if show_message and message_fade.active:
+                # Mensaje + sombra compuestos una vez; el fade sólo cambia el alpha
+                message(pixel_font, show_message).blit(screen, message_fade.value,
+                                                       center=(W // 2, H // 2 + int(H * 0.08)))
+
+            if game_over:
+                screen.blit(pause_menu.overlay, (0, 0))
+                msg = tr_text(big_font, "txt_tiempo_agotado", (255, 255, 255))
+                screen.blit(msg, msg.get_rect(center=(W // 2, H // 2 - 10)))
+
+            if paused:
+                accion = pause_menu.draw(screen, mouse_pos, mouse_click, overlay=not game_over)
+                if accion:
+                    play_sfx("sfx_click", assets_dir)
+                if accion == "continuar":
+                    paused = False
+                elif accion == "reiniciar":
+                    reset_level()
+                elif accion == "menu":
+                    end_screens.stop()
+                    stop_level_music()
+                    volver_a_play(screen, assets_dir)
+                    return None
+
+            pygame.display.flip()
+    finally:
+        end_screens.stop()
@@ -0,0 +1,462 @@
+# levels/recolectar.py
+# Mecánica "recoger y entregar" (nivel 1): basura repartida por el parque, el
+# jugador la lleva de una en una al bote antes de que se acabe el tiempo.
+# Cantidad, zona de tirado, tamaños, tiempo y velocidad vienen de la
+# definición del nivel (levels/definiciones.py).
+from __future__ import annotations
+import math
+import random
+from pathlib import Path
+from typing import Optional
+import pygame
+import config
+import asset_variants
+from text_cache import tr_text
+from quality import governor
+from fades import FadeSprite, message, pulse, tr_label
+from end_screens import EndScreens, FIT_COVER
+from spatial_grid import SpatialGrid
+from poisson_disk import poisson_disk_points
+from collision import CollisionMap
+from entity_store import GlowBank, glow_steps
+from scheduler import Scheduler
+import layers
+from levels.comun import (
+    start_level_music, start_suspense_music, stop_level_music, play_click, volver_a_play,
+    find_first, find_many_by_prefix, load_surface, load_image, scale_to_width, make_glow,
+    load_pixel_font, make_key_icon, load_char_frames, load_geometry, build_collision, Player, Panel, PauseMenu,
+    draw_timer, timer_rect, draw_hud_lines, draw_shadowed,
+)
+
+BG_STEMS = ["nivel1_parque", "parque_nivel1", "park_level1", "nivel1", "bg_parque", "nivel1_bg"]
+LOSE_STEMS = ["NIVEL 1P", "NIVEL1P", "NIVEL1 P", "nivel 1p"]
+
+
+def load_bg_fit(assets_dir: Path, W: int, H: int) -> tuple[pygame.Surface, pygame.Rect]:
+    p = find_first(assets_dir, BG_STEMS)
+    if p:
+        img = load_surface(p)
+    else:
+        img = pygame.Surface((W, H))
+        img.fill((40, 120, 40))
+    iw, ih = img.get_size()
+    ratio = min(W / iw, H / ih) if iw and ih else 1.0
+    new_w, new_h = int(iw * ratio), int(ih * ratio)
+    scaled = pygame.transform.smoothscale(img, (new_w, new_h))
+    rect = scaled.get_rect(center=(W // 2, H // 2))
+    return scaled, rect
+
+def load_trash_images(assets_dir: Path) -> list[pygame.Surface]:
+    return [load_surface(p) for p in find_many_by_prefix(assets_dir, "trash_")]
+
+def load_bin_image(assets_dir: Path, W: int) -> pygame.Surface:
+    bin_p = find_first(assets_dir, ("basurero", "bote_basura", "trash_bin"))
+    if bin_p:
+        return scale_to_width(load_surface(bin_p), int(W * 0.24))
+    bin_img = pygame.Surface((int(W * 0.15), int(W * 0.20)), pygame.SRCALPHA)
+    pygame.draw.rect(bin_img, (90, 90, 90), bin_img.get_rect(), border_radius=12)
+    pygame.draw.rect(bin_img, (255, 255, 255), bin_img.get_rect(), 2, border_radius=12)
+    return bin_img
+
+def place_bin(bin_img: pygame.Surface, W: int, H: int, geo: Optional[dict] = None) -> pygame.Rect:
+    """Rect del bote: el punto (midbottom) de la geometría horneada o la esquina inferior derecha."""
+    bin_rect = bin_img.get_rect()
+    if geo is not None and geo["bote"]:
+        bin_rect.midbottom = geo["bote"]
+    else:
+        bin_rect.bottomright = (W - int(W * 0.015), H - int(W * 0.03))
+    return bin_rect
+
+
+# Glows compartidos por tamaño (antes cada basura creaba el suyo), ya con sus
+# GLOW_STEPS alphas de pulso: el frame elige uno en vez de copiar y mezclar
+GLOW_STEPS = 16
+_TRASH_GLOWS = GlowBank(lambda size: glow_steps(make_glow(size), GLOW_STEPS, 70, 170))
+
+class TrashGlow(pygame.sprite.Sprite):
+    """Halo pulsante de una basura (capa GLOW)."""
+    def __init__(self, trash: "Trash"):
+        super().__init__()
+        self.trash = trash
+        self.image = trash.glows[0]
+        self.rect = self.image.get_rect(center=trash.rect.center)
+        self.visible = True
+
+    def update(self, t: float):
+        tr = self.trash
+        self.visible = governor.glow and not tr.carried
+        if self.visible:
+            pul = (math.sin(governor.anim_time(t) + tr.phase) + 1) * 0.5
+            self.image = tr.glows[int(pul * (GLOW_STEPS - 1) + 0.5)]
+            self.rect = self.image.get_rect(center=tr.rect.center)
+
+class Trash(pygame.sprite.Sprite):
+    def __init__(self, img: pygame.Surface, pos, scale_w: int):
+        super().__init__()
+        self.image = scale_to_width(img, scale_w)
+        self.rect = self.image.get_rect(center=pos)
+        self.glows = _TRASH_GLOWS[_TRASH_GLOWS.index_for(int(max(self.rect.width, self.rect.height) * 0.9))]
+        self.carried = False
+        self.phase = random.uniform(0, math.tau)
+        self.glow = TrashGlow(self)
+
+    def add_to(self, world: layers.LayeredBatch):
+        world.add(self.glow, layer=layers.GLOW)
+        world.add(self, layer=layers.ITEMS)
+
+    def kill(self):
+        self.glow.kill()
+        super().kill()
+
+
+# ---------- NIVEL ----------
+def run(screen: pygame.Surface, assets_dir: Path, personaje: str, dificultad: str, nivel: dict):
+    pygame.font.init()
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont("arial", 26, bold=True)
+    big  = pygame.font.SysFont("arial", 54, bold=True)
+    timer_font = pygame.font.SysFont("arial", 42, bold=True)
+
+    W, H = screen.get_size()
+    num_font = pygame.font.SysFont("arial", max(18, int(H * 0.055)), bold=True)   # contador del HUD
+    background, bg_rect = load_bg_fit(assets_dir, W, H)
+    pixel_font = load_pixel_font(assets_dir, H)
+    geo = load_geometry(assets_dir, (W, H), nivel)
+
+    # === Bote de basura ===
+    bin_img = load_bin_image(assets_dir, W)
+    bin_rect = place_bin(bin_img, W, H, geo)
+    BIN_RADIUS = max(36, int(W * 0.05))
+
+    # === Flecha indicadora ===
+    arrow_p = asset_variants.localized(assets_dir, "flecha_indicador") or find_first(assets_dir, ("flecha", "arrow"))
+    if arrow_p:
+        arrow_img = scale_to_width(load_surface(arrow_p), int(W * 0.06))
+    else:
+        arrow_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
+        pygame.draw.polygon(arrow_surf, (0, 0, 0), [(10, 10), (50, 10), (30, 50)])
+        pygame.draw.polygon(arrow_surf, (255, 220, 50), [(14, 14), (46, 14), (30, 44)])
+        arrow_img = scale_to_width(arrow_surf, int(W * 0.06))
+
+    # === Palomita en el bote ===
+    palomita_img = None
+    p = asset_variants.localized(assets_dir, "basurita_entregada")
+    PALOMITA_DURATION = 1.2
+    if p:
+        try:
+            palomita_img = scale_to_width(load_surface(p), int(bin_rect.width * 0.55))
+        except Exception:
+            palomita_img = None
+
+    # Contador personalizado
+    contador_img = None
+    contador_path = asset_variants.localized(assets_dir, "contador_basura")
+    if contador_path:
+        try:
+            contador_img = scale_to_width(load_surface(contador_path), int(W * 0.12))
+        except Exception:
+            contador_img = None
+
+    # Basuras
+    sprite_trash = load_trash_images(assets_dir)
+    if not sprite_trash:
+        for col in [(160, 160, 160), (70, 160, 70), (60, 130, 200)]:
+            s = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.rect(s, col, (4, 4, 32, 32), border_radius=6)
+            sprite_trash.append(s)
+    trash_group = pygame.sprite.Group()
+    total_trash = nivel["basuras"]
+    trash_w = int(W * nivel["escala_basura"])
+    # Zona de tirado: Poisson-disk para que las basuras no se encimen ni caigan en el bote
+    x0, y0, x1, y1 = nivel["zona_basura"]
+    trash_area = pygame.Rect(int(W * x0), int(H * y0), int(W * x1) - int(W * x0) + 1, int(H * y1) - int(H * y0) + 1)
+    trash_spacing = int(trash_w * 1.5)
+
+    def trash_spots() -> list[tuple[int, int]]:
+        return poisson_disk_points([trash_area], trash_spacing, count=total_trash,
+                                   exclude=[bin_rect.inflate(trash_spacing, trash_spacing)], rng=random)
+
+    for i, (x, y) in enumerate(trash_spots()):
+        trash_group.add(Trash(sprite_trash[i % len(sprite_trash)], (x, y), trash_w))
+
+    # Colisión: obstáculos del parque y el pie del bote (su silueta, no el rect del
+    # sprite); la geometría horneada ya trae el bote
+    colision = build_collision(assets_dir, (W, H), nivel, geo) or CollisionMap((W, H))
+    if geo is None:
+        colision.add_footprint(bin_img, bin_rect)
+
+    # Personaje
+    frames = load_char_frames(assets_dir, target_h=int(H * 0.14), char_folder=personaje)
+    player = Player(frames, (int(W * 0.16), int(H * 0.75)), pygame.Rect(0, 0, W, H),
+                    speed=nivel["velocidad"], anim_fps=nivel["anim_fps"], colision=colision)
+
+    # Entidades por capas, dibujadas en un solo blits(): glows, bote (fijo),
+    # basuras, jugador, la basura en la mano encima de él y la flecha
+    world = layers.LayeredBatch(static=(layers.PROPS,))
+    world.add(layers.Prop(bin_img, bin_rect), layer=layers.PROPS)
+    arrow = layers.Prop(arrow_img)
+    world.add(arrow, layer=layers.UI)
+    for tr in trash_group:
+        tr.add_to(world)
+    world.add(player, layer=layers.PLAYER)
+
+    carrying: Optional[Trash] = None
+    delivered = 0
+
+    PICK_KEYS = (pygame.K_e, pygame.K_RETURN)
+    INTERACT_DIST = int(W * nivel["interaccion"])
+    # Índice espacial de basuras recogibles (celda = radio de interacción)
+    trash_index = SpatialGrid(INTERACT_DIST)
+    for tr in trash_group:
+        trash_index.insert(tr, tr.rect)
+
+    paused = False
+    t = 0.0
+
+    # Interactivos visuales
+    popup_font = pygame.font.SysFont("arial", 28, bold=True)
+    small_font = pygame.font.SysFont("arial", 20, bold=True)
+    show_message = ""
+    message_duration = 1.5
+    icon_fx = FadeSprite(make_key_icon(assets_dir, popup_font, W))
+
+    check_font = pygame.font.SysFont("arial", 72, bold=True)
+    check_fx = FadeSprite(check_font.render("✓", True, (40, 180, 40)))
+    palomita_fx = FadeSprite(palomita_img) if palomita_img else None
+    CHECK_DURATION = 1.0
+
+    # Fades de mensaje / palomita / check: tweens 1 -> 0 del scheduler del nivel
+    sched = Scheduler()
+    message_fade = sched.tween(message_duration, start=False)
+    check_fade = sched.tween(CHECK_DURATION, start=False)
+    palomita_fade = sched.tween(PALOMITA_DURATION, start=False)
+
+    # Temporizador
+    TOTAL_MS = nivel["tiempo_ms"]
+    remaining_ms = TOTAL_MS
+    hud_lines = [
+        f"{config.obtener_nombre(nivel['hud_titulo'])} {config.obtener_nombre(nivel['hud_tiempo'])}",
+        config.obtener_nombre("txt_mover_accion_pausa"),
+    ]
+
+    start_level_music(assets_dir)
+
+    timer_panel = Panel(load_image(assets_dir, ["temporizador", "timer_panel", "panel_tiempo", "TEMPORAZIDOR"]))
+    pause_menu = PauseMenu(assets_dir, (W, H), small_font)
+
+    def reset_level():
+        nonlocal carrying, delivered, remaining_ms, suspense_music_started
+        for tr in trash_group.sprites():
+            tr.kill()
+        trash_index.clear()
+        for i, (x, y) in enumerate(trash_spots()):
+            tr = Trash(sprite_trash[i % len(sprite_trash)], (x, y), trash_w)
+            trash_group.add(tr)
+            tr.add_to(world)
+            trash_index.insert(tr, tr.rect)
+        carrying = None
+        delivered = 0
+        remaining_ms = TOTAL_MS
+        suspense_music_started = False
+        start_level_music(assets_dir)
+        sched.clear()
+
+    suspense_music_started = False
+
+    # Pantallas finales: un hilo las decodifica y escala mientras se juega
+    lose_path = None
+    lose_folder = assets_dir / "PANTALLA LOSE"
+    if lose_folder.exists():
+        lose_path = find_first(lose_folder, [config.obtener_nombre(nivel["derrota"]), *LOSE_STEMS])
+    end_screens = EndScreens((W, H))
+    end_screens.add("win", asset_variants.localized(assets_dir, nivel["victoria"]))
+    end_screens.add("lose", lose_path, fit=FIT_COVER)
+
+    def terminar():
+        end_screens.stop()
+        stop_level_music()
+        volver_a_play(screen, assets_dir)
+
+    # El hilo de las pantallas finales corre sólo mientras se juega: cualquier
+    # salida (fin del nivel, ESC, QUIT, "menu" de la pausa) lo detiene
+    end_screens.start()
+    try:
+        while True:
+            dt = min(clock.tick(60) / 1000.0, 0.033)
+            governor.frame(clock.get_rawtime())
+            t += dt
+            interact = False
+            click = False
+
+            for e in pygame.event.get():
+                if e.type == pygame.QUIT:
+                    stop_level_music()
+                    return None
+                if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                    click = True
+                if e.type == pygame.KEYDOWN:
+                    if e.key == pygame.K_ESCAPE:
+                        play_click(assets_dir)
+                        stop_level_music()
+                        return None
+                    if e.key == pygame.K_SPACE:
+                        paused = not paused
+                        play_click(assets_dir)
+                    if e.key in PICK_KEYS:
+                        interact = True
+
+            # La pausa congela también los fades
+            sched.paused = paused
+            sched.update(dt)
+
+            if not paused and remaining_ms > 0:
+                remaining_ms = max(0, remaining_ms - int(dt * 1000))
+
+                if remaining_ms <= 30000 and not suspense_music_started:
+                    start_suspense_music(assets_dir)
+                    suspense_music_started = True
+
+                player.handle_input(dt)
+
+                if carrying:
+                    carrying.rect.center = player._get_carry_anchor()
+
+                if interact:
+                    if not carrying:
+                        nearest = trash_index.nearest(player.rect.center, INTERACT_DIST)
+                        if nearest:
+                            trash_index.remove(nearest)
+                            carrying = nearest
+                            carrying.carried = True
+                            world.change_layer(carrying, layers.CARRIED)
+                            show_message = config.obtener_nombre("txt_basura_recolectada")
+                            message_fade.restart()
+                            play_click(assets_dir)
+                    else:
+                        d = math.hypot(player.rect.centerx - bin_rect.centerx,
+                                       player.rect.centery - bin_rect.centery)
+                        if d <= BIN_RADIUS * 1.2:
+                            carrying.kill()
+                            carrying = None
+                            delivered += 1
+                            check_fade.restart()
+                            show_message = config.obtener_nombre("txt_basura_entregada")
+                            message_fade.restart()
+                            palomita_fade.restart()
+                            play_click(assets_dir)
+
+            # DIBUJO
+            screen.fill((34, 45, 38))
+            screen.blit(background, bg_rect)
+
+            # Entidades: un solo blits() en orden de capa
+            arrow.visible = carrying is not None
+            if carrying:
+                # Rebote suave sobre el bote mientras se lleva basura
+                bounce_offset = 15 * math.sin(governor.anim_time(t) * 4.0)
+                arrow.rect.midbottom = (bin_rect.centerx, bin_rect.top - 10 + bounce_offset)
+            for tr in trash_group:
+                tr.glow.update(t)
+            world.draw(screen)
+
+            if palomita_fx and palomita_fade.active:
+                palomita_fx.blit(screen, palomita_fade.value,
+                                 center=(bin_rect.centerx, bin_rect.centery - int(bin_rect.height * 0.20)))
+            elif not palomita_fx and check_fade.active:
+                check_fx.blit(screen, check_fade.value, center=(bin_rect.centerx, bin_rect.top - int(H * 0.05)))
+
+            draw_hud_lines(screen, font, hud_lines)
+
+            # Interacciones visuales
+            if not carrying:
+                nearest = trash_index.nearest(player.rect.center, INTERACT_DIST)
+                if nearest:
+                    icon_pos = (nearest.rect.centerx, nearest.rect.top - int(H * 0.03))
+                    recti = icon_fx.blit(screen, 220 / 255 * pulse(t, 6.0, 0.6, 1.0), center=icon_pos)
+                    tr_label(small_font, "txt_recoger_e").blit(screen, midtop=(nearest.rect.centerx, recti.bottom + 4))
+            else:
+                carry_fx = tr_label(small_font, "txt_basura_mano", pad=(12, 8))
+                carry_fx.blit(screen, 0.55 + 0.45 * pulse(t, 6.0, 0.2, 1.0),
+                              midbottom=(player.rect.centerx, player.rect.top - 6))
+
+            if message_fade.active and show_message:
+                # Mensaje + sombra compuestos una vez; el fade sólo cambia el alpha
+                message(pixel_font, show_message).blit(screen, message_fade.value,
+                                                       center=(W // 2, H // 2 + int(H * 0.08)))
+
+            draw_timer(screen, timer_font, timer_panel, timer_rect(W, H), remaining_ms,
+                       nivel["alerta_ms"], shift=0.12)
+
+            # Contador
+            if contador_img:
+                contador_rect = contador_img.get_rect(topleft=(int(W * 0.015), int(H * 0.10)))
+                screen.blit(contador_img, contador_rect)
+                nw, _ = num_font.size(str(delivered))
+                draw_shadowed(screen, num_font, str(delivered), (255, 255, 255),
+                              (contador_rect.right - 20 - nw // 2, contador_rect.centery))
+            else:
+                txt = f"{config.obtener_nombre('txt_entregadas')} {delivered}/{total_trash}"
+                tw, th = num_font.size(txt)
+                draw_shadowed(screen, num_font, txt, (255, 255, 255),
+                              (int(W * 0.02) + tw // 2, int(H * 0.12) + th // 2))
+
+            # PAUSA
+            if paused:
+                accion = pause_menu.draw(screen, pygame.mouse.get_pos(), click)
+                if accion:
+                    play_click(assets_dir)
+                if accion == "continuar":
+                    paused = False
+                elif accion == "reiniciar":
+                    reset_level()
+                    paused = False
+                elif accion == "menu":
+                    stop_level_music()
+                    return None
+
+            # === VICTORIA ===
+            if not paused and delivered >= total_trash:
+                win_img = end_screens.get("win")
+                if win_img:
+                    screen.blit(win_img, (0, 0))
+                    pygame.display.flip()
+                    elapsed2 = 0.0
+                    while elapsed2 < 2.5:
+                        elapsed2 += clock.tick(60) / 1000.0
+                        for ev in pygame.event.get():
+                            if ev.type == pygame.KEYDOWN or (ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1):
+                                play_click(assets_dir)
+                                elapsed2 = 2.5
+                            elif ev.type == pygame.QUIT:
+                                elapsed2 = 2.5
+                else:
+                    overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+                    overlay.fill((0, 120, 0, 90))
+                    screen.blit(overlay, (0, 0))
+                    wtxt = tr_text(big, "txt_parque_limpio", (255, 255, 255))
+                    screen.blit(wtxt, wtxt.get_rect(center=(W // 2, H // 2 - 10)))
+                    pygame.display.flip()
+                    pygame.time.delay(1200)
+                terminar()
+                return None
+
+            # === DERROTA (tiempo agotado) ===
+            if remaining_ms <= 0 and delivered < total_trash:
+                stop_level_music()
+                lose_img = end_screens.get("lose")
+                if lose_img:
+                    screen.blit(lose_img, lose_img.get_rect(center=(W // 2, H // 2)))
+                else:
+                    overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+                    overlay.fill((0, 0, 0, 160))
+                    screen.blit(overlay, (0, 0))
+                    msg = tr_text(big, "txt_tiempo_agotado", (255, 255, 255))
+                    screen.blit(msg, msg.get_rect(center=(W // 2, H // 2 - 10)))
+                pygame.display.flip()
+                pygame.time.delay(1200)
+                terminar()
+                return None
+
+            pygame.display.flip()
+    finally:
+        end_screens.stop()
@@ -0,0 +1,401 @@
+# levels/reparar.py
+# Mecánica "reparar zonas" (nivel 3): la plaza está rota; manteniendo R dentro
+# de una zona se repara y se ve la parte arreglada del fondo. Con
+# `herramienta` hay que recoger primero la herramienta (vuelve a aparecer tras
+# cada reparación); con `controles_invertidos` las teclas mueven al revés.
+# Zonas, tiempo y velocidad vienen de la definición del nivel.
+from __future__ import annotations
+import math
+from pathlib import Path
+from typing import Optional, Tuple
+import pygame
+import config
+from text_cache import render_text, tr_text
+from quality import governor
+from fades import message, tr_label
+from end_screens import EndScreens
+from spatial_grid import SpatialGrid
+from scheduler import Scheduler
+from entity_store import glow_steps
+import layers
+from levels.comun import (
+    start_level_music, start_suspense_music, stop_level_music, play_sfx,
+    find_first, load_image, scale_to_width, load_char_frames, load_geometry, build_collision, Player, Panel, PauseMenu,
+    draw_timer, timer_rect, draw_shadowed,
+)
+
+# --- Colores ---
+BLANCO = (255, 255, 255); NEGRO = (0, 0, 0); VERDE = (0, 255, 0)
+GRIS = (100, 100, 100)
+
+TIEMPO_PARA_REPARAR = 2.0    # segundos manteniendo R
+FIN_DELAY = 3.0              # s mostrando la pantalla final antes de volver
+BG_ROTO_STEMS = ["original", "background_broken"]
+BG_TODO_STEMS = ["img_4_todo", "background_repaired"]
+
+
+def zone_cell(W: int, H: int) -> int:
+    """Celda del índice de zonas (sacar_coordenadas.py hornea las celdas con este tamaño)."""
+    return max(64, min(W, H) // 4)
+
+TOOL_GLOW_STEPS = 16
+
+def _tool_glows() -> list[pygame.Surface]:
+    """Círculo amarillo del glow con alpha 100..200, en TOOL_GLOW_STEPS pasos."""
+    base = pygame.Surface((80, 80), pygame.SRCALPHA)
+    pygame.draw.circle(base, (255, 255, 0, 255), (40, 40), 35)
+    return glow_steps(base, TOOL_GLOW_STEPS, 100, 200)
+
+class ToolItem(pygame.sprite.Sprite):
+    """Herramienta en el suelo. `rect` es la posición de juego (colisiones);
+    lo que se ve flota encima: `view` (capa ITEMS) y `glow` (capa GLOW)."""
+    def __init__(self, img: pygame.Surface, area_juego: pygame.Rect, center_pos: Tuple[int, int]):
+        super().__init__()
+        self.image = img
+        self.rect = self.image.get_rect()
+        self.area = area_juego
+        self.glow_timer = 0.0
+        self.rect.center = center_pos
+        self.glows = _tool_glows()
+        self.view = layers.Prop(img, self.rect)
+        self.glow = layers.Prop(self.glows[0])
+
+    def respawn(self):
+        self.rect.center = self.area.center
+
+    def add_to(self, world: layers.LayeredBatch):
+        world.add(self.glow, layer=layers.GLOW)
+        world.add(self.view, layer=layers.ITEMS)
+
+    def update(self, shown: bool):
+        self.view.visible = shown
+        self.glow.visible = shown and governor.glow
+        if not shown:
+            return
+        self.glow_timer += 0.15
+        anim = governor.anim_time(self.glow_timer / 9.0) * 9.0   # glow_timer avanza 9/s a 60 FPS
+        offset = math.sin(anim) * 8
+        self.view.rect.topleft = (self.rect.x, self.rect.y + int(offset))
+        if self.glow.visible:
+            k = (math.sin(anim * 2) + 1) * 0.5
+            self.glow.image = self.glows[int(k * (TOOL_GLOW_STEPS - 1) + 0.5)]
+            self.glow.rect.center = self.view.rect.center
+
+
+def run(screen: pygame.Surface, assets_dir: Path, personaje: str, dificultad: str, nivel: dict):
+    W, H = screen.get_size()
+    clock = pygame.time.Clock()
+    con_herramienta = nivel["herramienta"]
+
+    pygame.font.init()
+    font_hud = pygame.font.SysFont("Arial", 22, bold=True)
+    font_timer = pygame.font.SysFont("Arial", 36, bold=True)
+    font_big = pygame.font.SysFont("Arial", 48, bold=True)
+
+    # --- Fondos: plaza rota y plaza reparada ---
+    bg_roto = load_image(assets_dir, BG_ROTO_STEMS, deep=True)
+    if not bg_roto:
+        bg_roto = pygame.Surface((W, H)); bg_roto.fill((100, 100, 100))
+    bg_roto = pygame.transform.scale(bg_roto, (W, H))
+
+    bg_todo = load_image(assets_dir, BG_TODO_STEMS, deep=True)
+    if not bg_todo:
+        bg_todo = pygame.Surface((W, H)); bg_todo.fill((100, 200, 100))
+    bg_todo = pygame.transform.scale(bg_todo, (W, H))
+
+    geo = load_geometry(assets_dir, (W, H), nivel)
+
+    # Pantallas finales: un hilo las decodifica y escala mientras se juega
+    end_screens = EndScreens((W, H))
+    for name, stems in (("win", ["win_level3", "victory_screen"]), ("lose", ["lose_level3", "defeat_screen"])):
+        path = find_first(assets_dir, stems, deep=True)
+        if path is None:
+            print(f"Advertencia: No se encontró '{stems[0]}'")
+        end_screens.add(name, path, smooth=False)
+
+    # --- Paneles del HUD y pausa ---
+    contador_panel = Panel(load_image(assets_dir, ["contador_edificios", "contador", "panel_contador", "panel_reparacion"], deep=True))
+    timer_panel = Panel(load_image(assets_dir, ["temporizador", "timer_panel", "panel_tiempo", "TEMPORIZADOR", "TEMPORAZIDOR"], deep=True))
+    pause_menu = PauseMenu(assets_dir, (W, H), font_hud, overlay_alpha=170)
+    fin_overlays = {}
+    for name, color in (("win", (0, 150, 0, 170)), ("lose", (150, 0, 0, 170))):
+        fin_overlays[name] = pygame.Surface((W, H), pygame.SRCALPHA)
+        fin_overlays[name].fill(color)
+
+    # --- Zonas de reparación ---
+    zones: dict[str, pygame.Rect] = geo["zonas"] if geo else nivel["zonas"](W, H)
+    TOTAL_ZONES = len(zones)
+
+    # Índice espacial de zonas pendientes de reparar (celdas horneadas si coinciden)
+    zone_index = SpatialGrid(zone_cell(W, H))
+    celdas = geo["celdas"] if geo and geo["celdas"] and geo["celdas"]["celda"] == zone_index.cell else None
+
+    def _index_zones():
+        zone_index.clear()
+        for key, rect in zones.items():
+            zone_index.insert(key, rect, celdas["zonas"].get(key) if celdas else None)
+
+    _index_zones()
+
+    # --- Jugador ---
+    try:
+        frames_jugador = load_char_frames(assets_dir, target_h=int(H * 0.12), char_folder=personaje)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return "menu"
+
+    spawn_pos = (W // 2, H // 2)
+    jugador = Player(frames_jugador, spawn_pos, screen.get_rect().inflate(-nivel["margen"], -nivel["margen"]),
+                     speed=nivel["velocidad"], anim_fps=nivel["anim_fps"],
+                     invertido=nivel["controles_invertidos"], colision=build_collision(assets_dir, (W, H), nivel, geo))
+
+    # --- Herramienta (sólo si la definición la pide) ---
+    tool_item: Optional[ToolItem] = None
+    raw_img_tool = None
+    if con_herramienta:
+        raw_img_tool = load_image(assets_dir, ["herramienta", "tool", "martillo", "wrench"], deep=True)
+        if not raw_img_tool:
+            raw_img_tool = pygame.Surface((40, 40), pygame.SRCALPHA); raw_img_tool.fill((0, 0, 255))
+        tool_item = ToolItem(scale_to_width(raw_img_tool, 60), screen.get_rect().inflate(-100, -100), (W // 2, H // 2 + 100))
+    has_tool = not con_herramienta
+
+    # Entidades por capas en un solo blits(): glow y herramienta, parches de
+    # bg_todo de las zonas ya reparadas (fijos), jugador y lo que lleva en la mano
+    world = layers.LayeredBatch(static=(layers.PROPS,))
+    parches = {}
+    for key, rect in zones.items():
+        r = rect.clip(bg_todo.get_rect())
+        parches[key] = layers.Prop(bg_todo.subsurface(r), r)
+    carried = layers.Prop(pygame.Surface((1, 1)))
+    carried.visible = False
+    if tool_item:
+        tool_item.add_to(world)
+    world.add(jugador, layer=layers.PLAYER)
+    world.add(carried, layer=layers.CARRIED)
+
+    # --- Estado del juego ---
+    estado_reparacion = {k: False for k in zones}
+    reparando_actualmente = None
+    paused = False; victoria = False; derrota = False
+    nivel_terminado = False
+    TOTAL_MS = nivel["tiempo_ms"]
+    alerta_ms = nivel["alerta_ms"]
+    remaining_ms = TOTAL_MS; suspense_music_started = False
+    num_edificios_reparados = 0
+    show_message = ""
+
+    # Plazos del nivel: mensaje, barra de reparación y espera tras ganar/perder
+    sched = Scheduler()
+    message_fade = sched.tween(1.6, start=False)
+
+    def show_msg(txt: str):
+        nonlocal show_message
+        show_message = txt
+        message_fade.restart()
+
+    def terminar_nivel():
+        nonlocal nivel_terminado
+        nivel_terminado = True
+
+    def soltar_herramienta():
+        nonlocal has_tool
+        if con_herramienta:
+            has_tool = False
+            jugador.carrying_image = None
+
+    def completar_reparacion():
+        nonlocal reparando_actualmente, num_edificios_reparados, victoria
+        zona = reparando_actualmente
+        reparando_actualmente = None
+        if zona is None:
+            return
+        estado_reparacion[zona] = True
+        zone_index.remove(zona)
+        world.add(parches[zona], layer=layers.PROPS)
+        num_edificios_reparados += 1
+        soltar_herramienta()
+        play_sfx("sfx_plant", assets_dir)
+        show_msg(config.obtener_nombre("txt_zona_reparada"))
+        if all(estado_reparacion.values()):
+            victoria = True
+            stop_level_music()
+            sched.after(FIN_DELAY, terminar_nivel)
+        elif tool_item:
+            tool_item.respawn()
+
+    reparacion = sched.tween(TIEMPO_PARA_REPARAR, 0.0, 1.0, on_done=completar_reparacion, start=False)
+
+    def reset_level():
+        nonlocal estado_reparacion, reparando_actualmente
+        nonlocal victoria, derrota, nivel_terminado, remaining_ms, suspense_music_started, paused
+        nonlocal num_edificios_reparados
+
+        estado_reparacion = {k: False for k in zones}
+        world.remove_sprites_of_layer(layers.PROPS)
+        sched.clear()
+        reparando_actualmente = None
+        victoria = False
+        derrota = False
+        nivel_terminado = False
+        remaining_ms = TOTAL_MS
+        suspense_music_started = False
+        paused = False
+        num_edificios_reparados = 0
+        jugador.place(spawn_pos)
+        soltar_herramienta()
+        if tool_item:
+            tool_item.respawn()
+        _index_zones()
+        start_level_music(assets_dir)
+
+    def intentar_recoger():
+        nonlocal has_tool
+        if has_tool:
+            show_msg(config.obtener_nombre("txt_tutorial_msg7"))
+        elif jugador.rect.colliderect(tool_item.rect.inflate(40, 40)):
+            has_tool = True
+            jugador.carrying_image = scale_to_width(raw_img_tool, max(18, jugador.rect.width // 3))
+            play_sfx("sfx_pick_seed", assets_dir)
+            show_msg(config.obtener_nombre("txt_herramienta_obt"))
+        elif not message_fade.active:
+            show_msg(config.obtener_nombre("txt_recoger"))
+
+    start_level_music(assets_dir)
+    texto_ayuda = config.obtener_nombre("txt_mover_accion_pausa")
+
+    # El hilo de las pantallas finales corre sólo mientras se juega: cualquier
+    # salida (fin del nivel, ESC, QUIT, "menu" de la pausa) lo detiene
+    end_screens.start()
+    try:
+        while True:
+            dt = clock.tick(60) / 1000.0
+            governor.frame(clock.get_rawtime())
+            dt_ms = int(dt * 1000)
+
+            mouse_click = False
+            mouse_pos = pygame.mouse.get_pos()
+
+            for evento in pygame.event.get():
+                if evento.type == pygame.QUIT: stop_level_music(); return "salir"
+
+                if paused:
+                    if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+                        mouse_click = True
+                    if evento.type == pygame.KEYDOWN:
+                        if evento.key == pygame.K_SPACE:
+                            paused = False
+                            play_sfx("sfx_click", assets_dir)
+                        if evento.key == pygame.K_ESCAPE:
+                            stop_level_music(); return "menu"
+
+                elif not (victoria or derrota):
+                    if evento.type == pygame.KEYDOWN:
+                        if evento.key == pygame.K_ESCAPE: stop_level_music(); return "menu"
+                        if evento.key == pygame.K_SPACE:
+                            paused = True
+                            play_sfx("sfx_click", assets_dir)
+                        if con_herramienta and evento.key in (pygame.K_e, pygame.K_RETURN):
+                            intentar_recoger()
+
+            sched.paused = paused
+            sched.update(dt)
+            if nivel_terminado:
+                return "menu"
+
+            if not (victoria or derrota) and not paused:
+                remaining_ms = max(0, remaining_ms - dt_ms)
+
+                if remaining_ms <= 30000 and not suspense_music_started:
+                    start_suspense_music(assets_dir); suspense_music_started = True
+
+                if remaining_ms <= 0:
+                    derrota = True; stop_level_music(); sched.after(FIN_DELAY, terminar_nivel); continue
+
+                jugador.handle_input(dt)
+
+                teclas = pygame.key.get_pressed()
+                hits = zone_index.query_rect(jugador.rect)
+                zona_activa = hits[0] if hits else None
+
+                if zona_activa and teclas[pygame.K_r]:
+                    if has_tool:
+                        # al terminar el tween, completar_reparacion() marca la zona
+                        if reparando_actualmente != zona_activa or not reparacion.active:
+                            reparando_actualmente = zona_activa
+                            reparacion.restart()
+                    elif not message_fade.active:
+                        show_msg(config.obtener_nombre("txt_necesitas_herra"))
+                else:
+                    reparacion.stop(); reparando_actualmente = None
+
+            screen.blit(bg_roto, (0, 0))
+
+            # Zonas reparadas, herramienta y jugador: un solo blits() en orden de capa
+            if tool_item:
+                tool_item.update(not has_tool and not victoria)
+            jugador.place_carried(carried)
+            world.draw(screen)
+
+            if tool_item and not has_tool and not victoria:
+                if jugador.rect.colliderect(tool_item.rect.inflate(60, 60)):
+                    tr_label(font_hud, "txt_recoger", BLANCO, bg=(0, 0, 0, 160), pad=(14, 10), radius=0).blit(
+                        screen, center=(tool_item.rect.centerx, tool_item.rect.top - 25))
+
+            if has_tool:
+                hits = zone_index.query_rect(jugador.rect)
+                if hits:
+                    tr_label(font_hud, "txt_reparar", BLANCO, bg=(0, 0, 0, 150), pad=(12, 8), radius=0).blit(
+                        screen, center=zones[hits[-1]].center)
+
+            if reparando_actualmente:
+                bx = jugador.rect.centerx - 25
+                by = jugador.rect.top - 30
+                pygame.draw.rect(screen, GRIS, (bx, by, 50, 10), border_radius=2)
+                pygame.draw.rect(screen, VERDE, (bx, by, 50 * reparacion.value, 10), border_radius=2)
+
+            screen.blit(render_text(font_hud, texto_ayuda, NEGRO), (15, H - 35))
+            screen.blit(render_text(font_hud, texto_ayuda, BLANCO), (13, H - 37))
+
+            if not (victoria or derrota):
+                margin_y = int(H * 0.04)
+                rect_tiempo = timer_rect(W, H, margin_y)
+                rect_contador = rect_tiempo.copy()
+                rect_contador.left = W - rect_tiempo.right
+                contador_panel.draw(screen, rect_contador)
+                draw_shadowed(screen, font_timer, f"{num_edificios_reparados}/{TOTAL_ZONES}", NEGRO,
+                              rect_contador.center, shadow=(20, 15, 10))
+                draw_timer(screen, font_timer, timer_panel, rect_tiempo, remaining_ms, alerta_ms)
+
+            # pausa
+            if paused and not (victoria or derrota):
+                accion = pause_menu.draw(screen, mouse_pos, mouse_click)
+                if accion:
+                    play_sfx("sfx_click", assets_dir)
+                if accion == "continuar":
+                    paused = False
+                elif accion == "reiniciar":
+                    reset_level()
+                elif accion == "menu":
+                    stop_level_music()
+                    return "menu"
+
+            for fin, activo, clave in (("win", victoria, "txt_zona_reparada"), ("lose", derrota, "txt_tiempo_agotado")):
+                if not activo:
+                    continue
+                img = end_screens.get(fin)
+                if img:
+                    screen.blit(img, (0, 0))
+                else:
+                    if fin == "win":
+                        screen.blit(bg_todo, (0, 0))
+                    screen.blit(fin_overlays[fin], (0, 0))
+                    txt = tr_text(font_big, clave, BLANCO)
+                    screen.blit(txt, txt.get_rect(center=(W // 2, H // 2)))
+
+            if message_fade.active and show_message:
+                message(font_big, show_message, BLANCO, NEGRO, offset=2).blit(
+                    screen, center=(W // 2, H // 2 + int(H * 0.08)))
+
+            pygame.display.flip()
+    finally:
+        end_screens.stop()
@@ -5,27 +5,14 @@ from typing import Optional, List, Tuple
 from audio_shared import play_sfx
 import re
 import config # IMPORTAR CONFIG
+import asset_variants
+from idle import menu_idle
+from backdrop import backdrop
 
 # ===== helpers (MODIFICADO: Usa config.obtener_nombre) =====
 def find_by_stem(assets_dir: Path, stem: str) -> Optional[Path]:
-    real_name = config.obtener_nombre(stem)
-    exts = (".png", ".jpg", ".jpeg")
-    
-    for ext in exts:
-        p = assets_dir / f"{real_name}{ext}"
-        if p.exists():
-            return p
-            
-    cands = []
-    for ext in exts:
-        cands += list(assets_dir.glob(f"{real_name}*{ext}"))
-        
-    # Fallback al stem original
-    if not cands and real_name != stem:
-        for ext in exts:
-            cands += list(assets_dir.glob(f"{stem}*{ext}"))
-            
-    return min(cands, key=lambda p: len(p.name)) if cands else None
+    # Traducida si existe; si no, la original (tabla armada al arrancar)
+    return asset_variants.localized(assets_dir, stem)
 
 def load_image(assets_dir: Path, stems: list[str]) -> Optional[pygame.Surface]:
     for stem in stems:
@@ -149,15 +136,13 @@ class SeleccionPersonajeScreen:
         self.PAD_BOTTOM = int(self.h * 0.02)
 
         # Fondo
-        self.bg = load_image(assets_dir, ["Background_f", "bg_inicio", "fondo"])
-        if self.bg is None:
-            self.bg = pygame.Surface((self.w, self.h))
-            self.bg.fill((10,25,40))
-
-        self.bg_scroll_x = 0.0
-        self.bg_speed = 40.0
-        bg_w = int(self.bg.get_width() * (self.h / self.bg.get_height()))
-        self.bg_scaled = pygame.transform.scale(self.bg, (bg_w, self.h))
+        # Fondo: el de los menús (misma copia escalada y misma fase de scroll)
+        try:
+            backdrop.load(assets_dir, (self.w, self.h))
+        except FileNotFoundError:
+            liso = pygame.Surface((self.w, self.h))
+            liso.fill((10,25,40))
+            backdrop.load(assets_dir, (self.w, self.h), liso)
 
         pygame.font.init()
         self.font_title = pygame.font.SysFont("Arial", max(28, self.w//18), bold=True)
@@ -264,17 +249,10 @@ class SeleccionPersonajeScreen:
         if self.check_img:
             self.check_img = scale_to_width(self.check_img, int(self.w * 0.06))
 
-    def _draw_scrolling_bg(self, dt: float):
-        self.bg_scroll_x = (self.bg_scroll_x - self.bg_speed*dt) % self.bg_scaled.get_width()
-        x = -self.bg_scroll_x
-        while x < self.w:
-            self.screen.blit(self.bg_scaled, (int(x), 0))
-            x += self.bg_scaled.get_width()
-
     def run(self) -> Optional[str]:
         while True:
-            dt = self.clock.tick(60) / 1000.0
-            events = pygame.event.get()
+            menu_idle.tick(self.clock)
+            events = menu_idle.events()
             
             mouse_pos = pygame.mouse.get_pos()
             clicked_back = False
@@ -315,7 +293,7 @@ class SeleccionPersonajeScreen:
             # ====================================
             # ============= DIBUJO ===============
             # ====================================
-            self._draw_scrolling_bg(dt)
+            backdrop.draw(self.screen)
 
             if self.title_img:
                 self.screen.blit(self.title_img, self.title_rect)
@@ -0,0 +1,400 @@
+# levels/tutorial.py
+# Mecánica "tutorial": las tres mecánicas en pequeño, una escena tras otra.
+# Parque: una basura al bote. Calle: una semilla al hoyo y esperar el árbol.
+# Plaza: reparar un edificio con R antes de que se acabe el tiempo.
+# Usa los mismos fondos, geometría, colisión, jugador, HUD y pausa que los
+# niveles; posiciones y tiempos vienen de la definición (levels/definiciones.py).
+from __future__ import annotations
+import math
+from pathlib import Path
+from typing import Optional
+import pygame
+import config
+import asset_variants
+from quality import governor
+from fades import FadeSprite, message, pulse, tr_label
+from collision import CollisionMap
+from entity_store import EntityStore
+from scheduler import Scheduler
+import layers
+from levels.comun import (
+    start_level_music, stop_level_music, play_sfx, play_click, volver_a_play,
+    find_first, load_surface, load_image, scale_to_width, load_pixel_font, make_key_icon,
+    load_char_frames, load_geometry, build_collision, Player, Panel, PauseMenu,
+    draw_timer, timer_rect, draw_hud_lines, draw_shadowed, TEXTO_ALERTA,
+)
+from levels.recolectar import Trash, load_bg_fit, load_trash_images, load_bin_image, place_bin
+from levels.plantar import (
+    ASSET_STEMS as CALLE_STEMS, Seed, Hole, make_growth_stages,
+    GROW_STEPS, GROW_TIME_PER_STEP, GLOW_STEPS as HOLE_GLOW_STEPS,
+)
+from levels.reparar import BG_ROTO_STEMS, BG_TODO_STEMS
+
+# Fases: las tres escenas y los dos finales (sólo queda el mensaje)
+PARQUE, CALLE, PLAZA, FIN, FALLO = 0, 1, 2, 3, 99
+TRANSICION = 0.6            # s entre el mensaje de "¡bien!" y la escena siguiente
+INTERACT_KEYS = (pygame.K_e, pygame.K_RETURN)
+CONTADORES = ("contador_basura", "semillita_entregada", "contador_edificios")
+TECLA = 30                  # px de cada tecla del recuadro de movimiento
+
+
+def _placeholder(size: tuple[int, int], color) -> pygame.Surface:
+    s = pygame.Surface(size, pygame.SRCALPHA)
+    s.fill(color)
+    return s
+
+
+def movement_hud(font: pygame.font.Font, titulo: str, key: int = TECLA) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Recuadro "MOVERSE:" con WASD y flechas, armado una vez (antes: un SysFont
+    y ocho renders por frame). Devuelve la Surface y dónde cae la tecla S en ella."""
+    gap = key + 5
+    ax = int(gap * 3.5)
+    key_font = pygame.font.SysFont("arial", int(key * 0.7), bold=True)
+    teclas = [("W", 0, -gap), ("A", -gap, 0), ("S", 0, 0), ("D", gap, 0)]
+    flechas = [("▲", ax, -gap), ("◀", ax - gap, 0), ("▼", ax, 0), ("▶", ax + gap, 0)]
+
+    title = font.render(titulo, True, (255, 255, 255))
+    title_rect = title.get_rect(midbottom=(int(gap * 1.75), int(-key * 1.5)))
+    left, top = min(-gap - key // 2, title_rect.left), min(-gap - key // 2, title_rect.top)
+    right = max(ax + gap + key // 2 + 1, title_rect.right)
+    surf = pygame.Surface((right - left, key // 2 + 1 - top), pygame.SRCALPHA)
+    origin = (-left, -top)
+
+    surf.blit(title, title_rect.move(origin))
+    for grupo, color in ((teclas, (255, 255, 255)), (flechas, (100, 200, 255))):
+        for char, dx, dy in grupo:
+            r = pygame.Rect(0, 0, key, key)
+            r.center = (origin[0] + dx, origin[1] + dy)
+            pygame.draw.rect(surf, (30, 30, 30), r, border_radius=4)
+            pygame.draw.rect(surf, (150, 150, 150), r, 1, border_radius=4)
+            txt = key_font.render(char, True, color)
+            surf.blit(txt, txt.get_rect(center=r.center))
+    return surf, origin
+
+
+def _counter_icon(assets_dir: Path, stem: str, W: int) -> Optional[pygame.Surface]:
+    p = asset_variants.localized(assets_dir, stem)
+    return scale_to_width(load_surface(p), int(W * 0.12)) if p else None
+
+
+def run(screen: pygame.Surface, assets_dir: Path, personaje: str, dificultad: str, nivel: dict):
+    pygame.font.init()
+    clock = pygame.time.Clock()
+    W, H = screen.get_size()
+
+    font = pygame.font.SysFont("arial", 26, bold=True)
+    small_font = pygame.font.SysFont("arial", 20, bold=True)
+    popup_font = pygame.font.SysFont("arial", 28, bold=True)
+    timer_font = pygame.font.SysFont("arial", 40, bold=True)
+    num_font = pygame.font.SysFont("arial", max(18, int(H * 0.055)), bold=True)   # contador del HUD
+    pixel_font = load_pixel_font(assets_dir, H)
+
+    # --- Piezas de las tres escenas (los fondos se cargan al llegar a cada una) ---
+    bin_img = load_bin_image(assets_dir, W)
+    BIN_RADIUS = max(36, int(W * 0.05))
+    trash_imgs = load_trash_images(assets_dir)
+    trash_img = trash_imgs[0] if trash_imgs else _placeholder((40, 40), (160, 160, 160))
+    img_semilla = scale_to_width(load_image(assets_dir, CALLE_STEMS["semilla"]) or _placeholder((44, 44), (150, 255, 150)), 44)
+    img_hoyo = scale_to_width(load_image(assets_dir, CALLE_STEMS["hoyo"]) or _placeholder((66, 66), (139, 69, 19)), 66)
+    img_arbol = scale_to_width(load_image(assets_dir, CALLE_STEMS["arbol"]) or _placeholder((180, 180), (0, 128, 0)), 180)
+    growth_stages = make_growth_stages(img_semilla, img_arbol)
+
+    arrow_p = asset_variants.localized(assets_dir, "flecha_indicador") or find_first(assets_dir, ("flecha", "arrow"))
+    if arrow_p:
+        arrow_img = scale_to_width(load_surface(arrow_p), 30)
+    else:
+        arrow_img = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.polygon(arrow_img, (255, 200, 0), [(0, 30), (15, 0), (30, 30)])
+    counters = [_counter_icon(assets_dir, stem, W) for stem in CONTADORES]
+
+    # --- HUD y pausa (los de los niveles) ---
+    timer_panel = Panel(load_image(assets_dir, ["temporizador", "timer_panel", "panel_tiempo", "TEMPORIZADOR", "TEMPORAZIDOR"]))
+    pause_menu = PauseMenu(assets_dir, (W, H), small_font)
+    icon_fx = FadeSprite(make_key_icon(assets_dir, popup_font, W))
+    keys_hud, keys_origin = movement_hud(font, config.obtener_nombre("txt_movimiento"))
+    keys_pos = (W // 2 - 100 - keys_origin[0], H // 4 - keys_origin[1])
+    hud_lines = [config.obtener_nombre("txt_mover_accion_pausa")]
+
+    # --- Jugador (el mapa de colisión cambia con cada escena) ---
+    try:
+        frames = load_char_frames(assets_dir, target_h=int(H * 0.14), char_folder=personaje)
+    except FileNotFoundError as e:
+        print(f"Error fatal: {e}")
+        return "menu"
+    player = Player(frames, (W // 2, H // 2), screen.get_rect(),
+                    speed=nivel["velocidad"], anim_fps=nivel["anim_fps"])
+    INTERACT_DIST = int(W * nivel["interaccion"])
+
+    def _frac(xy) -> tuple[int, int]:
+        return int(W * xy[0]), int(H * xy[1])
+
+    # Mensajes: un tween 1 -> 0 del scheduler; el cambio de escena también va en él
+    sched = Scheduler()
+    show_message = ""
+    message_color = (255, 255, 255)
+    message_fade = sched.tween(3.5, start=False)
+
+    def set_message(clave: str, duration: float, color=(255, 255, 255)):
+        nonlocal show_message, message_color
+        show_message = config.obtener_nombre(clave)
+        message_color = color
+        message_fade.restart(duration)
+
+    # Estado de la escena actual (entrar() lo rehace)
+    fase = PARQUE
+    background, bg_rect = None, None
+    world = layers.LayeredBatch(static=(layers.PROPS,))
+    bin_rect = pygame.Rect(0, 0, 0, 0)
+    trash: Optional[Trash] = None
+    carrying: Optional[Trash] = None
+    delivered = False
+    seed_store, hole_store = EntityStore(1), EntityStore(1)
+    seed: Optional[Seed] = None
+    hole: Optional[Hole] = None
+    carried = layers.Prop(img_semilla)
+    zona = pygame.Rect(0, 0, 0, 0)
+    parche: Optional[layers.Prop] = None   # la parte arreglada del fondo
+    reparada = False
+    aviso_ms = 0
+    remaining_ms = nivel["tiempo_ms"]
+
+    def entrar(k: int):
+        """Monta la escena k: fondo, geometría y colisión del nivel, objetos y jugador."""
+        nonlocal fase, background, bg_rect, world, bin_rect, trash, carrying, delivered
+        nonlocal seed, hole, zona, parche, reparada, aviso_ms, remaining_ms
+        fase = k
+        escena = nivel["fases"][k]
+        geo = load_geometry(assets_dir, (W, H), escena)
+        colision = build_collision(assets_dir, (W, H), escena, geo)
+        world = layers.LayeredBatch(static=(layers.PROPS,))
+        player.carrying_image = None
+        aviso_ms = nivel["aviso_ms"]
+
+        if k == PARQUE:
+            background, bg_rect = load_bg_fit(assets_dir, W, H)
+            bin_rect = place_bin(bin_img, W, H, geo)
+            if geo is None:
+                colision = colision or CollisionMap((W, H))
+                colision.add_footprint(bin_img, bin_rect)
+            world.add(layers.Prop(bin_img, bin_rect), layer=layers.PROPS)
+            trash = Trash(trash_img, _frac(nivel["basura"]), int(W * nivel["escala_basura"]))
+            trash.add_to(world)
+            carrying, delivered = None, False
+        elif k == CALLE:
+            fondo = load_image(assets_dir, CALLE_STEMS["fondo"]) or _placeholder((W, H), (90, 90, 90))
+            background, bg_rect = pygame.transform.scale(fondo, (W, H)), pygame.Rect(0, 0, W, H)
+            seed_store.clear(); hole_store.clear()
+            seed = Seed(_frac(nivel["semilla"]), img_semilla, seed_store)
+            hole = Hole(_frac(nivel["hoyo"]), img_hoyo, hole_store)
+            hole.add_to(world)
+            world.add(seed, layer=layers.ITEMS)
+            carried.visible = False
+            world.add(carried, layer=layers.CARRIED)
+        else:
+            roto = load_image(assets_dir, BG_ROTO_STEMS, deep=True) or _placeholder((W, H), (100, 100, 100))
+            todo = load_image(assets_dir, BG_TODO_STEMS, deep=True) or _placeholder((W, H), (100, 200, 100))
+            background, bg_rect = pygame.transform.scale(roto, (W, H)), pygame.Rect(0, 0, W, H)
+            zona = (geo["zonas"] if geo else escena["zonas"](W, H))[nivel["zona"]].clip(bg_rect)
+            parche = layers.Prop(pygame.transform.scale(todo, (W, H)).subsurface(zona), zona)
+            parche.visible = False
+            world.add(parche, layer=layers.PROPS)
+            reparada = False
+            remaining_ms = nivel["tiempo_ms"]
+
+        world.add(player, layer=layers.PLAYER)
+        player.colision = colision
+        player.place(_frac(nivel["inicio"][k]))
+
+    def reset_tutorial():
+        sched.clear()
+        entrar(PARQUE)
+        start_level_music(assets_dir)
+
+    def _try_interact():
+        nonlocal carrying, delivered
+        px, py = player.rect.center
+        if fase == PARQUE and not delivered:
+            if not carrying:
+                if math.hypot(px - trash.rect.centerx, py - trash.rect.centery) <= INTERACT_DIST:
+                    carrying = trash
+                    carrying.carried = True
+                    world.change_layer(carrying, layers.CARRIED)
+                    set_message("txt_tutorial_msg1", 1.5)
+                    play_sfx("sfx_pick_up", assets_dir)
+            elif math.hypot(px - bin_rect.centerx, py - bin_rect.centery) <= BIN_RADIUS * 1.5:
+                carrying.kill()
+                carrying, delivered = None, True
+                set_message("txt_tutorial_msg2", 4.0)
+                play_sfx("sfx_win", assets_dir)
+                sched.after(TRANSICION, entrar, CALLE)
+        elif fase == CALLE:
+            if player.carrying_image is None:
+                if not seed.taken and math.hypot(px - seed.rect.centerx, py - seed.rect.centery) <= INTERACT_DIST:
+                    seed.taken = True
+                    player.carrying_image = img_semilla
+                    set_message("txt_tutorial_msg3", 2.0)
+                    play_sfx("sfx_pick_seed", assets_dir)
+            elif (not hole.has_tree and hole.grow_timer == 0
+                  and math.hypot(px - hole.rect.centerx, py - hole.rect.centery) <= INTERACT_DIST):
+                player.carrying_image = None
+                hole.start_grow()
+                set_message("txt_tutorial_msg4", 3.0)
+                play_sfx("sfx_plant", assets_dir)
+
+    def _point_arrow(target: tuple[int, int]):
+        """Flecha girando alrededor del jugador hacia `target`."""
+        px, py = player.rect.center
+        ang = math.atan2(target[1] - py, target[0] - px)
+        rot = pygame.transform.rotate(arrow_img, -math.degrees(ang) - 90)
+        d = player.rect.height * 0.7
+        screen.blit(rot, rot.get_rect(center=(int(px + d * math.cos(ang)), int(py + d * math.sin(ang)))))
+
+    def _hint(target: pygame.Rect, clave: str):
+        icon_pos = (target.centerx, target.top - int(H * 0.035))
+        recti = icon_fx.blit(screen, 220 / 255 * pulse(t, 6.0, 0.6, 1.0), center=icon_pos)
+        tr_label(small_font, clave).blit(screen, midtop=(recti.centerx, recti.bottom + 4))
+
+    entrar(PARQUE)
+    start_level_music(assets_dir)
+    paused = False
+    t = 0.0
+
+    while True:
+        dt_ms = clock.tick(60)
+        governor.frame(clock.get_rawtime())
+        dt = dt_ms / 1000.0
+        t += dt
+        click = False
+
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                stop_level_music()
+                return "menu"
+            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                click = True
+            if e.type == pygame.KEYDOWN:
+                if e.key == pygame.K_ESCAPE:
+                    play_click(assets_dir)
+                    stop_level_music()
+                    return "menu"
+                if e.key == pygame.K_SPACE and fase < FIN:
+                    paused = not paused
+                    play_click(assets_dir)
+                elif paused or fase >= FIN:
+                    continue
+                elif e.key in INTERACT_KEYS:
+                    _try_interact()
+                elif e.key == pygame.K_r and fase == PLAZA and not reparada and player.rect.colliderect(zona):
+                    # Reparación instantánea: en el nivel hay que mantener R
+                    reparada = True
+                    parche.visible = True
+                    world.touch(layers.PROPS)
+                    play_sfx("sfx_win", assets_dir)
+                    set_message("txt_tutorial_msg6", 5.0)
+                    fase = FIN
+
+        # La pausa congela también el mensaje y el cambio de escena
+        sched.paused = paused
+        sched.update(dt)
+
+        if fase >= FIN and not message_fade.active:
+            break
+
+        if not paused:
+            aviso_ms = max(0, aviso_ms - dt_ms)
+            if fase < FIN:
+                player.handle_input(dt)
+            if fase == CALLE:
+                for _ in hole_store.advance_growth(dt_ms, GROW_TIME_PER_STEP, GROW_STEPS):
+                    play_sfx("sfx_grow", assets_dir)
+                    world.touch(layers.PROPS)   # el hoyo ya no se dibuja: ahora es árbol
+                    set_message("txt_tutorial_msg5", 4.0)
+                    sched.after(TRANSICION, entrar, PLAZA)
+            elif fase == PLAZA:
+                remaining_ms = max(0, remaining_ms - dt_ms)
+                if remaining_ms <= 0:
+                    play_sfx("sfx_lose", assets_dir)
+                    set_message("txt_tutorial_fail", 5.0, TEXTO_ALERTA)
+                    fase = FALLO
+
+        # DIBUJO
+        screen.fill((34, 45, 38))
+        screen.blit(background, bg_rect)
+
+        if carrying:
+            carrying.rect.center = player._get_carry_anchor()
+        if trash and fase == PARQUE:
+            trash.glow.update(t)
+        if hole and fase == CALLE:
+            glow_k = None
+            if player.carrying_image is not None and governor.glow:
+                pul = (math.sin(governor.anim_time(t) * 6.0) + 1) * 0.5
+                glow_k = int(pul * (HOLE_GLOW_STEPS - 1) + 0.5)
+            hole.sync(growth_stages, glow_k)
+            player.place_carried(carried)
+        world.draw(screen)
+
+        px, py = player.rect.center
+        if fase == PARQUE and not delivered:
+            if not carrying:
+                screen.blit(keys_hud, keys_pos)
+                if math.hypot(px - trash.rect.centerx, py - trash.rect.centery) <= INTERACT_DIST:
+                    _hint(trash.rect, "txt_recoger")
+            else:
+                _point_arrow(bin_rect.center)
+                if math.hypot(px - bin_rect.centerx, py - bin_rect.centery) <= BIN_RADIUS * 1.5:
+                    _hint(bin_rect, "txt_depositar_e")
+        elif fase == CALLE and not hole.has_tree:
+            if player.carrying_image is None and not seed.taken:
+                screen.blit(keys_hud, keys_pos)
+                if math.hypot(px - seed.rect.centerx, py - seed.rect.centery) <= INTERACT_DIST:
+                    _hint(seed.rect, "txt_recoger_semilla")
+            elif player.carrying_image is not None:
+                _point_arrow(hole.rect.center)
+                if math.hypot(px - hole.rect.centerx, py - hole.rect.centery) <= INTERACT_DIST:
+                    _hint(hole.rect, "txt_plantar_semilla")
+        elif fase == PLAZA:
+            _point_arrow(zona.center)
+            if player.rect.colliderect(zona):
+                tr_label(small_font, "txt_reparar").blit(screen, center=(zona.centerx, zona.centery + 10))
+
+        draw_hud_lines(screen, font, hud_lines)
+
+        # Contador de la escena (1 al completarla) y temporizador
+        actual = min(fase, PLAZA)
+        hecho = (delivered, hole is not None and hole.has_tree, reparada)[actual]
+        icon = counters[actual]
+        if icon:
+            contador_rect = icon.get_rect(topleft=(int(W * 0.015), int(H * 0.10)))
+            screen.blit(icon, contador_rect)
+            nw, _ = num_font.size(str(int(hecho)))
+            draw_shadowed(screen, num_font, str(int(hecho)), (255, 255, 255),
+                          (contador_rect.right - 20 - nw // 2, contador_rect.centery))
+        if actual == PLAZA:
+            draw_timer(screen, timer_font, timer_panel, timer_rect(W, H), remaining_ms, nivel["alerta_ms"])
+        elif aviso_ms > 0:
+            draw_timer(screen, timer_font, timer_panel, timer_rect(W, H), aviso_ms)
+
+        if message_fade.active and show_message:
+            message(pixel_font, show_message, message_color).blit(screen, message_fade.value,
+                                                                  center=(W // 2, H // 2 + int(H * 0.08)))
+
+        if paused:
+            accion = pause_menu.draw(screen, pygame.mouse.get_pos(), click)
+            if accion:
+                play_click(assets_dir)
+            if accion == "continuar":
+                paused = False
+            elif accion == "reiniciar":
+                reset_tutorial()
+                paused = False
+            elif accion == "menu":
+                stop_level_music()
+                return "menu"
+
+        pygame.display.flip()
+
+    # --- Fin (tras el mensaje de victoria o de tiempo agotado): selección de nivel ---
+    stop_level_music()
+    volver_a_play(screen, assets_dir)
+    return "menu"
@@ -4,16 +4,27 @@ import play
 import instrucciones
 import tutorial
 import config # IMPORTANTE: Importar el config para traducciones
+import asset_variants
+import display
+from quality import governor
+from idle import menu_idle
+from backdrop import backdrop
 from pathlib import Path
-from audio_shared import start_menu_music, ensure_menu_music_running, play_click
-
-pygame.init()
+from audio_shared import (start_menu_music, ensure_menu_music_running, play_click, preload_sfx,
+                          preload_music, stop_music, apply_audio_profile)
+from intro_player import (IntroPlayer, file_digest, fit_intro, intro_audio_cache_path,
+                          start_audio_extraction)
+from intro_frames import open_store
 
 # ===== RUTAS / CONFIG =====
 BASE_DIR = Path(__file__).resolve().parent
 os.chdir(BASE_DIR)
 ASSETS = BASE_DIR / "assets"
 
+# El perfil de audio (buffer del mixer) tiene que fijarse antes de pygame.init()
+apply_audio_profile(ASSETS)
+pygame.init()
+
 # === STEMS ===
 STEMS = {
     "bg": "Background_f",
@@ -39,130 +50,99 @@ def reproducir_intro(screen, assets_dir):
         print(f"[INFO] No se encontró {video_path}, saltando intro.")
         return
 
+    screen_w, screen_h = screen.get_size()
+    digest = file_digest(video_path)
+    audio_cache = intro_audio_cache_path(video_path, digest)
+    store = None
+    clip = None
+
     try:
-        # Intentamos importar MoviePy (compatible con v1 y v2)
-        try:
-            from moviepy import VideoFileClip
-        except ImportError:
-            from moviepy.editor import VideoFileClip
-        
-        print("[INFO] Cargando video de introducción...")
-        
-        # Cargar el video
-        clip = VideoFileClip(str(video_path))
-        
-        # --- AJUSTE DE TAMAÑO Y POSICIÓN ---
-        screen_w, screen_h = screen.get_size()
-        video_w, video_h = clip.size
-        
-        # Calcular escala para que quepa en pantalla (85% del tamaño disponible)
-        # manteniendo la relación de aspecto original para no perder calidad
-        scale = min(screen_w / video_w, screen_h / video_h) * 0.85
-        new_w = int(video_w * scale)
-        new_h = int(video_h * scale)
-        
+        # Frames pre-renderizados (python intro_frames.py): se leen del mmap,
+        # sin abrir MoviePy ni ffmpeg.
+        store = open_store(video_path, (screen_w, screen_h), digest)
+        if store is not None:
+            print("[INFO] Intro pre-renderizado encontrado en cache/.")
+            frames, fps = store, store.fps
+            new_w, new_h = store.size
+            has_audio = True
+        else:
+            # Intentamos importar MoviePy (compatible con v1 y v2)
+            try:
+                from moviepy import VideoFileClip
+            except ImportError:
+                from moviepy.editor import VideoFileClip
+
+            print("[INFO] Cargando video de introducción...")
+
+            # Sólo para leer el tamaño original y si trae audio
+            probe = VideoFileClip(str(video_path))
+            video_w, video_h = probe.size
+            has_audio = probe.audio is not None
+            probe.close()
+
+            # --- AJUSTE DE TAMAÑO Y POSICIÓN ---
+            # Cabe en pantalla (85%) manteniendo la relación de aspecto original
+            new_w, new_h = fit_intro((video_w, video_h), (screen_w, screen_h))
+
+            # ffmpeg entrega los frames ya escalados (target_resolution es (alto, ancho))
+            clip = VideoFileClip(str(video_path), target_resolution=(new_h, new_w), audio=False)
+            new_w, new_h = clip.size
+            frames, fps = clip.iter_frames(fps=clip.fps, dtype="uint8"), clip.fps
+
         # Calcular posición para centrar
         pos_x = (screen_w - new_w) // 2
         pos_y = (screen_h - new_h) // 2
-        
-        if hasattr(clip, "resized"): # MoviePy v2
-            clip = clip.resized(new_size=(new_w, new_h))
-        else: # MoviePy v1
-            clip = clip.resize(newsize=(new_w, new_h))
-        
+
         # --- REPRODUCTOR MANUAL ---
-        # Extraemos el audio a un archivo temporal para que Pygame lo toque
-        # Esto evita depender de herramientas externas para el audio
-        audio_temp = assets_dir / "temp_intro_audio.mp3"
-        
-        if clip.audio:
-            # logger=None evita que llene la consola de barras de carga
-            print("[INFO] Procesando audio del video...")
+        # El audio se extrae una sola vez a cache/ (clave: hash del video).
+        # Con caché caliente suena de inmediato; la primera vez se extrae en
+        # segundo plano y el video arranca sin sonido.
+        if audio_cache.exists():
             try:
-                clip.audio.write_audiofile(str(audio_temp), logger=None)
-                pygame.mixer.music.load(str(audio_temp))
+                pygame.mixer.music.load(str(audio_cache))
                 pygame.mixer.music.play()
             except Exception as e:
                 print(f"⚠️ No se pudo cargar el audio del video: {e}")
+        elif has_audio:
+            print("[INFO] Extrayendo audio del intro en segundo plano...")
+            start_audio_extraction(video_path, audio_cache)
 
-        clock = pygame.time.Clock()
-        fps = clip.fps
-        running = True
-        
         print("[INFO] Reproduciendo video...")
-        
-        # Iteramos sobre cada cuadro del video
-        start_ticks = pygame.time.get_ticks()
-        
-        for frame in clip.iter_frames(fps=fps, dtype="uint8"):
-            if not running:
-                break
-            
-            # Manejo de eventos (para poder saltar el video con click o tecla)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                    pygame.quit()
-                    return
-                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    running = False # Saltar intro
-            
-            # Convertir el frame de MoviePy (numpy array) a Pygame Surface
-            # swapaxes es necesario porque MoviePy usa (y, x) y Pygame (x, y)
-            video_surf = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            
-            # 1. Llenar fondo de negro
-            screen.fill((0, 0, 0))
-            # 2. Dibujar video centrado
-            screen.blit(video_surf, (pos_x, pos_y))
-            pygame.display.flip()
-            
-            # Controlar la velocidad (FPS)
-            clock.tick(fps)
-        
+
+        # Decodifica en otro hilo hacia un ring buffer y presenta al ritmo del audio
+        player = IntroPlayer(screen, frames, fps, (new_w, new_h), (pos_x, pos_y))
+        if player.run() == "salir":
+            pygame.quit()
+            return
+
         # Limpieza
         pygame.mixer.music.stop()
         pygame.mixer.music.unload()
-        clip.close()
-        
-        # Borrar el archivo de audio temporal
-        if audio_temp.exists():
-            try:
-                os.remove(audio_temp)
-            except:
-                pass
-        
+
         # Restaurar título
         pygame.display.set_caption("Guardianes del Planeta")
-        
+
     except ImportError:
         print("⚠️ [AVISO] Instala moviepy para ver el intro: pip install moviepy")
     except Exception as e:
         print(f"⚠️ [ERROR] Saltando intro por error interno: {e}")
+    finally:
+        if clip is not None:
+            clip.close()
+        if store is not None:
+            store.close()
 
 
 # ===== HELPERS IMG =====
 def find_by_stem(stem: str) -> Path | None:
-    exts = (".png", ".jpg", ".jpeg")
-    for ext in exts:
-        p = ASSETS / f"{stem}{ext}"
-        if p.exists():
-            return p
-    cands = []
-    for ext in exts:
-        cands += list(ASSETS.glob(f"{stem}*{ext}"))
-    return sorted(cands, key=lambda p: len(p.name))[0] if cands else None
+    return asset_variants.find(ASSETS, stem)
 
 def load_raw(stem: str):
     # === CAMBIO: TRADUCCIÓN ===
     # Buscamos el nombre real según el idioma actual en config
-    real_name = config.obtener_nombre(stem)
-    
-    p = find_by_stem(real_name)
-    # Si no encuentra la versión traducida, intenta la original (fallback)
-    if not p and real_name != stem:
-        p = find_by_stem(stem)
-        
+    # (tabla de variantes armada al arrancar; si falta la traducida, usa la original)
+    p = asset_variants.localized(ASSETS, stem)
+
     if not p:
         # Fallback específico para Tutorial si no existe
         if stem == "Tutorial":
@@ -191,20 +171,31 @@ opciones.load_lang(ASSETS)
 # 2. Sincronizar config.py con lo que cargó opciones
 if hasattr(opciones, "IDIOMA_ACTUAL"):
     config.cambiar_idioma(opciones.IDIOMA_ACTUAL)
+# 3. Imágenes traducidas: se resuelven todas ahora, las pantallas sólo consultan la tabla
+asset_variants.build(ASSETS)
+_faltan = asset_variants.report(ASSETS)
+if _faltan:
+    print(f"[WARN] {len(_faltan)} variantes de idioma sin archivo (python asset_variants.py para el detalle)")
 
 bg_raw, _ = load_raw(STEMS["bg"])
-W, H = bg_raw.get_size()
-screen = pygame.display.set_mode((W, H))
-pygame.display.set_caption("Guardianes del Planeta")
+# Resolución lógica fija (preset de settings.json); SDL la escala a la ventana real
+screen = display.open_window(ASSETS)
+W, H = screen.get_size()
 clock = pygame.time.Clock()
 
+# SFX y música se decodifican en segundo plano mientras corre el intro
+preload_sfx(ASSETS)
+preload_music(ASSETS)
+
 # ==========================================================
 # 🎬 REPRODUCIR INTRO ANTES DE CARGAR EL MENÚ
 # ==========================================================
 reproducir_intro(screen, ASSETS)
 
 # Continuar carga normal...
-background = bg_raw.convert()
+# El fondo se ajusta una vez a la pantalla lógica; lo demás del menú escala con él
+BG_SCALE = display.cover_ratio(bg_raw.get_size(), (W, H))
+backdrop.load(ASSETS, (W, H), bg_raw)
 
 # Variables globales para UI
 title_img = None
@@ -248,7 +239,7 @@ def reload_ui():
 
     # ===== ESCALADOS =====
     TITLE_SCALE = 1.00
-    title_img = sscale(t_img, TITLE_SCALE)
+    title_img = sscale(t_img, TITLE_SCALE * BG_SCALE)
     title_w, title_h = title_img.get_size()
 
     TARGET_BTN_W = int(W * 0.28)
@@ -296,8 +287,6 @@ reload_ui()
 start_menu_music(ASSETS)
 
 # ===== ANIM =====
-scroll_x = 0
-SCROLL_SPEED = 2
 t = 0
 FLOAT_AMP = 8
 FLOAT_SPEED = 0.08
@@ -305,6 +294,9 @@ FLOAT_SPEED = 0.08
 # Helper para lanzar niveles según número/dificultad
 def _load_level_module(nivel: int, dificultad: str):
     if nivel == 1:
+        if dificultad == "infinito":
+            import levels.nivel1_infinito as mod
+            return mod
         if dificultad == "facil":
             import levels.nivel1_facilitopapa as mod
             return mod
@@ -332,21 +324,20 @@ while running:
     mouse_pos = pygame.mouse.get_pos()
     clicked = False
 
-    for event in pygame.event.get():
+    for event in menu_idle.events():
         if event.type == pygame.QUIT:
             running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            screen = display.toggle_fullscreen()
+            backdrop.invalidate()
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             clicked = True
 
-    # Fondo + título
-    scroll_x -= SCROLL_SPEED
-    if scroll_x <= -W:
-        scroll_x = 0
-    screen.blit(background, (scroll_x, 0))
-    screen.blit(background, (scroll_x + W, 0))
+    # Fondo + título (modo tiras: todo lo que se pinta encima se reporta con cover)
+    backdrop.draw(screen, strips=True)
 
     y_float = int(FLOAT_AMP * math.sin(t * FLOAT_SPEED))
-    screen.blit(title_img, ((W - title_w)//2, TITLE_TOP + y_float))
+    backdrop.cover(screen.blit(title_img, ((W - title_w)//2, TITLE_TOP + y_float)))
 
     # Botones (hover)
     def draw_btn(img, img_hover, base_rect):
@@ -362,6 +353,8 @@ while running:
     ro = draw_btn(btn_opc, btn_opc_h, rect_opc)
     ri = draw_btn(btn_inst, btn_inst_h, rect_inst)
     rt = draw_btn(btn_tut, btn_tut_h, rect_tut) 
+    for r in (rj, ro, ri, rt):
+        backdrop.cover(r)
 
     if SHOW_DEBUG_BORDERS:
         pygame.draw.rect(screen, (255, 0, 0), rj, 2)
@@ -371,6 +364,7 @@ while running:
 
     # Clicks
     if clicked:
+        backdrop.invalidate()   # puede abrirse otra pantalla: el próximo frame va completo
         # --- BOTÓN JUGAR ---
         if rj.collidepoint(mouse_pos):
             play_click(ASSETS)
@@ -421,7 +415,7 @@ while running:
                             break
 
                     if NivelClass is not None:
-                        pygame.mixer.music.fadeout(1000) 
+                        stop_music(1000)
                         try:
                             level = NivelClass(screen, ASSETS, char_folder=char_folder)
                         except TypeError:
@@ -446,7 +440,7 @@ while running:
                         ensure_menu_music_running(ASSETS)
 
                     elif hasattr(nivel_mod, "run"):
-                        pygame.mixer.music.fadeout(1000) 
+                        stop_music(1000)
                         try:
                             nivel_mod.run(screen, ASSETS, dificultad=dif, personaje=char_folder)
                         except TypeError:
@@ -505,7 +499,8 @@ while running:
             continue
 
     pygame.display.flip()
-    clock.tick(60)
+    menu_idle.tick(clock)
+    governor.frame(menu_idle.work_ms)
     t += 1
 
 pygame.quit()
\ No newline at end of file
@@ -0,0 +1,180 @@
+# music_engine.py
+# Música de menú / nivel / suspenso sin cortes.
+# Antes cada cambio hacía mixer.music.load() + play(): se detenía el decoder,
+# se abría otro archivo y la pista nueva empezaba tras un hueco audible.
+# Aquí cada pista se decodifica una vez a un mixer.Sound (en un hilo) y suena
+# en su propio canal reservado; cambiar de pista es un crossfade de volúmenes
+# entre canales que ya están sonando. La pista de menú se pausa en vez de
+# detenerse, así al volver sigue donde iba.
+# Todo (carga de archivos y rampas) ocurre en el hilo del motor: play()/stop()
+# sólo encolan y vuelven al instante.
+from __future__ import annotations
+import math
+import queue
+import threading
+import time
+import pygame
+from pathlib import Path
+from typing import Callable, Optional
+
+RAMP_STEP = 0.01        # s entre ajustes de volumen durante un crossfade
+
+
+class _Track:
+    __slots__ = ("name", "stems", "resume", "path", "sound", "channel", "level", "missing")
+
+    def __init__(self, name: str, stems: list[str], resume: bool):
+        self.name = name
+        self.stems = stems
+        self.resume = resume          # True: al salir se pausa (menú) en vez de parar
+        self.path: Optional[Path] = None
+        self.sound: Optional[pygame.mixer.Sound] = None
+        self.channel: Optional[pygame.mixer.Channel] = None
+        self.level = 0.0              # ganancia actual 0..1 (antes del volumen maestro)
+        self.missing = False
+
+
+class MusicEngine:
+    """Pistas pre-decodificadas en canales reservados + crossfades en un hilo.
+
+    - add_track(name, stems, resume=False): registra una pista (antes de start()).
+    - start(assets_dir, find, first_channel): arranca el hilo y decodifica todas
+      las pistas. Usa un canal por pista desde `first_channel`; quien llama
+      debe tenerlos reservados en el mixer.
+    - play(name, fade_ms, restart): crossfade hacia `name`.
+    - stop(fade_ms): baja todo (las pistas `resume` quedan en pausa).
+    - set_volume(v): volumen maestro, se aplica en caliente.
+    """
+
+    def __init__(self):
+        self._tracks: dict[str, _Track] = {}
+        self._cmds: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._assets: Optional[Path] = None
+        self._find: Optional[Callable[[Path, list[str]], Optional[Path]]] = None
+        self.volume = 1.0
+        self.current: Optional[str] = None
+
+    def add_track(self, name: str, stems: list[str], resume: bool = False) -> None:
+        self._tracks[name] = _Track(name, stems, resume)
+
+    # ---------- API (hilo principal, no bloquea) ----------
+    @property
+    def channel_count(self) -> int:
+        return len(self._tracks)
+
+    def start(self, assets_dir: Path, find: Callable[[Path, list[str]], Optional[Path]],
+              first_channel: int = 0) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._assets, self._find = assets_dir, find
+        for i, tr in enumerate(self._tracks.values()):
+            tr.channel = pygame.mixer.Channel(first_channel + i)
+        self._thread = threading.Thread(target=self._run, name="music-engine", daemon=True)
+        self._thread.start()
+        self._cmds.put(("preload",))
+
+    def play(self, name: str, fade_ms: int = 800, restart: bool = False) -> None:
+        if name == self.current and not restart:
+            return
+        self.current = name
+        self._cmds.put(("play", name, fade_ms, restart))
+
+    def stop(self, fade_ms: int = 500) -> None:
+        self.current = None
+        self._cmds.put(("play", None, fade_ms, False))
+
+    def set_volume(self, v: float) -> None:
+        self.volume = max(0.0, min(1.0, float(v)))
+        self._cmds.put(("volume",))
+
+    # ---------- hilo del motor ----------
+    def _load(self, tr: _Track) -> bool:
+        if tr.sound is not None:
+            return True
+        if tr.missing:
+            return False
+        tr.path = self._find(self._assets, tr.stems)
+        if tr.path is None:
+            tr.missing = True
+            print(f"ADVERTENCIA: No se encontró música '{tr.name}' ({tr.stems[0]}) en {self._assets / 'msuiquita'}")
+            return False
+        try:
+            t0 = time.perf_counter()
+            tr.sound = pygame.mixer.Sound(str(tr.path))
+            print(f"[INFO] Música '{tr.name}' decodificada ({tr.sound.get_length():.0f} s) "
+                  f"en {(time.perf_counter() - t0) * 1000:.0f} ms")
+            return True
+        except Exception as e:
+            tr.missing = True
+            print(f"ADVERTENCIA: No se pudo decodificar '{tr.path.name}': {e}")
+            return False
+
+    def _apply(self, tr: _Track) -> None:
+        if tr.channel is not None:
+            tr.channel.set_volume(tr.level * self.volume)
+
+    def _run(self) -> None:
+        while True:
+            cmd = self._cmds.get()
+            if not pygame.mixer.get_init():
+                continue           # pygame.quit() ya cerró el mixer
+            try:
+                if cmd[0] == "preload":
+                    for tr in self._tracks.values():
+                        self._load(tr)
+                        if not self._cmds.empty():
+                            self._cmds.put(("preload",))   # atender play() primero, luego seguir
+                            break
+                elif cmd[0] == "volume":
+                    for tr in self._tracks.values():
+                        self._apply(tr)
+                elif cmd[0] == "play":
+                    self._crossfade(*cmd[1:])
+            except Exception as e:   # el motor nunca debe tumbar el juego
+                if pygame.mixer.get_init():
+                    print(f"⚠️ Música: {e}")
+
+    def _crossfade(self, name: Optional[str], fade_ms: int, restart: bool) -> None:
+        target = self._tracks.get(name) if name else None
+        if target is not None:
+            if not self._load(target):
+                target = None
+            else:
+                ch = target.channel
+                if restart or not ch.get_busy():
+                    target.level = 0.0
+                    self._apply(target)
+                    ch.play(target.sound, loops=-1)
+                else:
+                    ch.unpause()           # el menú sigue donde se quedó
+
+        outgoing = [tr for tr in self._tracks.values()
+                    if tr is not target and tr.channel is not None and tr.level > 0.0]
+        starts = {tr.name: tr.level for tr in outgoing}
+        t_in0 = target.level if target is not None else 0.0
+        duration = max(0.0, fade_ms / 1000.0)
+        t0 = time.perf_counter()
+
+        # Rampa de igual potencia (cos/sin); se interrumpe si llega otro comando
+        while True:
+            p = 1.0 if duration == 0 else min(1.0, (time.perf_counter() - t0) / duration)
+            g_out = math.cos(p * math.pi / 2)
+            g_in = math.sin(p * math.pi / 2)
+            for tr in outgoing:
+                tr.level = starts[tr.name] * g_out
+                self._apply(tr)
+            if target is not None:
+                target.level = t_in0 + (1.0 - t_in0) * g_in
+                self._apply(target)
+            if p >= 1.0 or not self._cmds.empty():
+                break
+            time.sleep(RAMP_STEP)
+
+        if p >= 1.0:
+            for tr in outgoing:
+                tr.level = 0.0
+                if tr.resume:
+                    tr.channel.pause()
+                else:
+                    tr.channel.stop()
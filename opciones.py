@@ -1,51 +1,37 @@
 from pathlib import Path
 import pygame
 import config # <--- 1. IMPORTAR CONFIGURACIÓN
+import asset_variants
+from quality import governor
+from idle import menu_idle
+from backdrop import backdrop
 from audio_shared import (
     load_master_volume,
-    set_music_volume_now,
     save_master_volume,
     play_click,
-    set_sfx_volume_now,
 )
+from settings import get_settings
 # =========================
 # Helpers mínimos locales
 # =========================
 def find_by_stem(assets_dir: Path, stem: str):
     """Busca una imagen por prefijo en /assets y retorna Path o None."""
-    exts = (".png", ".jpg", ".jpeg")
-    for ext in exts:
-        p = assets_dir / f"{stem}{ext}"
-        if p.exists():
-            return p
-    cands = []
-    for ext in exts:
-        cands += list(assets_dir.glob(f"{stem}*{ext}"))
-    return min(cands, key=lambda p: len(p.name)) if cands else None
+    return asset_variants.find(assets_dir, stem)
 
 def load_image(assets_dir: Path, stems: list[str]) -> pygame.Surface:
     """Carga la primera coincidencia de stems y hace convert/convert_alpha."""
     
     # === MEJORA: TRADUCCIÓN Y FALLBACK ROBUSTO ===
-    candidates = []
-    if stems:
-        key = stems[0]
-        # 1. Agregar el nombre traducido (real_name) como primera opción
-        real_name = config.obtener_nombre(key)
-        candidates.append(real_name)
-        
-        # 2. Agregar los stems originales como opciones de fallback
-        for stem in stems:
-            if stem not in candidates:
-                candidates.append(stem)
-        
-        
-    # Usamos la lista de candidatos que ahora incluye la traducción y los fallbacks
-    for stem in candidates:
-        p = find_by_stem(assets_dir, stem)
+    # 1. La primera clave sale de la tabla de variantes (traducida o, si falta, la original)
+    # 2. Los demás stems son fallbacks literales
+    p = asset_variants.localized(assets_dir, stems[0]) if stems else None
+    for stem in stems[1:]:
         if p:
-            img = pygame.image.load(str(p))
-            return img.convert_alpha() if p.suffix.lower()==".png" else img.convert()
+            break
+        p = find_by_stem(assets_dir, stem)
+    if p:
+        img = pygame.image.load(str(p))
+        return img.convert_alpha() if p.suffix.lower()==".png" else img.convert()
     
     # Fallback: crea una superficie rosa si no encuentra la imagen para que no crashee
     print(f"AVISO: No se encontró imagen para {stems}, usando cuadro rosa.")
@@ -58,29 +44,16 @@ def scale_to_width(img: pygame.Surface, new_w: int) -> pygame.Surface:
     return pygame.transform.smoothscale(img, (new_w, int(img.get_height()*r)))
 
 # =========================
-# Persistencia simple de idioma
+# Persistencia de idioma (settings.json)
 # =========================
-def _lang_path_from_assets(assets_dir: Path) -> Path:
-    return assets_dir.parent / "lang.txt"
-
 def load_lang(assets_dir: Path) -> str:
-    p = _lang_path_from_assets(assets_dir)
-    try:
-        if p.exists():
-            s = p.read_text(encoding="utf-8").strip().lower()
-            lang = "en" if s == "en" else "es"
-            # === CAMBIO: Sincronizar config al cargar ===
-            config.cambiar_idioma(lang) 
-            return lang
-    except Exception:
-        pass
-    return "es"
+    lang = get_settings(assets_dir).get("lang", "es")
+    # === CAMBIO: Sincronizar config al cargar ===
+    config.cambiar_idioma(lang)
+    return lang
 
 def save_lang(assets_dir: Path, code: str) -> None:
-    try:
-        _lang_path_from_assets(assets_dir).write_text(code, encoding="utf-8")
-    except Exception:
-        pass
+    get_settings(assets_dir).set("lang", code)
 
 # =========================
 # Widgets simples (pixel style)
@@ -213,11 +186,7 @@ def run(screen: pygame.Surface, assets_dir: Path):
     lang = load_lang(assets_dir)
 
     # Fondo con scroll
-    background = load_image(assets_dir, ["Background_f", "Background_fondo"])
-    background = pygame.transform.smoothscale(background, (W, H))
-    bw, bh = background.get_size()
-    scroll_x = 0
-    SCROLL_SPEED = 2
+    backdrop.load(assets_dir, (W, H))
 
     # --- CARGA DE IMÁGENES DE TÍTULOS (Modificado para recargar) ---
     # Usamos una función interna para poder refrescar las imágenes cuando cambie el idioma
@@ -315,7 +284,7 @@ def run(screen: pygame.Surface, assets_dir: Path):
         # Recalcular rect de back_img por si cambió de tamaño al recargar
         back_draw_rect = back_img.get_rect(bottomleft=(margin_x, H - margin_y))
 
-        for e in pygame.event.get():
+        for e in menu_idle.events():
             if e.type == pygame.QUIT:
                 pygame.quit()
                 raise SystemExit
@@ -339,16 +308,11 @@ def run(screen: pygame.Surface, assets_dir: Path):
             btn_es.handle(e)
             btn_en.handle(e)
 
-        # Volumen maestro en caliente
-        set_music_volume_now(assets_dir, slider.value)
-        set_sfx_volume_now(assets_dir, slider.value)
+        # Volumen maestro en caliente (sólo llega al mixer si el slider se movió)
+        save_master_volume(assets_dir, slider.value)
 
         # Fondo scroll
-        scroll_x -= SCROLL_SPEED
-        if scroll_x <= -bw:
-            scroll_x = 0
-        screen.blit(background, (scroll_x, 0))
-        screen.blit(background, (scroll_x + bw, 0))
+        backdrop.draw(screen)
 
         # --- DIBUJAR IMÁGENES DE TÍTULOS ---
         screen.blit(title_main_img, title_main_img.get_rect(midtop=(W//2, int(H*0.09))))
@@ -368,10 +332,12 @@ def run(screen: pygame.Surface, assets_dir: Path):
             screen.blit(back_img, back_draw_rect)
 
         pygame.display.flip()
-        clock.tick(60)
+        menu_idle.tick(clock)
+        governor.frame(menu_idle.work_ms)
 
     # Guardar idioma + volumen maestro al salir
     save_lang(assets_dir, lang)
     save_master_volume(assets_dir, slider.value)
+    get_settings(assets_dir).flush()
     
     return {"volume": round(slider.value, 3), "lang": lang}
\ No newline at end of file
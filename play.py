@@ -1,8 +1,12 @@
 # play.py
 import pygame
 from pathlib import Path
-from audio_shared import play_sfx 
+from audio_shared import play_sfx, stop_music
 import config # IMPORTAR CONFIG
+import asset_variants
+from quality import governor
+from idle import menu_idle
+from backdrop import backdrop
 import traceback # Necesario para el try/except de dificultad
 
 # --- IMPORT ROBUSTO DE dificultad ---
@@ -13,23 +17,8 @@ except ModuleNotFoundError:
 
 ### --- MODIFICACIÓN DE IDIOMA (find_by_stem) --- ###
 def find_by_stem(assets_dir: Path, stem: str) -> Path | None:
-    real_name = config.obtener_nombre(stem)
-    exts = (".png", ".jpg", ".jpeg")
-    
-    for ext in exts:
-        p = assets_dir / f"{real_name}{ext}"
-        if p.exists(): return p
-        
-    cands = []
-    for ext in exts:
-        cands += list(assets_dir.glob(f"{real_name}*{ext}"))
-    
-    # Fallback al stem original
-    if not cands and real_name != stem:
-        for ext in exts:
-            cands += list(assets_dir.glob(f"{stem}*{ext}"))
-            
-    return sorted(cands, key=lambda p: len(p.name))[0] if cands else None
+    # Traducida si existe; si no, la original (tabla armada al arrancar)
+    return asset_variants.localized(assets_dir, stem)
 ### --- FIN MODIFICACIÓN DE IDIOMA --- ###
 
 def load_image(assets_dir: Path, stems: list[str]) -> pygame.Surface | None:
@@ -46,11 +35,7 @@ def scale_to_width(img: pygame.Surface, new_w: int) -> pygame.Surface:
     return pygame.transform.smoothscale(img, (new_w, int(img.get_height()*r)))
 
 def _stop_menu_music():
-    try:
-        if pygame.mixer.get_init():
-            pygame.mixer.music.fadeout(400)
-    except Exception:
-        pass
+    stop_music(400)
 
 # ✨ Nueva función mejorada: zoom al pasar el mouse
 def draw_card(screen, img, rect, mouse, scale_factor=1.10):
@@ -68,10 +53,7 @@ def run(screen: pygame.Surface, assets_dir: Path):
     clock = pygame.time.Clock()
     W, H = screen.get_size()
 
-    background = load_image(assets_dir, ["Background_f"])
-    if background is None: raise FileNotFoundError("Fondo 'Background_f*' no encontrado.")
-    background = pygame.transform.smoothscale(background, (W, H))
-    scroll_x = 0; SCROLL_SPEED = 2
+    backdrop.load(assets_dir, (W, H))
 
     ### --- MODIFICACIÓN DE IDIOMA (STEMS para carga de botones) --- ###
     # Usamos las claves de config.py para que la traducción funcione
@@ -113,15 +95,12 @@ def run(screen: pygame.Surface, assets_dir: Path):
     while True:
         mouse = pygame.mouse.get_pos()
         click = False
-        for e in pygame.event.get():
+        for e in menu_idle.events():
             if e.type == pygame.QUIT: return None
             elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 click = True
 
-        scroll_x -= SCROLL_SPEED
-        if scroll_x <= -W: scroll_x = 0
-        screen.blit(background, (scroll_x, 0))
-        screen.blit(background, (scroll_x + W, 0))
+        backdrop.draw(screen)
 
         screen.blit(title_img, title_rect)
 
@@ -203,4 +182,5 @@ def run(screen: pygame.Surface, assets_dir: Path):
                 return None
 
         pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+        menu_idle.tick(clock)
+        governor.frame(menu_idle.work_ms)
\ No newline at end of file
@@ -0,0 +1,201 @@
+# poisson_disk.py
+# Muestreo Poisson-disk (Bridson) para colocar objetos de los niveles sin que
+# se encimen. Trabaja sobre varias áreas permitidas a la vez, respeta
+# rectángulos de exclusión y garantiza una distancia mínima entre puntos.
+from __future__ import annotations
+import math
+import random
+import pygame
+from typing import Iterable, Optional, Sequence
+
+
+def poisson_disk_points(areas: Sequence[pygame.Rect], min_dist: float, *,
+                        count: Optional[int] = None,
+                        exclude: Iterable[pygame.Rect] = (),
+                        existing: Iterable[tuple[int, int]] = (),
+                        margin: int = 0,
+                        k: int = 30,
+                        seed: Optional[int] = None,
+                        rng: Optional[random.Random] = None) -> list[tuple[int, int]]:
+    """Puntos (x, y) enteros dentro de `areas`, a >= `min_dist` entre sí.
+
+    - exclude: rects donde no puede caer ningún punto (p.ej. hoyos ya puestos).
+    - existing: puntos ya ocupados que también cuentan para la distancia mínima.
+    - margin: distancia mínima al borde de cada área.
+    - count: si se pide, se devuelve una muestra aleatoria de ese tamaño del
+      conjunto máximo; si no caben, se avisa y se devuelven todos los que caben.
+    - seed / rng: reproducibilidad.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    r = float(min_dist)
+    allowed = [pygame.Rect(a).inflate(-2 * margin, -2 * margin) for a in areas]
+    allowed = [a for a in allowed if a.w > 0 and a.h > 0]
+    if not allowed or r <= 0:
+        return []
+
+    cell = r / math.sqrt(2)
+    # Rejilla de fondo (lado r/√2 -> como mucho un punto por celda), con un
+    # borde de 2 celdas: los vecinos nunca se salen y caben los puntos previos.
+    pad = 2 * cell
+    ox = min(a.left for a in allowed) - pad; oy = min(a.top for a in allowed) - pad
+    gw = int(math.ceil((max(a.right for a in allowed) + pad - ox) / cell)) + 1
+    gh = int(math.ceil((max(a.bottom for a in allowed) + pad - oy) / cell)) + 1
+    grid: list[int] = [-1] * (gw * gh)
+    pts: list[tuple[int, int]] = []
+    r2 = r * r
+    exclude = [pygame.Rect(e) for e in exclude]
+
+    # Clasificación por celda: 0 = fuera, 1 = libre entera, 2 = test exacto.
+    # Así casi todos los candidatos se resuelven con una sola lectura.
+    status = bytearray(gw * gh)
+
+    def _cell_span(rect: pygame.Rect):
+        gx0 = int((rect.left - ox) // cell); gx1 = int((rect.right - 1 - ox) // cell)
+        gy0 = int((rect.top - oy) // cell); gy1 = int((rect.bottom - 1 - oy) // cell)
+        return max(0, gx0), min(gw - 1, gx1), max(0, gy0), min(gh - 1, gy1)
+
+    def _cell_rect(gx: int, gy: int) -> tuple[float, float, float, float]:
+        x0 = ox + gx * cell; y0 = oy + gy * cell
+        return x0, y0, x0 + cell, y0 + cell
+
+    for a in allowed:
+        gx0, gx1, gy0, gy1 = _cell_span(a)
+        for gy in range(gy0, gy1 + 1):
+            row = gy * gw
+            for gx in range(gx0, gx1 + 1):
+                if status[row + gx] == 1:
+                    continue
+                x0, y0, x1, y1 = _cell_rect(gx, gy)
+                full = a.left <= x0 and x1 <= a.right and a.top <= y0 and y1 <= a.bottom
+                status[row + gx] = 1 if full else 2
+    for e in exclude:
+        gx0, gx1, gy0, gy1 = _cell_span(e)
+        for gy in range(gy0, gy1 + 1):
+            row = gy * gw
+            for gx in range(gx0, gx1 + 1):
+                if status[row + gx]:
+                    status[row + gx] = 2
+
+    def _inside(x: int, y: int) -> bool:
+        gx = int((x - ox) // cell); gy = int((y - oy) // cell)
+        if not (0 <= gx < gw and 0 <= gy < gh):
+            return False
+        st = status[gy * gw + gx]
+        if st != 2:
+            return st == 1
+        for a in allowed:
+            if a.left <= x < a.right and a.top <= y < a.bottom:
+                break
+        else:
+            return False
+        for e in exclude:
+            if e.left <= x < e.right and e.top <= y < e.bottom:
+                return False
+        return True
+
+    # Vecindario 5x5 sin esquinas (ahí la distancia ya es >= r); la propia celda primero
+    neigh = sorted(((dx, dy) for dx in range(-2, 3) for dy in range(-2, 3)
+                    if abs(dx) + abs(dy) < 4), key=lambda d: abs(d[0]) + abs(d[1]))
+    offsets = [dy * gw + dx for dx, dy in neigh]
+
+    crowded: list[tuple[int, int]] = []
+
+    def _far_enough(x: int, y: int) -> bool:
+        for (px, py) in crowded:
+            if (px - x) * (px - x) + (py - y) * (py - y) < r2:
+                return False
+        base = int((y - oy) // cell) * gw + int((x - ox) // cell)
+        for off in offsets:
+            j = grid[base + off]
+            if j >= 0:
+                px, py = pts[j]
+                if (px - x) * (px - x) + (py - y) * (py - y) < r2:
+                    return False
+        return True
+
+    def _add(x: int, y: int) -> int:
+        idx = len(pts)
+        pts.append((x, y))
+        grid[int((y - oy) // cell) * gw + int((x - ox) // cell)] = idx
+        return idx
+
+    # Puntos previos: ocupan la rejilla pero no se devuelven. Pueden estar más
+    # juntos que r, así que los que caen en una celda ya ocupada van aparte.
+    for (x, y) in existing:
+        x = int(x); y = int(y)
+        gx = int((x - ox) // cell); gy = int((y - oy) // cell)
+        if 0 <= gx < gw and 0 <= gy < gh:
+            if grid[gy * gw + gx] >= 0:
+                crowded.append((x, y))
+            else:
+                _add(x, y)
+    n_existing = len(pts)
+
+    active: list[int] = []
+    # Una semilla por área, así las áreas separadas también se llenan
+    for a in allowed:
+        for _ in range(k):
+            x = rng.randrange(a.left, a.right); y = rng.randrange(a.top, a.bottom)
+            if _inside(x, y) and _far_enough(x, y):
+                active.append(_add(x, y))
+                break
+
+    tau = math.tau
+    while active:
+        i = rng.randrange(len(active))
+        px, py = pts[active[i]]
+        for _ in range(k):
+            ang = rng.random() * tau
+            rad = r * math.sqrt(1.0 + 3.0 * rng.random())   # uniforme en el anillo [r, 2r]
+            # coordenadas enteras ya al probar: la distancia mínima vale para lo que se devuelve
+            x = round(px + rad * math.cos(ang)); y = round(py + rad * math.sin(ang))
+            if _inside(x, y) and _far_enough(x, y):
+                active.append(_add(x, y))
+                break
+        else:
+            active[i] = active[-1]
+            active.pop()
+
+    out = pts[n_existing:]
+    if count is not None:
+        if len(out) < count:
+            print(f"ADVERTENCIA: poisson_disk_points: sólo caben {len(out)} de {count} puntos "
+                  f"con separación {min_dist}.")
+        else:
+            out = rng.sample(out, count)
+    return out
+
+
+# ===== Medición de rendimiento (python poisson_disk.py) =====
+if __name__ == "__main__":
+    import time
+
+    def _legacy(areas, count, rng):
+        # Muestreo por rechazo original de nivel2 (non_overlapping_spawn)
+        pts = []; tries = 0
+        while len(pts) < count and tries < count * 100:
+            tries += 1
+            a = rng.choice(areas)
+            p = (rng.randint(a.left + 8, a.right - 8), rng.randint(a.top + 8, a.bottom - 8))
+            pr = pygame.Rect(0, 0, 36, 36); pr.center = p
+            if any(pr.colliderect(pygame.Rect(x - 18, y - 18, 36, 36)) for (x, y) in pts): continue
+            pts.append(p)
+        return pts
+
+    print("Poisson-disk (Bridson) – puntos/segundo")
+    for side, dist in [(1000, 20), (3000, 20), (6000, 20)]:
+        areas = [pygame.Rect(0, 0, side // 2, side), pygame.Rect(side // 2 + 50, 0, side // 2 - 50, side)]
+        holes = [pygame.Rect(side // 4, side // 4, side // 10, side // 10)]
+        t0 = time.perf_counter()
+        pts = poisson_disk_points(areas, dist, exclude=holes, seed=1)
+        dt = time.perf_counter() - t0
+        print(f"  área {side}x{side}, r={dist}: {len(pts):7d} pts en {dt:6.3f}s -> {len(pts) / dt:9.0f} pts/s")
+
+    print("Rechazo legado vs Poisson (mismo número de puntos, áreas del nivel 2)")
+    areas = [pygame.Rect(80, 380, 150, 80), pygame.Rect(330, 380, 830, 80), pygame.Rect(80, 540, 1000, 140)]
+    for n in (50, 100, 150):
+        rng = random.Random(1)
+        t0 = time.perf_counter(); lp = _legacy(areas, n, rng); tl = time.perf_counter() - t0
+        t0 = time.perf_counter(); pp = poisson_disk_points(areas, 36, count=n, margin=8, seed=1); tp = time.perf_counter() - t0
+        print(f"  pedidos {n:4d}: rechazo {len(lp):4d} pts {tl * 1000:8.2f} ms | poisson {len(pp):4d} pts {tp * 1000:8.2f} ms")
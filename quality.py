@@ -0,0 +1,100 @@
+# quality.py
+# Gobernador de calidad: recorta efectos cosméticos cuando el frame no cabe.
+# Los niveles dibujan glows pulsantes, fades de mensajes, flechas que rebotan,
+# iconos "E" que laten y etiquetas de carga todos los frames, tarde lo que
+# tarde el frame. Aquí cada bucle reporta cuánto trabajo le costó el frame
+# (clock.get_rawtime(): sin la espera de tick) y, si el p90 se acerca al
+# presupuesto, se baja un escalón; con holgura sostenida se vuelve a subir.
+#
+#   escalón 0: todo
+#   escalón 1: sin glows (los blends BLEND_RGBA_MULT por objeto)
+#   escalón 2: + fades/pulsos de alpha como cortes secos
+#   escalón 3: + fondo de los menús estático (sin scroll)
+#   escalón 4: + animaciones a 15 Hz
+from __future__ import annotations
+from collections import deque
+from typing import Optional
+
+TARGET_FPS = 60
+WINDOW = 60            # frames para el p90
+CHECK_EVERY = 30       # frames entre evaluaciones
+DOWN_AT = 0.85         # p90 > 85 % del presupuesto -> bajar
+UP_AT = 0.50           # p90 < 50 % del presupuesto ...
+UP_HOLD = 3.0          # ... durante 3 s seguidos -> subir
+STALL_MS = 250         # cargas/pausas largas no cuentan como presión sostenida
+
+# (nombre, glow, fades, scroll, animación Hz)
+TIERS = (
+    ("completa", True, True, True, 0),
+    ("sin glow", False, True, True, 0),
+    ("cortes secos", False, False, True, 0),
+    ("fondo fijo", False, False, False, 0),
+    ("anim 15 Hz", False, False, False, 15),
+)
+
+
+class QualityGovernor:
+    """Escalones de calidad según el tiempo de trabajo por frame.
+
+    - frame(work_ms): un frame medido (llamar tras clock.tick()).
+    - glow / fades / scroll: qué efectos dibujar en el escalón actual.
+    - anim_time(t): reloj de animación (cuantizado en el último escalón).
+    """
+
+    def __init__(self, fps: int = TARGET_FPS):
+        self.budget_ms = 1000.0 / fps
+        self.tier = 0
+        self.locked: Optional[int] = None
+        self._times: deque[float] = deque(maxlen=WINDOW)
+        self._count = 0
+        self._calm = 0.0          # ms acumulados con holgura
+        self._apply()
+
+    def _apply(self) -> None:
+        _, self.glow, self.fades, self.scroll, self.anim_hz = TIERS[self.tier]
+
+    def lock(self, tier: Optional[int]) -> None:
+        """Fija un escalón (None = automático)."""
+        self.locked = tier
+        if tier is not None:
+            self._set(max(0, min(len(TIERS) - 1, tier)), "fijado")
+
+    def _set(self, tier: int, why: str) -> None:
+        if tier == self.tier:
+            return
+        old = self.tier
+        self.tier = tier
+        self._apply()
+        self._times.clear()
+        self._calm = 0.0
+        print(f"[Calidad] {old} -> {tier} ({TIERS[tier][0]}): {why}")
+
+    def frame(self, work_ms: float) -> None:
+        if work_ms > STALL_MS or self.locked is not None:
+            return
+        self._times.append(work_ms)
+        self._count += 1
+        if self._count % CHECK_EVERY or len(self._times) < WINDOW // 2:
+            return
+        ordered = sorted(self._times)
+        p90 = ordered[int(len(ordered) * 0.9) - 1]
+        mean = sum(ordered) / len(ordered)
+        why = f"p90 {p90:.1f} ms, media {mean:.1f} ms, presupuesto {self.budget_ms:.1f} ms"
+        if p90 > self.budget_ms * DOWN_AT:
+            if self.tier < len(TIERS) - 1:
+                self._set(self.tier + 1, why)
+        elif p90 < self.budget_ms * UP_AT:
+            self._calm += CHECK_EVERY * self.budget_ms
+            if self._calm >= UP_HOLD * 1000 and self.tier > 0:
+                self._set(self.tier - 1, why)
+        else:
+            self._calm = 0.0
+
+    def anim_time(self, t: float) -> float:
+        if not self.anim_hz:
+            return t
+        return int(t * self.anim_hz) / self.anim_hz
+
+
+# Uno para todo el juego: la presión medida en un nivel vale para el menú siguiente
+governor = QualityGovernor()
@@ -1,93 +1,218 @@
+# sacar_coordenadas.py
+# Editor de la geometría de cada escena (parque, calle, plaza).
+# Antes se dibujaban las 4 zonas y el script imprimía pygame.Rect para pegar
+# en nivel3_dificil.py. Ahora guarda zonas, áreas de aparición, el bote y los
+# obstáculos en assets/geometria/<escena>.json y hornea lo derivado para cada
+# preset de display.PRESETS (ver geometria.py): los niveles sólo lo leen.
+#
+#   python sacar_coordenadas.py [escena]            -> editor (escena: parque, calle, plaza)
+#   python sacar_coordenadas.py [escena] --hornear  -> re-hornear sin ventana
+#
+# Si la escena no tiene archivo, se empieza con los valores de levels/definiciones.py.
 import pygame
 import sys
 from pathlib import Path
 
+import geometria
+from display import PRESETS
+from collision import CollisionMap
+from spatial_grid import SpatialGrid
+from levels.definiciones import NIVELES
+from levels.comun import load_image, build_collision
+from levels.recolectar import load_bg_fit, load_bin_image, place_bin
+from levels.plantar import ASSET_STEMS as CALLE_STEMS
+from levels.reparar import BG_ROTO_STEMS, zone_cell
+
 # === CONFIGURACIÓN ===
-NOMBRE_IMAGEN = "original.jpg" 
-# Usamos la resolución de tu juego para que las coordenadas coincidan
-ANCHO_JUEGO = 1280  
-ALTO_JUEGO = 720    
+BASE_DIR = Path(__file__).resolve().parent
+ASSETS = BASE_DIR / "assets"
+# Usamos la resolución del editor para que las coordenadas coincidan
+ANCHO_JUEGO, ALTO_JUEGO = geometria.REF
+ZONAS_DEFAULT = ["TL", "TM", "BL", "BR"]
+
+MODOS = {
+    pygame.K_z: "zonas",
+    pygame.K_a: "spawn",
+    pygame.K_o: "obstaculos",
+    pygame.K_b: "bote",
+}
+COLORES = {
+    "zonas": (0, 255, 0),
+    "spawn": (60, 160, 255),
+    "obstaculos": (255, 0, 255),
+    "bote": (255, 160, 0),
+}
+
+
+def _nivel(escena: str) -> dict:
+    """Primera definición de levels/definiciones.py que usa la escena."""
+    return next(n for n in NIVELES.values() if n.get("geometria") == escena)
+
+
+def escenas() -> list[str]:
+    return sorted({n["geometria"] for n in NIVELES.values() if n.get("geometria")})
+
+
+def fondo(escena: str, W: int, H: int) -> pygame.Surface:
+    """El fondo de la escena tal como lo dibuja el nivel a W x H."""
+    surf = pygame.Surface((W, H))
+    surf.fill((34, 45, 38))
+    if escena == "parque":
+        bg, rect = load_bg_fit(ASSETS, W, H)
+        surf.blit(bg, rect)
+        return surf
+    stems, deep = (CALLE_STEMS["fondo"], False) if escena == "calle" else (BG_ROTO_STEMS, True)
+    img = load_image(ASSETS, stems, deep=deep)
+    if img:
+        surf.blit(pygame.transform.scale(img, (W, H)), (0, 0))
+    return surf
+
+
+def inicial(escena: str) -> dict:
+    """Geometría a REF tomada de levels/definiciones.py (la que usaban los niveles)."""
+    n = _nivel(escena)
+    W, H = geometria.REF
+    datos = {
+        "ref": list(geometria.REF),
+        "zonas": {k: list(r) for k, r in n["zonas"](W, H).items()} if "zonas" in n else {},
+        "spawn": [list(r) for r in n.get("zonas_spawn", ())],
+        "bote": None,
+        "obstaculos": [list(r) for r in n.get("obstaculos", ())],
+    }
+    if n["mecanica"] == "recolectar":
+        datos["bote"] = list(place_bin(load_bin_image(ASSETS, W), W, H).midbottom)
+    return datos
+
+
+def hornear(escena: str, datos: dict) -> dict:
+    """Para cada preset: rects escalados, máscara de colisión como rects y celdas
+    del índice de zonas."""
+    n = _nivel(escena)
+    horneado = {}
+    for size in sorted(set(PRESETS.values())):
+        W, H = size
+        sec = {
+            "zonas": {k: list(geometria.escalar(r, size)) for k, r in datos["zonas"].items()},
+            "spawn": [list(geometria.escalar(r, size)) for r in datos["spawn"]],
+            "obstaculos": [list(geometria.escalar(r, size)) for r in datos["obstaculos"]],
+            "bote": None,
+        }
+        # Máscara del artista + obstáculos (+ el pie del bote), guardada como rects
+        cmap = build_collision(ASSETS, size, dict(n, obstaculos=datos["obstaculos"])) or CollisionMap(size)
+        if datos["bote"]:
+            sec["bote"] = list(geometria.escalar_punto(datos["bote"], size))
+            bin_img = load_bin_image(ASSETS, W)
+            cmap.add_footprint(bin_img, place_bin(bin_img, W, H, {"bote": sec["bote"]}))
+        sec["colision"] = [list(r) for r in cmap.runs()]
+
+        if sec["zonas"]:
+            grid = SpatialGrid(zone_cell(W, H))
+            sec["celdas"] = {"celda": grid.cell,
+                             "zonas": {k: [list(c) for c in grid.cells_for(pygame.Rect(r))]
+                                       for k, r in sec["zonas"].items()}}
+        horneado[geometria.clave(size)] = sec
+    datos = {k: v for k, v in datos.items() if k != "horneado"}
+    return dict(datos, horneado=horneado)
+
+
+def guardar(escena: str, datos: dict) -> None:
+    p = geometria.guardar(ASSETS, escena, hornear(escena, datos))
+    print(f"[INFO] Geometría de '{escena}' guardada y horneada en {p.relative_to(BASE_DIR)} "
+          f"({', '.join(geometria.clave(s) for s in sorted(set(PRESETS.values())))})")
+
+
+def _datos(escena: str) -> dict:
+    datos = geometria.cargar(ASSETS, escena)
+    if datos is None:
+        print(f"[INFO] '{escena}' sin archivo de geometría: se parte de levels/definiciones.py")
+        return inicial(escena)
+    return datos
+
+
+def _rect_alpha(screen: pygame.Surface, rect: pygame.Rect, color, alpha: int = 80, borde: int = 3):
+    s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+    s.fill((*color, alpha))
+    screen.blit(s, rect.topleft)
+    pygame.draw.rect(screen, color, rect, borde)
+
 
-def run():
+def run(escena: str = "plaza"):
     pygame.init()
-    BASE_DIR = Path(__file__).resolve().parent
-    ASSETS = BASE_DIR / "assets"
-    
-    img_path = None
-    for ext in [".jpg", ".png", ".jpeg"]:
-        p = ASSETS / f"{Path(NOMBRE_IMAGEN).stem}{ext}"
-        if p.exists():
-            img_path = p
-            break
-    
-    if not img_path:
-        print(f"ERROR: No encontré '{NOMBRE_IMAGEN}' en assets.")
-        return
-
-    # Cargar y ESCALAR la imagen al tamaño del juego
-    bg_raw = pygame.image.load(str(img_path))
-    bg = pygame.transform.smoothscale(bg_raw, (ANCHO_JUEGO, ALTO_JUEGO))
-    
-    # === MODO PANTALLA COMPLETA ===
-    # Esto forzará a que se vea en toda tu pantalla
     screen = pygame.display.set_mode((ANCHO_JUEGO, ALTO_JUEGO), pygame.FULLSCREEN)
-    pygame.display.set_caption("DIBUJA LAS 4 ZONAS (Espacio: Guardar, R: Reiniciar, ESC: Salir)")
-    
-    zones = []
-    zone_names = [
-        "1. Arriba Izquierda (TL)", 
-        "2. Arriba Medio (TM)", 
-        "3. Abajo Izquierda (BL)", 
-        "4. Abajo Derecha (BR)"
-    ]
-    current_idx = 0
-    
+    pygame.display.set_caption("GEOMETRÍA (Z/A/O/B: modo, Espacio: guardar rect, G: guardar archivo, ESC: salir)")
+
+    datos = _datos(escena)
+    bg = fondo(escena, ANCHO_JUEGO, ALTO_JUEGO)
+    bin_img = load_bin_image(ASSETS, ANCHO_JUEGO) if datos["bote"] is not None else None
+    nombres_zonas = list(datos["zonas"]) or ZONAS_DEFAULT
+    zona_idx = 0
+    modo = "zonas" if _nivel(escena)["mecanica"] == "reparar" else "obstaculos"
+    cambios = False
+
     start_pos = None
     current_rect = None
-    font = pygame.font.SysFont("arial", 24, bold=True)
-    font_big = pygame.font.SysFont("arial", 40, bold=True)
+    font = pygame.font.SysFont("arial", 20, bold=True)
+    font_big = pygame.font.SysFont("arial", 32, bold=True)
 
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-            
+
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
+                    if cambios:
+                        print("Advertencia: se salió sin guardar (G guarda)")
                     running = False
-                
-                if event.key == pygame.K_SPACE:
-                    if current_rect:
-                        zones.append(current_rect)
-                        print(f"Guardada: {zone_names[current_idx]}")
-                        current_idx += 1
-                        start_pos = None
-                        current_rect = None
-                        
-                        if current_idx >= len(zone_names):
-                            print("\n" + "="*50)
-                            print("¡COPIA Y PEGA ESTO EN TU NIVEL3_DIFICIL.PY!")
-                            print("="*50)
-                            print("    # Zonas Personalizadas (Generadas)")
-                            print("    zones = {")
-                            print(f"        'TL': pygame.Rect{zones[0]},")
-                            print(f"        'TM': pygame.Rect{zones[1]},")
-                            print(f"        'BL': pygame.Rect{zones[2]},")
-                            print(f"        'BR': pygame.Rect{zones[3]}")
-                            print("    }")
-                            print("="*50)
-                            running = False
-                            
-                if event.key == pygame.K_r:
+
+                elif event.key in MODOS:
+                    modo = MODOS[event.key]
+                    if modo == "bote" and bin_img is None:
+                        bin_img = load_bin_image(ASSETS, ANCHO_JUEGO)
+                    start_pos = current_rect = None
+
+                elif event.key == pygame.K_TAB and modo == "zonas":
+                    zona_idx = (zona_idx + 1) % len(nombres_zonas)
+
+                elif event.key == pygame.K_SPACE and current_rect:
+                    if modo == "zonas":
+                        datos["zonas"][nombres_zonas[zona_idx]] = list(current_rect)
+                        print(f"Guardada: zona {nombres_zonas[zona_idx]} {tuple(current_rect)}")
+                        zona_idx = (zona_idx + 1) % len(nombres_zonas)
+                    elif modo in ("spawn", "obstaculos"):
+                        datos[modo].append(list(current_rect))
+                        print(f"Guardado: {modo} {tuple(current_rect)}")
+                    start_pos = current_rect = None
+                    cambios = True
+
+                elif event.key == pygame.K_BACKSPACE:
+                    if modo == "zonas":
+                        datos["zonas"].pop(nombres_zonas[zona_idx], None)
+                    elif modo == "bote":
+                        datos["bote"] = None
+                    elif datos[modo]:
+                        datos[modo].pop()
+                    cambios = True
+
+                elif event.key == pygame.K_r:
                     start_pos = None
                     current_rect = None
 
+                elif event.key == pygame.K_g:
+                    guardar(escena, datos)
+                    cambios = False
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1: # Clic izquierdo
-                    start_pos = event.pos
-                    current_rect = None
-                
+                    if modo == "bote":
+                        # El punto es el pie del sprite (midbottom), como lo coloca el nivel
+                        datos["bote"] = list(event.pos)
+                        cambios = True
+                    else:
+                        start_pos = event.pos
+                        current_rect = None
+
             elif event.type == pygame.MOUSEMOTION:
                 if start_pos and pygame.mouse.get_pressed()[0]:
                     x = min(start_pos[0], event.pos[0])
@@ -96,37 +221,55 @@ def run():
                     h = abs(start_pos[1] - event.pos[1])
                     current_rect = pygame.Rect(x, y, w, h)
 
-        screen.blit(bg, (0,0))
-        
-        # Zonas guardadas (Verde)
-        for z in zones:
-            s = pygame.Surface((z.width, z.height), pygame.SRCALPHA)
-            s.fill((0, 255, 0, 80))
-            screen.blit(s, z.topleft)
-            pygame.draw.rect(screen, (0, 255, 0), z, 3)
+        screen.blit(bg, (0, 0))
+
+        for r in datos["obstaculos"]:
+            _rect_alpha(screen, pygame.Rect(r), COLORES["obstaculos"], 90, 1)
+        for r in datos["spawn"]:
+            _rect_alpha(screen, pygame.Rect(r), COLORES["spawn"], 60, 2)
+        for k, r in datos["zonas"].items():
+            sel = modo == "zonas" and k == nombres_zonas[zona_idx]
+            _rect_alpha(screen, pygame.Rect(r), COLORES["zonas"], 80, 5 if sel else 2)
+            screen.blit(font.render(k, True, (255, 255, 255)), (r[0] + 8, r[1] + 8))
+        if bin_img is not None:
+            punto = pygame.mouse.get_pos() if modo == "bote" else datos["bote"]
+            if punto:
+                screen.blit(bin_img, bin_img.get_rect(midbottom=punto))
+                pygame.draw.circle(screen, COLORES["bote"], punto, 5)
 
         # Zona actual (Amarillo)
         if current_rect:
-            s = pygame.Surface((current_rect.width, current_rect.height), pygame.SRCALPHA)
-            s.fill((255, 255, 0, 80))
-            screen.blit(s, current_rect.topleft)
-            pygame.draw.rect(screen, (255, 255, 0), current_rect, 3)
+            _rect_alpha(screen, current_rect, (255, 255, 0))
 
         # HUD
-        if current_idx < len(zone_names):
-            # Fondo negro semitransparente para el texto
-            pygame.draw.rect(screen, (0,0,0,180), (0, 0, ANCHO_JUEGO, 60))
-            
-            msg = f"DIBUJA: {zone_names[current_idx]}"
-            txt = font_big.render(msg, True, (255, 255, 0))
-            screen.blit(txt, (20, 10))
-            
-            instr = font.render("Arrastra mouse | Espacio: Guardar | R: Reintentar | ESC: Salir", True, (255, 255, 255))
-            screen.blit(instr, (ANCHO_JUEGO - instr.get_width() - 20, 15))
+        pygame.draw.rect(screen, (0, 0, 0), (0, 0, ANCHO_JUEGO, 60))
+        objetivo = f"zona {nombres_zonas[zona_idx]}" if modo == "zonas" else modo
+        msg = f"{escena.upper()} - {objetivo}" + (" *" if cambios else "")
+        screen.blit(font_big.render(msg, True, COLORES[modo]), (20, 12))
+        instr = font.render("Z/A/O/B modo | Tab zona | Arrastra + Espacio | Retroceso borra | G guarda | ESC",
+                            True, (255, 255, 255))
+        screen.blit(instr, (ANCHO_JUEGO - instr.get_width() - 20, 20))
 
         pygame.display.flip()
 
     pygame.quit()
 
+
+def rehornear(escena: str):
+    """Hornea sin abrir el editor (p.ej. tras cambiar un fondo o agregar un preset)."""
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    guardar(escena, _datos(escena))
+    pygame.quit()
+
+
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    escena = args[0] if args else "plaza"
+    if escena not in escenas():
+        print(f"ERROR: escena '{escena}' desconocida; usa una de: {', '.join(escenas())}")
+        sys.exit(1)
+    if "--hornear" in sys.argv:
+        rehornear(escena)
+    else:
+        run(escena)
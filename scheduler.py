@@ -0,0 +1,147 @@
+# scheduler.py
+# Temporizadores y tweens compartidos por los niveles.
+# Cada nivel tenía sus propios contadores (message_timer, check_timer,
+# victory_timer...) que se restaban a mano cada frame. Aquí los plazos viven en
+# un min-heap: update() sólo atiende lo que vence en este frame, y el valor de
+# un tween (alpha de un fade, barra de progreso) se calcula al leerlo, con la
+# curva de easing ya tabulada. Pausar el Scheduler congela todo a la vez.
+from __future__ import annotations
+import heapq
+import math
+from typing import Any, Callable, Optional
+
+# ---------- Easing (tablas precalculadas) ----------
+EASE_SAMPLES = 256
+
+_EASE_FUNCS: dict[str, Callable[[float], float]] = {
+    "linear": lambda p: p,
+    "in_quad": lambda p: p * p,
+    "out_quad": lambda p: 1 - (1 - p) * (1 - p),
+    "out_cubic": lambda p: 1 - (1 - p) ** 3,
+    "in_out_sine": lambda p: 0.5 - 0.5 * math.cos(math.pi * p),
+}
+EASE_LUT: dict[str, list[float]] = {
+    name: [f(i / (EASE_SAMPLES - 1)) for i in range(EASE_SAMPLES)]
+    for name, f in _EASE_FUNCS.items()
+}
+
+
+class Tween:
+    """Un plazo del Scheduler. Sin valores es un temporizador simple; con
+    v0/v1 su `value` va de v0 a v1 siguiendo la curva de easing."""
+    __slots__ = ("_sched", "start", "duration", "deadline", "v0", "v1", "_lut",
+                 "callback", "args", "_gen", "_running")
+
+    def __init__(self, sched: "Scheduler", duration: float, v0: float, v1: float,
+                 ease: str, callback: Optional[Callable[..., Any]], args: tuple):
+        self._sched = sched
+        self.duration = max(0.0, float(duration))
+        self.v0, self.v1 = v0, v1
+        self._lut = EASE_LUT[ease]
+        self.callback = callback
+        self.args = args
+        self._gen = 0
+        self._running = False
+        self.start = self.deadline = sched.now
+
+    # ---------- estado ----------
+    @property
+    def active(self) -> bool:
+        return self._running
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - self._sched.now) if self._running else 0.0
+
+    @property
+    def progress(self) -> float:
+        if not self._running or self.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (self._sched.now - self.start) / self.duration))
+
+    @property
+    def value(self) -> float:
+        lut = self._lut
+        return self.v0 + (self.v1 - self.v0) * lut[int(self.progress * (EASE_SAMPLES - 1))]
+
+    # ---------- control ----------
+    def restart(self, duration: Optional[float] = None) -> "Tween":
+        """(Re)arranca desde ahora; la entrada vieja del heap queda descartada."""
+        if duration is not None:
+            self.duration = max(0.0, float(duration))
+        self._sched._push(self)
+        return self
+
+    def stop(self) -> None:
+        """Detiene sin llamar al callback (queda inactivo, value = v1)."""
+        self._gen += 1
+        self._running = False
+
+
+class Scheduler:
+    """Reloj propio + min-heap de plazos.
+
+    - after(delay, fn, *args): llama a fn cuando pasen `delay` segundos.
+    - tween(duration, v0, v1, ease, on_done): valor animado; start=False lo deja listo sin arrancar.
+    - update(dt): avanza el reloj (si no está en pausa) y dispara sólo lo vencido.
+    - paused: congela reloj, tweens y callbacks juntos.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.paused = False
+        self._heap: list[tuple[float, int, int, Tween]] = []
+        self._seq = 0
+
+    def _push(self, tw: Tween) -> None:
+        tw._gen += 1
+        tw._running = True
+        tw.start = self.now
+        tw.deadline = self.now + tw.duration
+        self._seq += 1
+        heapq.heappush(self._heap, (tw.deadline, self._seq, tw._gen, tw))
+
+    def after(self, delay: float, callback: Callable[..., Any], *args) -> Tween:
+        tw = Tween(self, delay, 0.0, 0.0, "linear", callback, args)
+        self._push(tw)
+        return tw
+
+    def tween(self, duration: float, v0: float = 1.0, v1: float = 0.0, ease: str = "linear",
+              on_done: Optional[Callable[..., Any]] = None, *args, start: bool = True) -> Tween:
+        tw = Tween(self, duration, v0, v1, ease, on_done, args)
+        if start:
+            self._push(tw)
+        return tw
+
+    def update(self, dt: float) -> int:
+        """Avanza `dt` segundos y ejecuta los plazos vencidos. Devuelve cuántos."""
+        if self.paused:
+            return 0
+        self.now += dt
+        heap = self._heap
+        fired = 0
+        while heap and heap[0][0] <= self.now:
+            _, _, gen, tw = heapq.heappop(heap)
+            if gen != tw._gen or not tw._running:
+                continue   # reiniciado o detenido después de programarse
+            tw._running = False
+            fired += 1
+            if tw.callback is not None:
+                tw.callback(*tw.args)
+        return fired
+
+    def pause(self) -> None:
+        self.paused = True
+
+    def resume(self) -> None:
+        self.paused = False
+
+    def clear(self) -> None:
+        """Detiene todo lo programado (p.ej. al reiniciar el nivel)."""
+        for _, _, gen, tw in self._heap:
+            if gen == tw._gen:
+                tw.stop()
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, gen, tw in self._heap if gen == tw._gen and tw._running)
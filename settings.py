@@ -0,0 +1,154 @@
+# settings.py
+# Preferencias del jugador en un solo lugar (settings.json junto a main.py).
+# Se leen del disco una vez; después get() es sólo memoria. set() avisa a los
+# suscriptores únicamente si el valor cambió de verdad, y la escritura se
+# agrupa (debounce) y es atómica: archivo temporal + os.replace, así un cierre
+# a mitad nunca deja el JSON roto.
+# Los archivos viejos (volume.txt, lang.txt) se migran la primera vez.
+from __future__ import annotations
+import atexit
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+SETTINGS_VERSION = 1
+SAVE_DELAY = 0.5          # s sin cambios antes de escribir
+DEFAULTS: dict[str, Any] = {"volume": 0.7, "lang": "es", "audio_profile": "low_latency",
+                            "display_preset": "768p", "fullscreen": False, "scale_mode": "smooth"}
+
+
+def _clean(key: str, value: Any) -> Any:
+    """Normaliza valores conocidos; lo demás pasa tal cual."""
+    if key == "volume":
+        return max(0.0, min(1.0, float(value)))
+    if key == "lang":
+        return "en" if str(value).strip().lower() in ("en", "us") else "es"
+    return value
+
+
+class Settings:
+    """Preferencias en memoria con persistencia diferida.
+
+    - get(key): lectura desde memoria.
+    - set(key, value): guarda y notifica sólo si cambió; programa la escritura.
+    - subscribe(key, fn): fn(valor) en cada cambio real de `key`.
+    - flush(): escribe ya si hay cambios pendientes (también al salir).
+    """
+
+    def __init__(self, path: Path, legacy_dir: Path | None = None):
+        self.path = Path(path)
+        self._legacy_dir = Path(legacy_dir) if legacy_dir else self.path.parent
+        self._data: dict[str, Any] = dict(DEFAULTS)
+        self._subs: dict[str, list[Callable[[Any], None]]] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+        self._load()
+        atexit.register(self.flush)
+
+    # ---------- lectura / escritura en memoria ----------
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> bool:
+        value = _clean(key, value)
+        with self._lock:
+            if self._data.get(key) == value:
+                return False
+            self._data[key] = value
+            self._dirty = True
+            self._schedule_save()
+        for fn in self._subs.get(key, ()):
+            try:
+                fn(value)
+            except Exception as e:
+                print(f"⚠️ Ajuste '{key}': {e}")
+        return True
+
+    def subscribe(self, key: str, fn: Callable[[Any], None]) -> None:
+        self._subs.setdefault(key, []).append(fn)
+
+    # ---------- disco ----------
+    def _load(self) -> None:
+        raw: dict[str, Any] = {}
+        try:
+            if self.path.exists():
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ {self.path.name} ilegible, se usan valores por defecto: {e}")
+        for k, v in raw.items():
+            try:
+                self._data[k] = _clean(k, v)
+            except (TypeError, ValueError):
+                pass
+        if raw.get("version") != SETTINGS_VERSION:
+            self._migrate()
+
+    def _migrate(self) -> None:
+        """volume.txt / lang.txt eran la fuente real; pasan a settings.json."""
+        legacy = {"volume": self._legacy_dir / "volume.txt", "lang": self._legacy_dir / "lang.txt"}
+        for key, p in legacy.items():
+            try:
+                if p.exists():
+                    self._data[key] = _clean(key, p.read_text(encoding="utf-8").strip())
+            except (OSError, ValueError):
+                pass
+        self._data["version"] = SETTINGS_VERSION
+        self._dirty = True
+        if self.flush():
+            for p in legacy.values():
+                try:
+                    p.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def _schedule_save(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(SAVE_DELAY, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Escribe settings.json si hay cambios. True si quedó en disco."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            data = dict(self._data)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=self.path.name, suffix=".tmp", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            return True
+        except OSError as e:
+            with self._lock:
+                self._dirty = True
+            print(f"⚠️ No se pudo guardar {self.path.name}: {e}")
+            return False
+
+
+_instances: dict[Path, Settings] = {}
+
+
+def get_settings(assets_dir: Path) -> Settings:
+    """El servicio de ajustes del juego (uno por carpeta, creado al primer uso)."""
+    path = (Path(assets_dir).parent / "settings.json").resolve()
+    s = _instances.get(path)
+    if s is None:
+        s = _instances[path] = Settings(path)
+    return s
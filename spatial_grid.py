@@ -0,0 +1,160 @@
+# spatial_grid.py
+# Índice espacial uniforme (spatial hash) compartido por los niveles.
+# Cada objeto interactuable se registra con su rect; la rejilla lo guarda en
+# todas las celdas que toca, así las consultas de cercanía sólo revisan las
+# celdas alrededor del jugador en vez de recorrer toda la lista.
+from __future__ import annotations
+import pygame
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+Cell = tuple[int, int]
+
+
+class SpatialGrid:
+    """Rejilla de celdas cuadradas de `cell_size` px.
+
+    - insert / remove / move: mantener el índice al recoger, entregar o plantar.
+    - nearest(pos, radius): el item más cercano (centro a centro) dentro del radio.
+    - query_rect(rect): items cuyo rect se solapa con `rect`.
+    Las consultas devuelven los items en orden de inserción (determinista).
+    """
+
+    def __init__(self, cell_size: int):
+        self.cell = max(1, int(cell_size))
+        self._cells: dict[Cell, set[Hashable]] = {}
+        # item -> (rect, celdas, orden de inserción)
+        self._items: dict[Hashable, tuple[pygame.Rect, tuple[Cell, ...], int]] = {}
+        self._seq = 0
+
+    # ---------- celdas ----------
+    def cells_for(self, rect: pygame.Rect) -> tuple[Cell, ...]:
+        c = self.cell
+        x0, y0 = rect.left // c, rect.top // c
+        # right/bottom son exclusivos en pygame.Rect
+        x1 = (rect.right - 1) // c if rect.w > 0 else x0
+        y1 = (rect.bottom - 1) // c if rect.h > 0 else y0
+        return tuple((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+
+    # ---------- mantenimiento ----------
+    def insert(self, item: Hashable, rect: pygame.Rect, cells: Optional[tuple[Cell, ...]] = None) -> None:
+        """`cells`: celdas ya calculadas con cells_for() (geometría horneada) para no recalcularlas."""
+        if item in self._items:
+            self.move(item, rect)
+            return
+        r = pygame.Rect(rect)
+        cells = tuple(map(tuple, cells)) if cells is not None else self.cells_for(r)
+        for key in cells:
+            self._cells.setdefault(key, set()).add(item)
+        self._items[item] = (r, cells, self._seq)
+        self._seq += 1
+
+    def remove(self, item: Hashable) -> None:
+        entry = self._items.pop(item, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.discard(item)
+                if not bucket:
+                    del self._cells[key]
+
+    def move(self, item: Hashable, rect: pygame.Rect) -> None:
+        entry = self._items.get(item)
+        if entry is None:
+            self.insert(item, rect)
+            return
+        r = pygame.Rect(rect)
+        old_cells, seq = entry[1], entry[2]
+        new_cells = self.cells_for(r)
+        if new_cells != old_cells:
+            for key in old_cells:
+                bucket = self._cells.get(key)
+                if bucket is not None:
+                    bucket.discard(item)
+                    if not bucket:
+                        del self._cells[key]
+            for key in new_cells:
+                self._cells.setdefault(key, set()).add(item)
+        self._items[item] = (r, new_cells, seq)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._items.clear()
+        self._seq = 0
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+
+    def rect_of(self, item: Hashable) -> Optional[pygame.Rect]:
+        entry = self._items.get(item)
+        return entry[0] if entry else None
+
+    # ---------- consultas ----------
+    def _candidates(self, x0: int, y0: int, x1: int, y1: int) -> set[Hashable]:
+        c = self.cell
+        cells = self._cells
+        found: set[Hashable] = set()
+        for cx in range(x0 // c, x1 // c + 1):
+            for cy in range(y0 // c, y1 // c + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def broad_phase(self, rect: pygame.Rect) -> set[Any]:
+        """Items de las celdas que toca `rect`, sin test exacto ni orden (culling de vista)."""
+        r = pygame.Rect(rect)
+        return self._candidates(r.left, r.top, r.right - 1, r.bottom - 1)
+
+    def _ordered(self, items) -> list[Any]:
+        return sorted(items, key=lambda it: self._items[it][2])
+
+    def query_rect(self, rect: pygame.Rect,
+                   predicate: Optional[Callable[[Any], bool]] = None) -> list[Any]:
+        """Items cuyo rect se solapa con `rect`."""
+        r = pygame.Rect(rect)
+        cand = self._candidates(r.left, r.top, r.right - 1, r.bottom - 1)
+        hits = [it for it in cand
+                if r.colliderect(self._items[it][0]) and (predicate is None or predicate(it))]
+        return self._ordered(hits) if len(hits) > 1 else hits
+
+    def query_radius(self, pos: tuple[int, int], radius: float,
+                     predicate: Optional[Callable[[Any], bool]] = None) -> list[Any]:
+        """Items cuyo centro está a <= radius de `pos`."""
+        px, py = pos
+        rad = int(radius) + 1
+        r2 = radius * radius
+        cand = self._candidates(int(px) - rad, int(py) - rad, int(px) + rad, int(py) + rad)
+        hits = []
+        for it in cand:
+            cx, cy = self._items[it][0].center
+            if (cx - px) ** 2 + (cy - py) ** 2 <= r2 and (predicate is None or predicate(it)):
+                hits.append(it)
+        return self._ordered(hits) if len(hits) > 1 else hits
+
+    def nearest(self, pos: tuple[int, int], radius: float,
+                predicate: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """El item más cercano (centro a centro) a `pos` dentro de `radius`, o None."""
+        px, py = pos
+        rad = int(radius) + 1
+        best = None
+        best_d2 = radius * radius
+        best_seq = -1
+        items = self._items
+        for it in self._candidates(int(px) - rad, int(py) - rad, int(px) + rad, int(py) + rad):
+            r, _, seq = items[it]
+            cx, cy = r.center
+            d2 = (cx - px) ** 2 + (cy - py) ** 2
+            # empate -> el insertado antes (igual que recorrer la lista en orden)
+            if d2 < best_d2 or (d2 == best_d2 and (best is None or seq < best_seq)):
+                if predicate is not None and not predicate(it):
+                    continue
+                best, best_d2, best_seq = it, d2, seq
+        return best
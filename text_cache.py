@@ -0,0 +1,50 @@
+# text_cache.py
+# Textos ya rasterizados, compartidos por todas las pantallas.
+# font.render() cuesta mucho más que un blit y el HUD repite las mismas
+# cadenas cada frame; aquí se renderiza una vez por (fuente, texto, color) y
+# después es una búsqueda en un dict. cambiar_idioma() vacía el caché.
+#
+# Las Surfaces devueltas son compartidas: no modificarlas (set_alpha, fill...);
+# si hace falta, usar .copy().
+from __future__ import annotations
+import weakref
+import pygame
+import config
+
+MAX_PER_FONT = 256   # textos distintos por fuente antes de vaciar (contadores, reloj...)
+
+# Por fuente y con referencia débil: al salir del nivel sus fuentes (y sus textos) se liberan
+_cache: "weakref.WeakKeyDictionary[pygame.font.Font, dict]" = weakref.WeakKeyDictionary()
+
+
+def render_text(font: pygame.font.Font, texto: str, color, antialias: bool = True) -> pygame.Surface:
+    """font.render() con caché."""
+    por_fuente = _cache.get(font)
+    if por_fuente is None:
+        por_fuente = _cache[font] = {}
+    key = (texto, tuple(color), antialias)
+    surf = por_fuente.get(key)
+    if surf is None:
+        if len(por_fuente) >= MAX_PER_FONT:
+            por_fuente.clear()
+        surf = por_fuente[key] = font.render(texto, antialias, color)
+    return surf
+
+
+def tr_text(font: pygame.font.Font, clave: str, color, antialias: bool = True) -> pygame.Surface:
+    """Texto traducido (clave de config.TRADUCCIONES) ya renderizado."""
+    return render_text(font, config.obtener_nombre(clave), color, antialias)
+
+
+def precargar(font: pygame.font.Font, claves, *colores) -> None:
+    """Renderiza de antemano textos fijos de la UI (al cargar la pantalla)."""
+    for clave in claves:
+        for color in colores:
+            tr_text(font, clave, color)
+
+
+def limpiar() -> None:
+    _cache.clear()
+
+
+config.registrar_cache_idioma(limpiar)
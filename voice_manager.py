@@ -0,0 +1,121 @@
+# voice_manager.py
+# Reparto de canales del mixer para los SFX.
+# Sound.play() toma cualquier canal libre y, si no hay, el sonido nuevo se
+# pierde mientras los viejos terminan. Aquí cada categoría (ui, juego,
+# ambiente) tiene su propio grupo fijo de canales: una ráfaga de recogidas no
+# puede callar los clics del menú, y cuando un grupo está lleno se "roba" la
+# voz menos importante (la más vieja o la más baja) en vez de descartar la nueva.
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Optional
+import pygame
+
+STEAL_WINDOW = 1.0   # s para calcular robos por segundo
+
+
+class _Pool:
+    __slots__ = ("name", "channels", "volume", "started", "priority", "gain", "steals", "drops")
+
+    def __init__(self, name: str, channels: list[pygame.mixer.Channel], volume: float):
+        n = len(channels)
+        self.name = name
+        self.channels = channels
+        self.volume = volume
+        self.started = [0.0] * n      # cuándo empezó la voz de cada canal
+        self.priority = [0] * n
+        self.gain = [0.0] * n         # volumen pedido por play() (antes del de la categoría)
+        self.steals: deque[float] = deque()
+        self.drops = 0
+
+
+class VoiceManager:
+    """Grupos de canales por categoría con prioridades y robo de voces.
+
+    pools: {"ui": (canales, volumen), ...}. Los canales se numeran desde
+    `first_channel`; quien crea el manager debe reservarlos en el mixer.
+
+    - play(sound, category, priority, volume, steal): devuelve el Channel o None.
+    - set_category_volume(category, v): aplica en caliente a lo que suena.
+    - stats(): voces en uso, robos por segundo y descartes por categoría.
+    """
+
+    def __init__(self, pools: dict[str, tuple[int, float]], first_channel: int = 0):
+        self.first_channel = first_channel
+        self.layout = pools
+        self.channel_count = sum(n for n, _ in pools.values())
+        self._pools: dict[str, _Pool] = {}
+
+    def bind(self) -> None:
+        """Crea los Channel (el mixer ya debe estar iniciado y con canales suficientes)."""
+        i = self.first_channel
+        for name, (n, vol) in self.layout.items():
+            self._pools[name] = _Pool(name, [pygame.mixer.Channel(i + k) for k in range(n)], vol)
+            i += n
+
+    @property
+    def bound(self) -> bool:
+        return bool(self._pools)
+
+    def _pick(self, pool: _Pool, priority: int, steal: str) -> tuple[int, bool]:
+        """Índice del canal a usar y si es un robo; -1 si no hay ninguno posible."""
+        victim, best = -1, None
+        for i, ch in enumerate(pool.channels):
+            if not ch.get_busy():
+                return i, False
+            if pool.priority[i] > priority:
+                continue          # nunca se roba a una voz más importante
+            # menor clave = mejor víctima: primero la de menor prioridad
+            key = (pool.priority[i], pool.started[i] if steal == "oldest" else ch.get_volume())
+            if best is None or key < best:
+                victim, best = i, key
+        return victim, victim >= 0
+
+    def play(self, sound: pygame.mixer.Sound, category: str = "game", priority: int = 1,
+             volume: float = 1.0, steal: str = "oldest") -> Optional[pygame.mixer.Channel]:
+        pool = self._pools.get(category)
+        if pool is None:
+            return None
+        i, stolen = self._pick(pool, priority, steal)
+        now = time.perf_counter()
+        if i < 0:
+            pool.drops += 1
+            return None
+        if stolen:
+            pool.steals.append(now)
+        ch = pool.channels[i]
+        ch.play(sound)
+        ch.set_volume(pool.volume * volume)
+        pool.started[i] = now
+        pool.priority[i] = priority
+        pool.gain[i] = volume
+        return ch
+
+    def set_category_volume(self, category: str, v: float) -> None:
+        pool = self._pools.get(category)
+        if pool is None:
+            return
+        pool.volume = max(0.0, min(1.0, float(v)))
+        for i, ch in enumerate(pool.channels):
+            if ch.get_busy():
+                ch.set_volume(pool.volume * pool.gain[i])
+
+    def stop(self, category: Optional[str] = None) -> None:
+        for pool in self._pools.values():
+            if category is None or pool.name == category:
+                for ch in pool.channels:
+                    ch.stop()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        now = time.perf_counter()
+        out = {}
+        for pool in self._pools.values():
+            while pool.steals and now - pool.steals[0] > STEAL_WINDOW:
+                pool.steals.popleft()
+            out[pool.name] = {
+                "en_uso": sum(1 for ch in pool.channels if ch.get_busy()),
+                "canales": len(pool.channels),
+                "robos_s": len(pool.steals) / STEAL_WINDOW,
+                "descartes": pool.drops,
+            }
+        return out